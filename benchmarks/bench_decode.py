@@ -0,0 +1,285 @@
+"""
+Microbenchmarks for the decode and concat hot path of `fetch.fetch()`.
+
+The benchmarks isolate the CPU and memory side of fetching a product from
+network effects. Synthetic parquet files are generated in memory for a grid
+of widths, row counts and compression codecs, and the following stages are
+measured for every case:
+
+- **read_parquet**: `pd.read_parquet` on a `BytesIO` buffer, per file.
+- **concat**: `pd.concat` over the decoded frames.
+- **to_dict**: the `to_dict(orient="records")` path used by
+  `StoaClient.fetch(format="json")`.
+- **fetch**: the end-to-end `fetch.fetch()` call with `fetch_url` patched to
+  return the in-memory buffers.
+
+Each stage records the best wall time over a number of repeats and the peak
+traced memory of a single run. Results are appended as JSON lines to a history
+file together with the git revision, so before/after numbers of a change to the
+decode path can be compared over time.
+
+**Example usage**::
+
+    python benchmarks/bench_decode.py
+    python benchmarks/bench_decode.py --rows 10000 100000 --files 8 --repeat 5
+    python benchmarks/bench_decode.py --compare benchmarks/history.jsonl
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from io import BytesIO
+from itertools import product
+from typing import Callable, Dict, List, Tuple
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+try:
+    from ds_stoa.fetch import _fetch
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+    from ds_stoa.fetch import _fetch
+
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(__file__), "history.jsonl")
+
+
+def synthetic_frame(rows: int, width: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Build a synthetic DataFrame with a realistic mix of column types.
+
+    Columns cycle through int64, float64, low-cardinality string,
+    high-cardinality string and timestamp types.
+
+    :param rows: Number of rows.
+    :param width: Number of columns.
+    :param seed: Seed for the random generator.
+    :return: The synthetic DataFrame.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for i in range(width):
+        kind = i % 5
+        name = f"c{i}"
+        if kind == 0:
+            columns[name] = rng.integers(0, 1_000_000, rows)
+        elif kind == 1:
+            columns[name] = rng.random(rows)
+        elif kind == 2:
+            columns[name] = rng.choice(["alpha", "beta", "gamma", "delta"], rows)
+        elif kind == 3:
+            columns[name] = rng.integers(0, rows or 1, rows).astype(str)
+        else:
+            columns[name] = pd.Timestamp("2024-01-01") + pd.to_timedelta(
+                rng.integers(0, 86_400 * 365, rows), unit="s"
+            )
+    return pd.DataFrame(columns)
+
+
+def synthetic_files(
+    files: int,
+    rows: int,
+    width: int,
+    compression: str,
+) -> List[bytes]:
+    """
+    Encode synthetic frames as parquet files.
+
+    :param files: Number of files to generate.
+    :param rows: Number of rows per file.
+    :param width: Number of columns per file.
+    :param compression: Parquet compression codec.
+    :return: List of encoded parquet files.
+    """
+    payloads = []
+    for seed in range(files):
+        buffer = BytesIO()
+        synthetic_frame(rows, width, seed).to_parquet(
+            buffer, index=False, compression=compression
+        )
+        payloads.append(buffer.getvalue())
+    return payloads
+
+
+def measure(func: Callable[[], object], repeat: int) -> Tuple[float, int]:
+    """
+    Measure the best wall time and the peak traced memory of a callable.
+
+    :param func: The callable to measure.
+    :param repeat: Number of timed repeats.
+    :return: Tuple of best wall time in seconds and peak memory in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best, peak
+
+
+def run_case(
+    files: int,
+    rows: int,
+    width: int,
+    compression: str,
+    repeat: int,
+) -> Dict:
+    """
+    Run every benchmark stage for a single case of the grid.
+
+    :param files: Number of files.
+    :param rows: Number of rows per file.
+    :param width: Number of columns.
+    :param compression: Parquet compression codec.
+    :param repeat: Number of timed repeats.
+    :return: A dictionary with the case parameters and stage results.
+    """
+    payloads = synthetic_files(files, rows, width, compression)
+    frames = [pd.read_parquet(BytesIO(payload)) for payload in payloads]
+    combined = pd.concat(frames)
+    urls = {f"key{i}": f"http://bench/{i}.parquet" for i in range(files)}
+    by_url = dict(zip(urls.values(), payloads))
+
+    stages = {
+        "read_parquet": lambda: [pd.read_parquet(BytesIO(p)) for p in payloads],
+        "concat": lambda: pd.concat(frames),
+        "to_dict": lambda: combined.to_dict(orient="records"),
+    }
+
+    def _fetch_all():
+        with mock.patch.object(
+            _fetch, "fetch_url", side_effect=lambda url: BytesIO(by_url[url])
+        ):
+            return _fetch.fetch(urls)
+
+    stages["fetch"] = _fetch_all
+
+    results = {}
+    for name, func in stages.items():
+        seconds, peak = measure(func, repeat)
+        results[name] = {"seconds": seconds, "peak_bytes": peak}
+
+    return {
+        "files": files,
+        "rows": rows,
+        "width": width,
+        "compression": compression,
+        "input_bytes": sum(len(p) for p in payloads),
+        "frame_bytes": int(combined.memory_usage(deep=True).sum()),
+        "stages": results,
+    }
+
+
+def git_revision() -> str:
+    """
+    Return the current git revision, or "unknown" outside a git checkout.
+
+    :return: The abbreviated commit hash.
+    """
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(history: str) -> None:
+    """
+    Print the change between the two latest runs recorded in a history file.
+
+    :param history: Path to the JSON lines history file.
+    :return: None
+    """
+    with open(history, "r", encoding="utf-8") as file:
+        runs = [json.loads(line) for line in file if line.strip()]
+    if len(runs) < 2:
+        print("Need at least two recorded runs to compare.")
+        return
+
+    before, after = runs[-2], runs[-1]
+    print(f"{before['revision']} -> {after['revision']}")
+    previous = {
+        (c["files"], c["rows"], c["width"], c["compression"]): c
+        for c in before["cases"]
+    }
+    for case in after["cases"]:
+        ident = (case["files"], case["rows"], case["width"], case["compression"])
+        if ident not in previous:
+            continue
+        for stage, result in case["stages"].items():
+            old = previous[ident]["stages"].get(stage)
+            if not old or not old["seconds"]:
+                continue
+            ratio = result["seconds"] / old["seconds"]
+            print(
+                f"{ident} {stage:>12}: {old['seconds']:.4f}s -> "
+                f"{result['seconds']:.4f}s ({ratio:.2f}x)"
+            )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, nargs="+", default=[4])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--width", type=int, nargs="+", default=[5, 50])
+    parser.add_argument("--compression", nargs="+", default=["snappy", "zstd", "none"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=DEFAULT_HISTORY)
+    parser.add_argument("--compare", metavar="HISTORY")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(args.compare)
+        return
+
+    cases = []
+    for files, rows, width, compression in product(
+        args.files, args.rows, args.width, args.compression
+    ):
+        case = run_case(files, rows, width, compression, args.repeat)
+        cases.append(case)
+        timings = " ".join(
+            f"{name}={result['seconds']:.4f}s"
+            for name, result in case["stages"].items()
+        )
+        print(f"files={files} rows={rows} width={width} {compression}: {timings}")
+
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "pyarrow": pa.__version__,
+        "cases": cases,
+    }
+    with open(args.output, "a", encoding="utf-8") as file:
+        file.write(json.dumps(run) + "\n")
+    print(f"Results appended to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
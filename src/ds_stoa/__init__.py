@@ -7,9 +7,12 @@ The package includes the following subpackages for a complete workflow:
 
 - `authentication`: For handling authentication mechanisms with the datalake.
 - `fetch`: To fetch or retrieve data files from the datalake once an order is signed.
+- `metadata`: For reading the parquet metadata of datalake objects without downloading their data.
 - `manager`: Utilizes all other modules to provide a high-level interface for managing datalake transfers.
 - `order`: For creating and managing orders for data from the datalake.
+- `plan`: For separating the planning of a fetch from its execution.
 - `sign`: To sign and validate orders for data retrieval.
+- `store`: For keeping track of fetched data on local disk between runs.
 - `utils`: Provides utility functions and helpers that support the other modules.
 
 **Features**:
@@ -37,14 +40,20 @@ For more detailed documentation, please refer to the individual module descripti
 from . import authentication
 from . import fetch
 from . import manager
+from . import metadata
 from . import order
+from . import plan
 from . import sign
+from . import store
 
 
 __all__ = [
     "authentication",
     "fetch",
     "manager",
+    "metadata",
     "order",
+    "plan",
     "sign",
+    "store",
 ]
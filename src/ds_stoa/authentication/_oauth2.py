@@ -21,6 +21,7 @@ This allows for flexible deployment and testing without code changes.
 
 Dependencies:
 - **requests**: For making HTTP requests to the OAuth2 token endpoint.
+- **utils.decorators**: For pacing requests with the shared rate limiter.
 - **utils.exceptions**: For enriching HTTP exceptions with more context.
 - **utils.logger**: For logging information about the authentication process and errors.
 
@@ -39,12 +40,14 @@ import os
 import requests
 from requests import auth
 
+from ..utils.decorators import rate_limited
 from ..utils.exceptions import enrich_http_exception
 from ..utils.logger import LOGGER
 
 BUILDING_MODE = os.getenv("BUILDING_MODE", default="dev")
 
 
+@rate_limited("auth")
 def oauth2(client_id: str, client_secret: str) -> str:
     """
     Authenticates an application and retrieves an access token.
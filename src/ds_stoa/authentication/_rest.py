@@ -18,6 +18,7 @@ easy testing and deployment without needing to alter the codebase.
 
 Dependencies:
 - **requests**: For making HTTP requests to the authentication endpoint.
+- **utils.decorators**: For pacing requests with the shared rate limiter.
 - **utils.exceptions**: For enriching HTTP exceptions with additional context.
 - **utils.logger**: For logging the authentication process and any errors that occur.
 
@@ -34,6 +35,7 @@ import os
 
 import requests
 
+from ..utils.decorators import rate_limited
 from ..utils.exceptions import enrich_http_exception
 from ..utils.logger import LOGGER
 
@@ -41,6 +43,7 @@ from ..utils.logger import LOGGER
 BUILDING_MODE = os.getenv("BUILDING_MODE", default="dev")
 
 
+@rate_limited("auth")
 def rest(email: str, password: str) -> str:
     """
     Authenticates a user and retrieves an access token.
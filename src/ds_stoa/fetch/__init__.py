@@ -7,7 +7,29 @@ datalake using pre-signed URLs. This function is capable of fetching data in par
 significantly improving performance for large datasets.
 
 The `fetch` function returns the data as a Pandas DataFrame, making it immediately useful
-for data analysis and manipulation tasks.
+for data analysis and manipulation tasks. For large products, `iter_records` and
+`to_ndjson` stream the data record by record without materialising the full result,
+`iter_frames` yields one DataFrame per file while prefetching the next ones in the
+background, and `fetch_to_dataset` writes it straight to a local, optionally partitioned, directory.
+Given object sizes from `discover_sizes`, `fetch` schedules the largest downloads first
+and splits very large objects into parallel ranged chunks whose row groups are
+decoded in parallel. `RangedFile` reads parts of a remote object, such as its
+parquet footer, without downloading the rest, and `read_row_groups` reads
+only chosen row groups, such as those that may match the filters, which
+`fetch` does for the objects given `row_groups`. With `dtype_backend`,
+`categorical` or `read_dictionary`, `fetch` decodes to Arrow and converts to pandas once,
+keeping string columns Arrow-backed or categorical, and `optimize_memory`
+downcasts numeric columns and categorizes low-cardinality string columns.
+`aggregate` and `groupby_agg` reduce every file as it is decoded and merge the
+partial results, so aggregates never hold the whole product in memory.
+With `sort_by`, `fetch` sorts only the files that are not sorted already and
+merges them with `merge_order`, instead of sorting the whole product.
+Files whose schemas drifted are unified with `unify_schemas` before they are
+concatenated, promoting types permissively and filling missing columns with
+nulls, and `schema_drift` reports how every file differs. `fetch_sample`
+reads a seeded random subset of the row groups of every file through
+`RangedFile`, transferring only the sampled row groups, and `read_head`
+previews a file from its footer and leading row groups.
 
 **Example usage**::
 
@@ -22,8 +44,85 @@ for data analysis and manipulation tasks.
     # Fetching data and loading it into a DataFrame
     dataframe = fetch(pre_signed_urls)
     print(dataframe)
+
+    # Streaming the data as newline delimited JSON
+    to_ndjson(pre_signed_urls, "product.ndjson")
 """
 
-from ._fetch import fetch
+from ._aggregate import aggregate, groupby_agg
+from ._decode import (
+    concat_tables,
+    dictionary_columns,
+    read_parquet_parallel,
+    read_table,
+    read_table_parallel,
+    schema_drift,
+    to_pandas,
+    unify_schemas,
+)
+from ._dataset import fetch_to_dataset, fetch_to_directory
+from ._fetch import (
+    download,
+    fetch,
+    fetch_grouped,
+    local_path,
+    read_files,
+    schedule,
+)
+from ._head import read_head
+from ._merge import merge_order, merge_sorted
+from ._optimize import concat_frames, memory_usage, optimize_dtypes, optimize_table
+from ._ranged import (
+    RangedFile,
+    discover_sizes,
+    download_ranged,
+    fetch_range,
+    fetch_url_ranged,
+    object_size,
+    read_row_groups,
+)
+from ._sample import fetch_sample, object_fraction, read_sample, sample_row_groups
+from ._stream import iter_batches, iter_frames, iter_records, to_ndjson
 
-__all__ = ["fetch"]
+__all__ = [
+    "aggregate",
+    "RangedFile",
+    "concat_frames",
+    "concat_tables",
+    "dictionary_columns",
+    "discover_sizes",
+    "download",
+    "download_ranged",
+    "fetch",
+    "fetch_grouped",
+    "fetch_range",
+    "fetch_sample",
+    "fetch_to_dataset",
+    "fetch_to_directory",
+    "fetch_url_ranged",
+    "groupby_agg",
+    "iter_batches",
+    "iter_frames",
+    "iter_records",
+    "local_path",
+    "memory_usage",
+    "merge_order",
+    "merge_sorted",
+    "object_fraction",
+    "object_size",
+    "optimize_dtypes",
+    "optimize_table",
+    "read_files",
+    "read_head",
+    "read_parquet_parallel",
+    "read_row_groups",
+    "read_sample",
+    "read_table",
+    "read_table_parallel",
+    "sample_row_groups",
+    "schedule",
+    "schema_drift",
+    "to_ndjson",
+    "to_pandas",
+    "unify_schemas",
+]
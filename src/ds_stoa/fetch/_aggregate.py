@@ -0,0 +1,188 @@
+"""
+Module for aggregating data from GraspDP datalake without concatenating it.
+
+This module provides map-reduce aggregation over the files of a product.
+Every file is downloaded and decoded in a worker thread, reduced to a
+partial result by a map function right away, and the partial results are
+combined as the files complete, so memory is proportional to the size of
+the partial results rather than to the number of rows. `groupby_agg`
+builds on this with declarative group-by aggregations, which are split into
+partial aggregations that can be merged exactly.
+
+`Dependencies`:
+- **pandas**: For decoding files and aggregating DataFrames.
+- **concurrent.futures**: For parallel execution of data fetching.
+- **utils.logger**: For logging errors and information.
+
+`Example usage`::
+
+    rows = aggregate(pre_signed_urls, len, lambda a, b: a + b)
+    totals = groupby_agg(pre_signed_urls, by="country", agg={"amount": ["sum", "mean"]})
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from ..utils.hedging import HedgePolicy
+from ..utils.logger import LOGGER
+from ._fetch import fetch_url
+
+# The partial aggregations each aggregation is computed from, and how
+# partial results of each of them are merged.
+PARTIALS = {
+    "sum": ("sum",),
+    "count": ("count",),
+    "min": ("min",),
+    "max": ("max",),
+    "size": ("size",),
+    "mean": ("sum", "count"),
+}
+MERGES = {"sum": "sum", "count": "sum", "min": "min", "max": "max", "size": "sum"}
+
+
+def aggregate(
+    pre_signed_urls: Dict,
+    map_fn: Callable[[pd.DataFrame], Any],
+    combine_fn: Callable[[Any, Any], Any],
+    hedge: Optional[HedgePolicy] = None,
+    max_workers: int = 10,
+) -> Any:
+    """
+    Fetch data from a collection of pre-signed URLs in parallel, reduce
+    every file with a map function as soon as it is decoded, and combine
+    the partial results as they complete.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param map_fn: Reduces the DataFrame of one file to a partial result.
+                   It runs in the worker threads.
+    :type map_fn: Callable[[pd.DataFrame], Any]
+    :param combine_fn: Combines two partial results into one. It runs in
+                       the calling thread, in completion order, so it must
+                       be associative and commutative.
+    :type combine_fn: Callable[[Any, Any], Any]
+    :param hedge: Policy for hedging slow downloads (default: None).
+    :type hedge: Optional[HedgePolicy]
+    :param max_workers: The number of files fetched and mapped at a time.
+    :type max_workers: int
+    :return: The combined result, or None if no file was fetched.
+    :rtype: Any
+
+    **Example**::
+
+        rows = aggregate(pre_signed_urls, len, lambda a, b: a + b)
+    """
+
+    def _map(url: str) -> Any:
+        data = hedge.call(fetch_url, url) if hedge else fetch_url(url)
+        return map_fn(pd.read_parquet(data))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_url = {
+            executor.submit(_map, url): url for url in pre_signed_urls.values()
+        }
+        result, empty = None, True
+        for future in as_completed(future_to_url):
+            url = future_to_url[future]
+            try:
+                partial = future.result()
+            except Exception as exc:
+                LOGGER.error(f"{url} generated an exception: {exc}")
+                continue
+            result = partial if empty else combine_fn(result, partial)
+            empty = False
+        return result
+
+
+def _specs(agg: Dict[str, Union[str, List[str]]]) -> List[Tuple[str, str]]:
+    """
+    Normalize an aggregation spec into (column, function) pairs.
+
+    :param agg: Aggregation functions keyed by column.
+    :return: The (column, function) pairs.
+    :raises ValueError: If an aggregation function is not supported.
+    """
+    specs = []
+    for column, functions in agg.items():
+        for function in [functions] if isinstance(functions, str) else functions:
+            if function not in PARTIALS:
+                raise ValueError(f"Unsupported aggregation: {function}")
+            specs.append((column, function))
+    return specs
+
+
+def groupby_agg(
+    pre_signed_urls: Dict,
+    by: Union[str, List[str]],
+    agg: Dict[str, Union[str, List[str]]],
+    hedge: Optional[HedgePolicy] = None,
+    max_workers: int = 10,
+) -> pd.DataFrame:
+    """
+    Fetch data from a collection of pre-signed URLs in parallel and compute
+    a group-by aggregation, aggregating every file on its own and merging
+    the partial aggregates. The result matches
+    `pd.concat(frames).groupby(by).agg(agg)`.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param by: The column or columns to group by.
+    :type by: Union[str, List[str]]
+    :param agg: Aggregation functions keyed by column: "sum", "count", "min",
+                "max", "mean" or "size", or a list of them.
+    :type agg: Dict[str, Union[str, List[str]]]
+    :param hedge: Policy for hedging slow downloads (default: None).
+    :type hedge: Optional[HedgePolicy]
+    :param max_workers: The number of files fetched and aggregated at a time.
+    :type max_workers: int
+    :return: The aggregated DataFrame, indexed by group. Columns are named
+             after the aggregated columns, or (column, function) pairs if any
+             column has a list of functions.
+    :rtype: pd.DataFrame
+    :raises ValueError: If an aggregation function is not supported.
+
+    **Example**::
+
+        totals = groupby_agg(pre_signed_urls, by="country", agg={"amount": "sum"})
+    """
+    specs = _specs(agg)
+    partials = {
+        f"{column}|{partial}": (column, partial)
+        for column, function in specs
+        for partial in PARTIALS[function]
+    }
+    merges = {name: MERGES[partial] for name, (column, partial) in partials.items()}
+
+    def _map(dataframe: pd.DataFrame) -> pd.DataFrame:
+        return dataframe.groupby(by, observed=True).agg(**partials)
+
+    def _combine(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
+        combined = pd.concat([left, right])
+        return combined.groupby(
+            level=list(range(combined.index.nlevels)), observed=True
+        ).agg(merges)
+
+    merged = aggregate(
+        pre_signed_urls,
+        map_fn=_map,
+        combine_fn=_combine,
+        hedge=hedge,
+        max_workers=max_workers,
+    )
+    if merged is None:
+        return pd.DataFrame()
+
+    columns = {}
+    for column, function in specs:
+        if function == "mean":
+            columns[column, function] = (
+                merged[f"{column}|sum"] / merged[f"{column}|count"]
+            )
+        else:
+            columns[column, function] = merged[f"{column}|{function}"]
+    result = pd.DataFrame(columns, index=merged.index).sort_index()
+    if all(isinstance(functions, str) for functions in agg.values()):
+        result.columns = [column for column, function in columns]
+    return result
@@ -0,0 +1,152 @@
+"""
+Module for exporting data from GraspDP datalake to a local dataset.
+
+This module provides methods for writing a product straight to a local
+directory without building a DataFrame. Without partitioning, the downloaded
+files are streamed to disk byte for byte, so nothing beyond one chunk per
+download is held in memory. With partitioning, every file is decoded once and
+repartitioned through Arrow's dataset writer into a hive style layout.
+
+`Dependencies`:
+- **pyarrow**: For decoding and repartitioning parquet files.
+- **concurrent.futures**: For parallel execution of data fetching.
+- **utils.logger**: For logging errors and information.
+
+`Example usage`::
+
+    pre_signed_urls = {
+        "file1.parquet": "http://example.com/data1.parquet",
+        "file2.parquet": "http://example.com/data2.parquet",
+    }
+    files = fetch_to_dataset(pre_signed_urls, "/tmp/product")
+    files = fetch_to_dataset(pre_signed_urls, "/tmp/product", partition_by=["date"])
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from ..utils.logger import LOGGER
+from ._fetch import download, fetch_url, local_path
+
+
+def _repartition(url: str, key: str, path: str, partition_by: List[str]) -> List[str]:
+    """
+    Fetch a single file and write it into a partitioned dataset.
+
+    :param url: The pre-signed URL of the file.
+    :param key: The object key, used to name the written fragments. The
+        names end with a hash of the key, so keys that map to the same
+        name never overwrite each other's fragments.
+    :param path: The root directory of the dataset.
+    :param partition_by: The columns to partition by.
+    :return: The paths of the written fragments.
+    """
+    table = pq.read_table(fetch_url(url))
+    relative = os.path.relpath(local_path(path, key), path)
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+    stem = f"{os.path.splitext(relative)[0].replace(os.sep, '_')}-{digest}"
+    written = []
+    ds.write_dataset(
+        table,
+        path,
+        format="parquet",
+        partitioning=partition_by,
+        partitioning_flavor="hive",
+        basename_template=f"{stem}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        file_visitor=lambda file: written.append(file.path),
+    )
+    return written
+
+
+def fetch_to_directory(
+    pre_signed_urls: Dict,
+    path: str,
+    on_complete: Optional[Callable[[str, str], None]] = None,
+) -> Dict[str, str]:
+    """
+    Fetch data from a collection of pre-signed URLs in parallel and
+    copy every object byte for byte into a local directory.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param path: The local directory to write to.
+    :type path: str
+    :param on_complete: Called with the key and local path of every completed
+        download, in the calling thread, as soon as it completes (default: None).
+    :type on_complete: Optional[Callable[[str, str], None]]
+    :return: A dictionary mapping the keys of the completed downloads to local paths.
+    :rtype: Dict[str, str]
+
+    **Example**::
+
+        files = fetch_to_directory(pre_signed_urls, "/tmp/product")
+    """
+    os.makedirs(path, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        future_to_key = {
+            executor.submit(download, url, local_path(path, key)): key
+            for key, url in pre_signed_urls.items()
+        }
+        files = {}
+        for future in as_completed(future_to_key):
+            key = future_to_key[future]
+            try:
+                files[key] = future.result()
+            except Exception as exc:
+                LOGGER.error(f"{pre_signed_urls[key]} generated an exception: {exc}")
+                continue
+            if on_complete:
+                on_complete(key, files[key])
+        return files
+
+
+def fetch_to_dataset(
+    pre_signed_urls: Dict,
+    path: str,
+    partition_by: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    Fetch data from a collection of pre-signed URLs in parallel
+    and write it to a local directory.
+
+    Without `partition_by` the objects are copied as is, keeping their keys
+    as relative paths. With `partition_by` the objects are repartitioned by
+    the given columns using hive style directories.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param path: The local directory to write to.
+    :type path: str
+    :param partition_by: Columns to partition the dataset by (default: None).
+    :type partition_by: Optional[List[str]]
+    :return: The paths of the written files.
+    :rtype: List[str]
+
+    **Example**::
+
+        files = fetch_to_dataset(pre_signed_urls, "/tmp/product", partition_by=["date"])
+    """
+    if not partition_by:
+        return sorted(fetch_to_directory(pre_signed_urls, path).values())
+
+    os.makedirs(path, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        future_to_url = {
+            executor.submit(_repartition, url, key, path, partition_by): url
+            for key, url in pre_signed_urls.items()
+        }
+        files = []
+        for future in as_completed(future_to_url):
+            url = future_to_url[future]
+            try:
+                files.extend(future.result())
+            except Exception as exc:
+                LOGGER.error(f"{url} generated an exception: {exc}")
+                continue
+        return sorted(files)
@@ -0,0 +1,411 @@
+"""
+Module for decoding parquet data fetched from GraspDP datalake.
+
+This module provides the decode step of a fetch. Large files are decoded row
+group by row group in parallel, each worker reading its row groups through an
+independent zero-copy reader over the same buffer or memory-mapped file, so a
+single huge file uses the available CPU cores the way many small files do.
+
+Files can also be decoded to Arrow tables that keep string columns dictionary
+encoded, concatenated at the Arrow level and converted to pandas once, with
+Arrow-backed or nullable dtypes, which avoids one Python object per cell.
+
+`Dependencies`:
+- **pyarrow**: For decoding parquet files.
+- **concurrent.futures**: For parallel decoding of row groups.
+
+`Example usage`::
+
+    dataframe = read_parquet_parallel(fetch_url_ranged(url, size=size))
+    dataframe = read_parquet_parallel("/tmp/data.parquet")
+    table = read_table("/tmp/data.parquet", categorical=True)
+    dataframe = to_pandas(concat_tables([table]), dtype_backend="pyarrow")
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..utils.logger import LOGGER
+
+DTYPE_BACKENDS = ("numpy_nullable", "pyarrow")
+
+NULLABLE_DTYPES = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.uint8(): pd.UInt8Dtype(),
+    pa.uint16(): pd.UInt16Dtype(),
+    pa.uint32(): pd.UInt32Dtype(),
+    pa.uint64(): pd.UInt64Dtype(),
+    pa.bool_(): pd.BooleanDtype(),
+    pa.float32(): pd.Float32Dtype(),
+    pa.float64(): pd.Float64Dtype(),
+    pa.string(): pd.StringDtype(),
+    pa.large_string(): pd.StringDtype(),
+}
+
+
+def _reader(source: Union[BytesIO, str]) -> Callable[[], pa.NativeFile]:
+    """
+    Return a factory of independent readers over the same data.
+
+    :param source: A buffer or a local file path.
+    :return: A callable that opens a new reader on every call.
+    """
+    if isinstance(source, str):
+        return lambda: pa.memory_map(source, "r")
+    buffer = pa.py_buffer(source.getbuffer())
+    return lambda: pa.BufferReader(buffer)
+
+
+def file_filters(
+    source: Union[BytesIO, str, pa.Table],
+    filters: Union[List[Tuple], List[List[Tuple]]],
+) -> List[List[Tuple]]:
+    """
+    Restrict filters to the columns of a parquet file. A conjunction on a
+    column the file lacks cannot match any of its rows, so it is dropped.
+
+    :param source: A buffer or a local file path containing a parquet file,
+                   or a table decoded from it.
+    :type source: Union[BytesIO, str, pa.Table]
+    :param filters: Filters in DNF form, as accepted by `pd.read_parquet`.
+    :type filters: Union[List[Tuple], List[List[Tuple]]]
+    :return: The conjunctions that only refer to columns of the file, empty
+             if no row of the file can match.
+    :rtype: List[List[Tuple]]
+
+    **Example**::
+
+        filters = file_filters("/tmp/data.parquet", [("date", ">=", date(2024, 1, 1))])
+    """
+    if isinstance(source, pa.Table):
+        names = set(source.column_names)
+    else:
+        names = set(pq.read_schema(_reader(source)()).names)
+    disjunction = [filters] if isinstance(filters[0], tuple) else filters
+    return [
+        list(conjunction)
+        for conjunction in disjunction
+        if all(name in names for name, _, _ in conjunction)
+    ]
+
+
+def read_table_parallel(
+    source: Union[BytesIO, str],
+    max_workers: int = 8,
+    filters: Optional[List[Tuple]] = None,
+    read_dictionary: Optional[Sequence[str]] = None,
+) -> pa.Table:
+    """
+    Decode a parquet file into an Arrow table, row groups in parallel.
+
+    :param source: A buffer or a local file path containing a parquet file.
+    :type source: Union[BytesIO, str]
+    :param max_workers: The number of row groups decoded at a time.
+    :type max_workers: int
+    :param filters: Filters in DNF form, applied to the decoded rows (default: None).
+    :type filters: Optional[List[Tuple]]
+    :param read_dictionary: Columns to decode as dictionary arrays (default: None).
+    :type read_dictionary: Optional[Sequence[str]]
+    :return: The decoded table.
+    :rtype: pa.Table
+
+    **Example**::
+
+        table = read_table_parallel("/tmp/data.parquet")
+    """
+    reader = _reader(source)
+    metadata = pq.read_metadata(reader())
+    if metadata.num_row_groups <= 1:
+        return pq.read_table(reader(), filters=filters, read_dictionary=read_dictionary)
+
+    def _read_row_group(index: int) -> pa.Table:
+        return pq.ParquetFile(
+            reader(), metadata=metadata, read_dictionary=read_dictionary
+        ).read_row_group(index)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        tables = list(executor.map(_read_row_group, range(metadata.num_row_groups)))
+    table = pa.concat_tables(tables)
+    if filters:
+        table = table.filter(pq.filters_to_expression(filters))
+    return table
+
+
+def read_parquet_parallel(
+    source: Union[BytesIO, str],
+    max_workers: int = 8,
+    filters: Optional[List[Tuple]] = None,
+) -> pd.DataFrame:
+    """
+    Decode a parquet file into a DataFrame, row groups in parallel.
+
+    :param source: A buffer or a local file path containing a parquet file.
+    :type source: Union[BytesIO, str]
+    :param max_workers: The number of row groups decoded at a time.
+    :type max_workers: int
+    :param filters: Filters in DNF form, applied to the decoded rows (default: None).
+    :type filters: Optional[List[Tuple]]
+    :return: The decoded DataFrame.
+    :rtype: pd.DataFrame
+
+    **Example**::
+
+        dataframe = read_parquet_parallel("/tmp/data.parquet")
+    """
+    return read_table_parallel(
+        source, max_workers=max_workers, filters=filters
+    ).to_pandas()
+
+
+def dictionary_columns(metadata: pq.FileMetaData) -> List[str]:
+    """
+    Find the string and binary columns of a parquet file that are dictionary
+    encoded in every row group, according to its footer.
+
+    :param metadata: The parquet metadata of the file.
+    :type metadata: pq.FileMetaData
+    :return: The names of the dictionary encoded columns.
+    :rtype: List[str]
+
+    **Example**::
+
+        columns = dictionary_columns(pq.read_metadata("/tmp/data.parquet"))
+    """
+    if metadata.num_row_groups == 0:
+        return []
+    columns = []
+    first = metadata.row_group(0)
+    for position in range(first.num_columns):
+        name = first.column(position).path_in_schema
+        if "." in name:
+            continue
+        chunks = [
+            metadata.row_group(index).column(position)
+            for index in range(metadata.num_row_groups)
+        ]
+        if all(
+            chunk.physical_type == "BYTE_ARRAY"
+            and chunk.has_dictionary_page
+            and any("DICTIONARY" in encoding for encoding in chunk.encodings)
+            for chunk in chunks
+        ):
+            columns.append(name)
+    return columns
+
+
+def read_table(
+    source: Union[BytesIO, str],
+    filters: Optional[List[Tuple]] = None,
+    read_dictionary: Optional[Sequence[str]] = None,
+    categorical: bool = False,
+    parallel: bool = False,
+) -> pa.Table:
+    """
+    Decode a parquet file into an Arrow table.
+
+    :param source: A buffer or a local file path containing a parquet file.
+    :type source: Union[BytesIO, str]
+    :param filters: Filters in DNF form, applied to the decoded rows (default: None).
+    :type filters: Optional[List[Tuple]]
+    :param read_dictionary: Columns to decode as dictionary arrays (default: None).
+    :type read_dictionary: Optional[Sequence[str]]
+    :param categorical: Whether to also decode the columns that are dictionary
+                        encoded in the file as dictionary arrays (default: False).
+    :type categorical: bool
+    :param parallel: Whether to decode the row groups in parallel (default: False).
+    :type parallel: bool
+    :return: The decoded table.
+    :rtype: pa.Table
+
+    **Example**::
+
+        table = read_table("/tmp/data.parquet", categorical=True)
+    """
+    reader = _reader(source)
+    if categorical:
+        detected = dictionary_columns(pq.read_metadata(reader()))
+        read_dictionary = sorted(set(read_dictionary or ()) | set(detected))
+    if parallel:
+        return read_table_parallel(
+            source, filters=filters, read_dictionary=read_dictionary
+        )
+    return pq.read_table(reader(), filters=filters, read_dictionary=read_dictionary)
+
+
+def unify_schemas(schemas: List[pa.Schema]) -> pa.Schema:
+    """
+    Combine the schemas of several files into one schema that every file
+    can be cast to.
+
+    Columns keep the order in which they first appear. Types are promoted
+    permissively, so integers widen and become floats alongside floats, and
+    columns whose types cannot be promoted, such as numbers and strings,
+    become strings. A column that is dictionary encoded in any file stays
+    dictionary encoded, with the values of every file promoted the same way.
+
+    :param schemas: The schemas of the files.
+    :type schemas: List[pa.Schema]
+    :return: The unified schema, with the metadata of the first schema.
+    :rtype: pa.Schema
+
+    **Example**::
+
+        >>> unify_schemas([pa.schema([("a", pa.int64())]), pa.schema([("a", pa.float64())])])
+        a: double
+    """
+    types: Dict[str, List[pa.DataType]] = {}
+    for schema in schemas:
+        for field in schema:
+            types.setdefault(field.name, []).append(field.type)
+    fields = []
+    for name, candidates in types.items():
+        dictionaries = [type for type in candidates if pa.types.is_dictionary(type)]
+        values = [
+            type.value_type if pa.types.is_dictionary(type) else type
+            for type in candidates
+        ]
+        try:
+            field = pa.unify_schemas(
+                [pa.schema([(name, type)]) for type in values],
+                promote_options="permissive",
+            ).field(name)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            field = pa.field(name, pa.large_string())
+        if dictionaries:
+            field = field.with_type(
+                pa.dictionary(dictionaries[0].index_type, field.type)
+            )
+        fields.append(field)
+    return pa.schema(fields, metadata=schemas[0].metadata if schemas else None)
+
+
+def schema_drift(schemas: Dict[str, pa.Schema]) -> Dict[str, Dict]:
+    """
+    Compare the schema of every file with the unified schema of all files.
+
+    :param schemas: The schemas of the files, keyed by object key.
+    :type schemas: Dict[str, pa.Schema]
+    :return: For every file that differs from the unified schema, the
+             `missing` columns it lacks and the `promoted` columns whose type
+             differs, as (file type, unified type) pairs.
+    :rtype: Dict[str, Dict]
+
+    **Example**::
+
+        >>> schema_drift({"a": pa.schema([("x", pa.int64())]), "b": pa.schema([("y", pa.int64())])})
+        {'a': {'missing': ['y'], 'promoted': {}}, 'b': {'missing': ['x'], 'promoted': {}}}
+    """
+    unified = unify_schemas(list(schemas.values()))
+    drift = {}
+    for key, schema in schemas.items():
+        missing = [name for name in unified.names if name not in schema.names]
+        promoted = {
+            field.name: (field.type, unified.field(field.name).type)
+            for field in schema
+            if field.type != unified.field(field.name).type
+        }
+        if missing or promoted:
+            drift[key] = {"missing": missing, "promoted": promoted}
+    return drift
+
+
+def _cast(column: pa.ChunkedArray, type: pa.DataType) -> pa.ChunkedArray:
+    """
+    Cast a column to a unified type, dictionary encoding plain columns
+    whose unified type is a dictionary.
+
+    :param column: The column to cast.
+    :param type: The unified type.
+    :return: The cast column.
+    """
+    if pa.types.is_dictionary(type) and not pa.types.is_dictionary(column.type):
+        column = column.cast(type.value_type, safe=False).dictionary_encode()
+    return column.cast(type, safe=False)
+
+
+def concat_tables(
+    tables: List[pa.Table],
+    keys: Optional[Sequence[str]] = None,
+) -> pa.Table:
+    """
+    Concatenate Arrow tables whose schemas may have drifted. Every table is
+    cast to the unified schema of all tables, with columns it lacks filled
+    with nulls, and the drift of every table is logged as a warning.
+
+    :param tables: The tables to concatenate.
+    :type tables: List[pa.Table]
+    :param keys: The object keys of the tables, used in the drift warnings
+                 (default: None).
+    :type keys: Optional[Sequence[str]]
+    :return: The concatenated table.
+    :rtype: pa.Table
+    :raises ValueError: If no tables are given.
+
+    **Example**::
+
+        table = concat_tables([read_table(path) for path in paths], keys=paths)
+    """
+    if not tables:
+        raise ValueError("No objects to concatenate")
+    keys = list(keys) if keys is not None else [str(i) for i in range(len(tables))]
+    schemas = [table.schema for table in tables]
+    if all(schema.equals(schemas[0]) for schema in schemas[1:]):
+        return pa.concat_tables(tables)
+    for key, drift in schema_drift(dict(zip(keys, schemas))).items():
+        changes = [f"missing {name}" for name in drift["missing"]] + [
+            f"{name} {type} promoted to {unified}"
+            for name, (type, unified) in drift["promoted"].items()
+        ]
+        LOGGER.warning(f"Schema drift in {key}: {', '.join(changes)}")
+    unified = unify_schemas(schemas)
+    aligned = []
+    for table in tables:
+        columns = [
+            (
+                _cast(table.column(field.name), field.type)
+                if field.name in table.column_names
+                else pa.nulls(table.num_rows, field.type)
+            )
+            for field in unified
+        ]
+        aligned.append(pa.table(columns, schema=unified))
+    return pa.concat_tables(aligned)
+
+
+def to_pandas(table: pa.Table, dtype_backend: Optional[str] = None) -> pd.DataFrame:
+    """
+    Convert an Arrow table to a DataFrame. Dictionary arrays become
+    categorical columns with every dtype backend.
+
+    :param table: The table to convert.
+    :type table: pa.Table
+    :param dtype_backend: "pyarrow" for Arrow-backed dtypes, "numpy_nullable"
+                          for nullable dtypes, or None for NumPy dtypes (default: None).
+    :type dtype_backend: Optional[str]
+    :return: The converted DataFrame.
+    :rtype: pd.DataFrame
+    :raises ValueError: If the dtype backend is invalid.
+
+    **Example**::
+
+        dataframe = to_pandas(table, dtype_backend="pyarrow")
+    """
+    if dtype_backend is None:
+        return table.to_pandas()
+    if dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(f"Invalid dtype backend: {dtype_backend}")
+    if dtype_backend == "pyarrow":
+        return table.to_pandas(
+            types_mapper=lambda type: (
+                None if pa.types.is_dictionary(type) else pd.ArrowDtype(type)
+            )
+        )
+    return table.to_pandas(types_mapper=NULLABLE_DTYPES.get)
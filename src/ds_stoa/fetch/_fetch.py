@@ -23,19 +23,53 @@ Pandas DataFrame.
     print(dataframe)
 """
 
+import os
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
-from typing import Dict
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 
+from ..utils.decorators import rate_limited
+from ..utils.hedging import HedgePolicy, on_cancel
 from ..utils.logger import LOGGER
+from ..utils.ratelimit import iter_content, read_content
+from ._decode import (
+    DTYPE_BACKENDS,
+    concat_tables,
+    file_filters,
+    read_parquet_parallel,
+    read_table,
+    to_pandas,
+)
+from ._merge import merge_order
+from ._optimize import optimize_table
+from ._ranged import fetch_url_ranged, read_row_groups
 
+if TYPE_CHECKING:
+    from ..store import HostCache
 
+
+@rate_limited("download")
 def fetch_url(url: str) -> BytesIO:
     """
     Fetch data from a given URL and return it as a BytesIO object.
+    The body is streamed within the shared download bandwidth cap, and the
+    stream is closed if the download is a hedged attempt that loses.
 
     :param url: The URL to fetch the data from.
     :type url: str
@@ -49,19 +83,209 @@ def fetch_url(url: str) -> BytesIO:
     response = requests.get(
         url=url,
         timeout=60,
+        stream=True,
     )
     response.raise_for_status()
-    return BytesIO(response.content)
+    on_cancel(response.close)
+    return BytesIO(read_content(response))
+
+
+def local_path(directory: str, key: str) -> str:
+    """
+    Map an object key to a path inside a local directory.
+
+    Path separators in the key are kept so the local layout mirrors the
+    datalake, while empty, relative and parent components are dropped so
+    the path can never escape the directory.
+
+    :param directory: The local directory.
+    :type directory: str
+    :param key: The object key.
+    :type key: str
+    :return: The local path for the object.
+    :rtype: str
+
+    **Example**::
+
+        >>> local_path("/tmp/product", "2024/01/12345.snappy.parquet")
+        '/tmp/product/2024/01/12345.snappy.parquet'
+    """
+    parts = [
+        part
+        for part in key.replace("\\", "/").split("/")
+        if part not in ("", ".", "..")
+    ]
+    if not parts:
+        raise ValueError(f"Invalid object key: {key!r}")
+    return os.path.join(directory, *parts)
+
+
+@rate_limited("download")
+def download(url: str, destination: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Stream data from a given URL into a local file.
+
+    The data is written chunk by chunk to a temporary file next to the
+    destination, which is moved into place once the download completes,
+    so a partially downloaded file is never visible at the destination.
+
+    :param url: The URL to fetch the data from.
+    :type url: str
+    :param destination: The local file path to write to.
+    :type destination: str
+    :param chunk_size: The size of the streamed chunks in bytes.
+    :type chunk_size: int
+    :return: The destination path.
+    :rtype: str
+
+    **Example**::
+
+        >>> download("http://example.com/data.parquet", "/tmp/data.parquet")
+        '/tmp/data.parquet'
+    """
+    os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+    partial = f"{destination}.{os.getpid()}.{threading.get_ident()}.part"
+    try:
+        with requests.get(url=url, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            with open(partial, "wb") as file:
+                for chunk in iter_content(response, chunk_size=chunk_size):
+                    file.write(chunk)
+        os.replace(partial, destination)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+    return destination
+
+
+def schedule(
+    pre_signed_urls: Dict,
+    sizes: Optional[Dict[str, int]] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Order downloads longest-processing-time first.
+
+    Objects are scheduled by decreasing size, so the largest downloads start
+    first and no large object is left to run alone at the end. Objects of
+    unknown size are scheduled before all others, since they may be large.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param sizes: Object sizes in bytes, keyed by identifier (default: None).
+    :type sizes: Optional[Dict[str, int]]
+    :return: The identifiers and pre-signed URLs in download order.
+    :rtype: List[Tuple[str, str]]
+
+    **Example**::
+
+        >>> schedule({"a": "http://a", "b": "http://b"}, sizes={"a": 1, "b": 2})
+        [('b', 'http://b'), ('a', 'http://a')]
+    """
+    items = list(pre_signed_urls.items())
+    if not sizes:
+        return items
+    return sorted(items, key=lambda item: -sizes.get(item[0], float("inf")))
+
+
+def _concat(parts: List[pd.DataFrame], keys: List[str]) -> pd.DataFrame:
+    """
+    Concatenate decoded files, unifying their schemas at the Arrow level if
+    the columns or dtypes of any file differ from the others.
+
+    :param parts: The decoded files.
+    :param keys: The object keys of the files.
+    :return: The concatenated DataFrame.
+    """
+    if all(part.dtypes.equals(parts[0].dtypes) for part in parts[1:]):
+        return pd.concat(parts)
+    tables = [pa.Table.from_pandas(part, preserve_index=True) for part in parts]
+    return to_pandas(concat_tables(tables, keys=keys))
 
 
-def fetch(pre_signed_urls: Dict) -> pd.DataFrame:
+def _merge_keys(keys: np.ndarray, parts: List) -> List[np.ndarray]:
+    """
+    Split the sort keys of the concatenated files back into the keys of
+    every file, so files lacking the sort column get null keys.
+
+    :param keys: The sort keys of the concatenated files.
+    :param parts: The decoded files, in concatenation order.
+    :return: The sort keys of every file.
+    """
+    offsets = np.cumsum([0] + [len(part) for part in parts])
+    return [keys[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def fetch(
+    pre_signed_urls: Dict,
+    sizes: Optional[Dict[str, int]] = None,
+    split_threshold: int = 64 << 20,
+    hedge: Optional[HedgePolicy] = None,
+    host_cache: Optional["HostCache"] = None,
+    filters: Optional[List[Tuple]] = None,
+    dtype_backend: Optional[str] = None,
+    read_dictionary: Optional[Sequence[str]] = None,
+    categorical: bool = False,
+    optimize_memory: bool = False,
+    sort_by: Optional[str] = None,
+    row_groups: Optional[Dict[str, List[int]]] = None,
+) -> pd.DataFrame:
     """
     Fetch data from a collection of pre-signed URLs in
     parallel and consolidate into a single DataFrame.
 
+    When object sizes are given, downloads are scheduled largest first and
+    objects larger than `split_threshold` are downloaded as parallel
+    ranged chunks and decoded row groups in parallel. With a host cache,
+    objects are downloaded once per host into the cache and decoded from
+    memory-mapped files.
+
+    With a dtype backend, dictionary columns, categorical columns or
+    `optimize_memory`, files are decoded to Arrow tables, concatenated at
+    the Arrow level and converted to pandas once, so string columns are not
+    materialised as one Python object per cell. With `optimize_memory`,
+    numeric columns are downcast and low-cardinality string columns
+    dictionary encoded per file, before the files are concatenated. Files whose schemas drifted are unified at
+    the Arrow level before conversion, with permissive type promotion and
+    null-filled missing columns, and the drift is logged. With `sort_by`, files are sorted by the column
+    only if they are not sorted already and then merged, so the result is
+    sorted without sorting the whole product.
+
     :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
     :type pre_signed_urls: Dict[str, str]
-    :return: A consolidated Pandas DataFrame containing data from all fetched URLs.
+    :param sizes: Object sizes in bytes, keyed by identifier (default: None).
+    :type sizes: Optional[Dict[str, int]]
+    :param split_threshold: The size in bytes above which objects are split
+                            into ranged chunks (default: 64 MiB).
+    :type split_threshold: int
+    :param hedge: Policy for hedging slow downloads (default: None).
+    :type hedge: Optional[HedgePolicy]
+    :param host_cache: Cache shared with other processes on the host (default: None).
+    :type host_cache: Optional[HostCache]
+    :param filters: Filters in DNF form, as accepted by `pd.read_parquet`,
+                    applied while decoding. Files lacking a filtered column
+                    have no matching rows (default: None).
+    :type filters: Optional[List[Tuple]]
+    :param dtype_backend: "pyarrow" for Arrow-backed dtypes or "numpy_nullable"
+                          for nullable dtypes (default: None).
+    :type dtype_backend: Optional[str]
+    :param read_dictionary: Columns to return as categorical columns (default: None).
+    :type read_dictionary: Optional[Sequence[str]]
+    :param categorical: Whether to return the columns that are dictionary encoded
+                        in the files as categorical columns (default: False).
+    :type categorical: bool
+    :param optimize_memory: Whether to downcast numeric columns and categorize
+                            low-cardinality string columns (default: False).
+    :type optimize_memory: bool
+    :param sort_by: The column to sort the result by, with rows of equal
+                    values in the order of `pre_signed_urls` (default: None).
+    :type sort_by: Optional[str]
+    :param row_groups: The row groups to read of objects of which only some
+                       may match, keyed by identifier. Only the footer and
+                       these row groups of such objects are transferred
+                       (default: None).
+    :type row_groups: Optional[Dict[str, List[int]]]
+    :return: A consolidated Pandas DataFrame containing data from all fetched URLs,
+             empty if no file has matching rows.
     :rtype: pd.DataFrame
 
     **Example**::
@@ -72,18 +296,217 @@ def fetch(pre_signed_urls: Dict) -> pd.DataFrame:
         }
         dataframe = fetch(pre_signed_urls)
     """
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_url = {
-            executor.submit(fetch_url, url): url for url in pre_signed_urls.values()
-        }
-        dataframes = []
+    return fetch_grouped(
+        {None: pre_signed_urls},
+        sizes=sizes,
+        split_threshold=split_threshold,
+        hedge=hedge,
+        host_cache=host_cache,
+        filters=filters,
+        dtype_backend=dtype_backend,
+        read_dictionary=read_dictionary,
+        categorical=categorical,
+        optimize_memory=optimize_memory,
+        sort_by=sort_by,
+        row_groups=row_groups,
+    )[None]
+
+
+def _decode_part(
+    key: str,
+    data: Union[BytesIO, str, pa.Table],
+    sizes: Dict[str, int],
+    split_threshold: int,
+    filters: Optional[List[Tuple]],
+    arrow: bool,
+    read_dictionary: Optional[Sequence[str]],
+    categorical: bool,
+) -> Optional[Union[pd.DataFrame, pa.Table]]:
+    """
+    Decode one downloaded file to a DataFrame, or to an Arrow table if
+    `arrow` is set.
+
+    :param key: The object key of the file.
+    :param data: A buffer, the local path of a host-cached file, or the
+        row groups of the file already decoded.
+    :return: The decoded file, None if no row of the file can match the filters.
+    """
+    part_filters = file_filters(data, filters) if filters else None
+    if filters and not part_filters:
+        LOGGER.info(f"{key} lacks the filtered columns, no rows match")
+        return None
+    if isinstance(data, pa.Table):
+        if part_filters:
+            data = data.filter(pq.filters_to_expression(part_filters))
+        return data if arrow else data.to_pandas()
+    if arrow:
+        return read_table(
+            data,
+            filters=part_filters,
+            read_dictionary=read_dictionary,
+            categorical=categorical,
+            parallel=sizes.get(key, 0) > split_threshold,
+        )
+    if sizes.get(key, 0) > split_threshold:
+        return read_parquet_parallel(data, filters=part_filters)
+    if isinstance(data, str):
+        with pa.memory_map(data, "r") as source:
+            return pd.read_parquet(source, filters=part_filters)
+    return pd.read_parquet(data, filters=part_filters)
+
+
+def fetch_grouped(
+    groups: Dict[Hashable, Dict],
+    hedge: Optional[HedgePolicy] = None,
+    max_workers: int = 10,
+    sizes: Optional[Dict[str, int]] = None,
+    split_threshold: int = 64 << 20,
+    host_cache: Optional["HostCache"] = None,
+    filters: Optional[List[Tuple]] = None,
+    dtype_backend: Optional[str] = None,
+    read_dictionary: Optional[Sequence[str]] = None,
+    categorical: bool = False,
+    optimize_memory: bool = False,
+    sort_by: Optional[str] = None,
+    row_groups: Optional[Dict[str, List[int]]] = None,
+) -> Dict[Hashable, pd.DataFrame]:
+    """
+    Fetch data for several groups of pre-signed URLs through one shared
+    pool of workers and consolidate it into one DataFrame per group. Every
+    group is decoded and consolidated as by `fetch`, with the same options.
+
+    :param groups: A dictionary mapping group identifiers to dictionaries of pre-signed URLs.
+    :type groups: Dict[Hashable, Dict[str, str]]
+    :param hedge: Policy for hedging slow downloads (default: None).
+    :type hedge: Optional[HedgePolicy]
+    :param max_workers: The number of parallel downloads across all groups.
+    :type max_workers: int
+    :param sizes: Object sizes in bytes, keyed by identifier (default: None).
+    :type sizes: Optional[Dict[str, int]]
+    :param split_threshold: The size in bytes above which objects are split
+                            into ranged chunks (default: 64 MiB).
+    :type split_threshold: int
+    :param host_cache: Cache shared with other processes on the host (default: None).
+    :type host_cache: Optional[HostCache]
+    :param filters: Filters in DNF form, applied while decoding (default: None).
+    :type filters: Optional[List[Tuple]]
+    :param dtype_backend: "pyarrow" or "numpy_nullable" (default: None).
+    :type dtype_backend: Optional[str]
+    :param read_dictionary: Columns to return as categorical columns (default: None).
+    :type read_dictionary: Optional[Sequence[str]]
+    :param categorical: Whether to return dictionary encoded columns as
+                        categorical columns (default: False).
+    :type categorical: bool
+    :param optimize_memory: Whether to downcast numeric columns and categorize
+                            low-cardinality string columns (default: False).
+    :type optimize_memory: bool
+    :param sort_by: The column to sort every group by (default: None).
+    :type sort_by: Optional[str]
+    :param row_groups: The row groups to read of objects of which only some
+                       may match, keyed by identifier. Only the footer and
+                       these row groups of such objects are transferred
+                       (default: None).
+    :type row_groups: Optional[Dict[str, List[int]]]
+    :return: A dictionary mapping group identifiers to consolidated DataFrames.
+             Groups without any fetched data map to an empty DataFrame.
+    :rtype: Dict[Hashable, pd.DataFrame]
+    :raises ValueError: If the dtype backend is invalid.
+
+    **Example**::
+
+        dataframes = fetch_grouped({"product1": pre_signed_urls1, "product2": pre_signed_urls2})
+    """
+    if dtype_backend is not None and dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(f"Invalid dtype backend: {dtype_backend}")
+    arrow = bool(dtype_backend or read_dictionary or categorical or optimize_memory)
+    sizes = sizes or {}
+    row_groups = row_groups or {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_url = {}
+        for group, pre_signed_urls in groups.items():
+            for key, url in schedule(pre_signed_urls, sizes):
+                if key in row_groups:
+                    future = executor.submit(
+                        read_row_groups,
+                        url,
+                        row_groups[key],
+                        size=sizes.get(key),
+                        read_dictionary=read_dictionary,
+                        categorical=categorical,
+                    )
+                elif host_cache:
+                    future = executor.submit(host_cache.get, key, url)
+                elif sizes.get(key, 0) > split_threshold:
+                    future = executor.submit(fetch_url_ranged, url, sizes[key])
+                elif hedge:
+                    future = executor.submit(hedge.call, fetch_url, url)
+                else:
+                    future = executor.submit(fetch_url, url)
+                future_to_url[future] = (group, key, url)
+        parts: Dict[Hashable, Dict] = {group: {} for group in groups}
+        saved = 0
         for future in as_completed(future_to_url):
-            url = future_to_url[future]
+            group, key, url = future_to_url[future]
             try:
                 data = future.result()
             except Exception as exc:
                 LOGGER.error(f"{url} generated an exception: {exc}")
                 continue
-            df = pd.read_parquet(data)
-            dataframes.append(df)
-        return pd.concat(dataframes)
+            part = _decode_part(
+                key,
+                data,
+                sizes,
+                split_threshold,
+                filters,
+                arrow,
+                read_dictionary,
+                categorical,
+            )
+            if part is None:
+                continue
+            if optimize_memory:
+                before = part.nbytes
+                part = optimize_table(part)
+                saved += before - part.nbytes
+            parts[group][key] = part
+    dataframes = {}
+    for group, pre_signed_urls in groups.items():
+        keys = [key for key in pre_signed_urls if key in parts[group]]
+        frames = [parts[group][key] for key in keys]
+        if not frames:
+            dataframes[group] = pd.DataFrame()
+            continue
+        if arrow:
+            table = concat_tables(frames, keys=keys)
+            if sort_by:
+                order = merge_order(_merge_keys(table[sort_by].to_numpy(), frames))
+                table = table.take(order)
+            dataframe = to_pandas(table, dtype_backend=dtype_backend)
+        else:
+            dataframe = _concat(frames, keys)
+            if sort_by:
+                order = merge_order(_merge_keys(dataframe[sort_by].to_numpy(), frames))
+                dataframe = dataframe.iloc[order]
+        dataframes[group] = dataframe
+    if optimize_memory:
+        LOGGER.info(f"Memory optimization saved {saved} bytes")
+    return dataframes
+
+
+def read_files(paths: List[str]) -> pd.DataFrame:
+    """
+    Read local parquet files and consolidate them into a single DataFrame.
+    Files whose schemas drifted are unified at the Arrow level, as by `fetch`.
+
+    :param paths: The local parquet files to read.
+    :type paths: List[str]
+    :return: A consolidated Pandas DataFrame, empty if no paths are given.
+    :rtype: pd.DataFrame
+
+    **Example**::
+
+        dataframe = read_files(["/tmp/data1.parquet", "/tmp/data2.parquet"])
+    """
+    if not paths:
+        return pd.DataFrame()
+    return _concat([pd.read_parquet(path) for path in paths], keys=paths)
@@ -0,0 +1,58 @@
+"""
+Module for previewing data from GraspDP datalake.
+
+This module provides the first rows of a remote parquet file without
+downloading it. The file is opened as a `RangedFile`, its footer is read with
+a ranged request, and only the leading row groups that hold the requested
+number of rows are transferred and decoded.
+
+`Dependencies`:
+- **pyarrow**: For reading row groups of parquet files.
+
+`Example usage`::
+
+    table = read_head("http://example.com/data.parquet", 10)
+"""
+
+from typing import Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ._ranged import RangedFile
+
+
+def read_head(url: str, n: int, size: Optional[int] = None) -> pa.Table:
+    """
+    Read the first rows of a remote parquet file, transferring only its
+    footer and the row groups that hold them.
+
+    :param url: The URL of the object.
+    :type url: str
+    :param n: The number of rows to read.
+    :type n: int
+    :param size: The size of the object in bytes, discovered if not given.
+    :type size: Optional[int]
+    :return: The first `n` rows, or all rows if the file has fewer.
+    :rtype: pa.Table
+
+    **Example**::
+
+        table = read_head("http://example.com/data.parquet", 10)
+    """
+    with RangedFile(url, size=size) as file:
+        metadata = pq.read_metadata(file)
+        parquet_file = pq.ParquetFile(file, metadata=metadata)
+        tables = []
+        rows = 0
+        for index in range(metadata.num_row_groups):
+            if rows >= n:
+                break
+            if not metadata.row_group(index).num_rows:
+                continue
+            table = parquet_file.read_row_group(index)
+            tables.append(table)
+            rows += table.num_rows
+    if not tables:
+        return metadata.schema.to_arrow_schema().empty_table()
+    return pa.concat_tables(tables).slice(0, n)
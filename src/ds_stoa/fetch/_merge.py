@@ -0,0 +1,145 @@
+"""
+Module for merging files of a product into globally sorted output.
+
+Files of a product are usually already sorted by their timestamp column, so
+sorting their concatenation from scratch repeats work. This module checks
+every file for sortedness, sorts only the files that are not sorted, and
+merges the sorted files with pairwise vectorized merges of their keys, so
+k files of n rows in total are merged in O(n log k) and the rows themselves
+are moved only once. Nulls are ordered last, as by `sort_values`, and rows
+with equal keys keep the order of their files.
+
+`Dependencies`:
+- **numpy**: For vectorized sortedness checks and merges.
+- **pandas**: For taking the merged rows of the DataFrames.
+- **utils.logger**: For logging errors and information.
+
+`Example usage`::
+
+    frames = [pd.read_parquet(path) for path in paths]
+    dataframe = merge_sorted(frames, "timestamp")
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..utils.logger import LOGGER
+
+
+def is_sorted(keys: np.ndarray) -> bool:
+    """
+    Check if keys are sorted in ascending order with any nulls last.
+
+    :param keys: The keys.
+    :type keys: np.ndarray
+    :return: Whether the keys are sorted.
+    :rtype: bool
+    :raises TypeError: If the keys cannot be compared.
+
+    **Example**::
+
+        >>> is_sorted(np.array([1.0, 2.0, np.nan]))
+        True
+    """
+    nulls = pd.isna(keys)
+    if nulls.any():
+        first = int(nulls.argmax())
+        if not nulls[first:].all():
+            return False
+        keys = keys[:first]
+    return not bool(np.any(keys[1:] < keys[:-1]))
+
+
+def _merge(
+    left: Tuple[np.ndarray, np.ndarray],
+    right: Tuple[np.ndarray, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge two sorted runs of keys and their row positions.
+
+    :param left: The keys and row positions of the first run.
+    :param right: The keys and row positions of the second run.
+    :return: The keys and row positions of the merged run.
+    """
+    left_keys, left_rows = left
+    right_keys, right_rows = right
+    left_positions = np.arange(len(left_keys)) + np.searchsorted(
+        right_keys, left_keys, side="left"
+    )
+    right_positions = np.arange(len(right_keys)) + np.searchsorted(
+        left_keys, right_keys, side="right"
+    )
+    keys = np.empty(
+        len(left_keys) + len(right_keys),
+        dtype=np.result_type(left_keys, right_keys),
+    )
+    rows = np.empty(len(keys), dtype=np.intp)
+    keys[left_positions], rows[left_positions] = left_keys, left_rows
+    keys[right_positions], rows[right_positions] = right_keys, right_rows
+    return keys, rows
+
+
+def merge_order(keys: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Compute the order of the rows of several files that sorts them by key.
+
+    Files whose keys are not sorted are sorted first, then the sorted runs
+    are merged pairwise. Keys that numpy cannot merge, such as nullable
+    keys of extension types or keys of mixed types, are sorted together by
+    pandas instead.
+
+    :param keys: The sort keys of every file, in file order.
+    :type keys: Sequence[np.ndarray]
+    :return: Positions into the concatenated files, in sorted order.
+    :rtype: np.ndarray
+
+    **Example**::
+
+        >>> merge_order([np.array([1, 3]), np.array([2, 4])])
+        array([0, 2, 1, 3])
+    """
+    offsets = np.cumsum([0] + [len(part) for part in keys])
+    try:
+        runs: List[Tuple[np.ndarray, np.ndarray]] = []
+        unsorted = 0
+        for part, offset in zip(keys, offsets):
+            rows = np.arange(offset, offset + len(part))
+            if not is_sorted(part):
+                order = np.argsort(part, kind="stable")
+                part, rows = part[order], rows[order]
+                unsorted += 1
+            runs.append((part, rows))
+        LOGGER.info(f"Sorted {unsorted} of {len(runs)} files before merging")
+        if not runs:
+            return np.empty(0, dtype=np.intp)
+        while len(runs) > 1:
+            merged = [_merge(*runs[i : i + 2]) for i in range(0, len(runs) - 1, 2)]
+            if len(runs) % 2:
+                merged.append(runs[-1])
+            runs = merged
+        return runs[0][1]
+    except TypeError:
+        series = pd.Series(np.concatenate(keys) if keys else [])
+        return series.sort_values(kind="stable", na_position="last").index.to_numpy()
+
+
+def merge_sorted(frames: List[pd.DataFrame], by: str) -> pd.DataFrame:
+    """
+    Concatenate DataFrames sorted by a column, merging files that are
+    already sorted instead of sorting their concatenation.
+
+    :param frames: The DataFrames, in file order.
+    :type frames: List[pd.DataFrame]
+    :param by: The column to sort by.
+    :type by: str
+    :return: The concatenated DataFrame, sorted by the column.
+    :rtype: pd.DataFrame
+
+    **Example**::
+
+        dataframe = merge_sorted(frames, "timestamp")
+    """
+    order = merge_order([frame[by].to_numpy() for frame in frames])
+    return pd.concat(frames).iloc[order]
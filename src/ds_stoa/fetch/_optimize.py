@@ -0,0 +1,181 @@
+"""
+Module for reducing the memory footprint of fetched DataFrames.
+
+This module provides an opt-in post-load stage of a fetch. Every decoded
+file is optimized on its own, before the files are concatenated: integer
+columns are downcast to the smallest type that holds their range, float
+columns are downcast to float32 when no value changes, and low-cardinality
+string columns become categoricals. The categories of all files are unified
+before concatenation, so the consolidated columns stay categorical. Arrow
+tables are optimized the same way with `optimize_table`, string columns
+becoming dictionary arrays.
+
+`Dependencies`:
+- **pandas**: For downcasting and categorizing columns.
+- **pyarrow**: For downcasting and dictionary encoding Arrow columns.
+- **numpy**: For vectorized range and precision checks.
+
+`Example usage`::
+
+    frames = [optimize_dtypes(pd.read_parquet(path)) for path in paths]
+    dataframe = concat_frames(frames)
+    table = optimize_table(pq.read_table(path))
+"""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pandas.api.types import union_categoricals
+
+INTEGER_TYPES = {
+    True: (pa.int8(), pa.int16(), pa.int32(), pa.int64()),
+    False: (pa.uint8(), pa.uint16(), pa.uint32(), pa.uint64()),
+}
+
+
+def memory_usage(dataframe: pd.DataFrame) -> int:
+    """
+    Measure the memory used by a DataFrame, including the objects it refers to.
+
+    :param dataframe: The DataFrame to measure.
+    :type dataframe: pd.DataFrame
+    :return: The memory usage in bytes.
+    :rtype: int
+
+    **Example**::
+
+        >>> memory_usage(pd.DataFrame({"a": [1, 2]}))
+        148
+    """
+    return int(dataframe.memory_usage(deep=True).sum())
+
+
+def optimize_dtypes(
+    dataframe: pd.DataFrame,
+    category_ratio: float = 0.5,
+) -> pd.DataFrame:
+    """
+    Downcast the numeric columns of a DataFrame and categorize its
+    low-cardinality string columns, without changing any value. Object
+    columns holding anything but strings, such as lists and structs, are
+    left as they are.
+
+    :param dataframe: The DataFrame to optimize.
+    :type dataframe: pd.DataFrame
+    :param category_ratio: The maximum ratio of distinct values to rows of a
+                           string column to become categorical (default: 0.5).
+    :type category_ratio: float
+    :return: The optimized DataFrame.
+    :rtype: pd.DataFrame
+
+    **Example**::
+
+        dataframe = optimize_dtypes(pd.read_parquet("/tmp/data.parquet"))
+    """
+    columns = {}
+    for name, column in dataframe.items():
+        dtype = column.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            continue
+        if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+            columns[name] = pd.to_numeric(column, downcast="integer")
+        elif isinstance(dtype, np.dtype) and dtype == np.float64:
+            downcast = column.to_numpy().astype(np.float32)
+            if np.array_equal(downcast, column.to_numpy(), equal_nan=True):
+                columns[name] = pd.Series(downcast, index=column.index, name=name)
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            if pd.api.types.infer_dtype(column, skipna=True) != "string":
+                continue
+            if len(column) and column.nunique() <= category_ratio * len(column):
+                columns[name] = column.astype("category")
+    if not columns:
+        return dataframe
+    dataframe = dataframe.copy(deep=False)
+    for name, column in columns.items():
+        dataframe[name] = column
+    return dataframe
+
+
+def optimize_table(table: pa.Table, category_ratio: float = 0.5) -> pa.Table:
+    """
+    Downcast the numeric columns of an Arrow table and dictionary encode
+    its low-cardinality string columns, without changing any value.
+
+    :param table: The table to optimize.
+    :type table: pa.Table
+    :param category_ratio: The maximum ratio of distinct values to rows of a
+                           string column to become dictionary encoded (default: 0.5).
+    :type category_ratio: float
+    :return: The optimized table.
+    :rtype: pa.Table
+
+    **Example**::
+
+        table = optimize_table(pq.read_table("/tmp/data.parquet"))
+    """
+    columns = []
+    for field, column in zip(table.schema, table.columns):
+        dtype = field.type
+        if pa.types.is_integer(dtype):
+            bounds = pc.min_max(column)
+            low, high = bounds["min"].as_py(), bounds["max"].as_py()
+            if low is not None:
+                signed = pa.types.is_signed_integer(dtype)
+                for candidate in INTEGER_TYPES[signed]:
+                    info = np.iinfo(candidate.to_pandas_dtype())
+                    if info.min <= low and high <= info.max:
+                        break
+                if candidate.bit_width < dtype.bit_width:
+                    column = column.cast(candidate)
+        elif pa.types.is_float64(dtype):
+            values = column.to_numpy()
+            if np.array_equal(values.astype(np.float32), values, equal_nan=True):
+                column = column.cast(pa.float32())
+        elif pa.types.is_string(dtype) or pa.types.is_large_string(dtype):
+            distinct = pc.count_distinct(column).as_py()
+            if len(column) and distinct <= category_ratio * len(column):
+                column = column.dictionary_encode()
+        columns.append(column)
+    return pa.table(columns, names=table.column_names).replace_schema_metadata(
+        table.schema.metadata
+    )
+
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate DataFrames, unifying the categories of every column that is
+    categorical in any of them so it stays categorical after concatenation.
+
+    :param frames: The DataFrames to concatenate.
+    :type frames: List[pd.DataFrame]
+    :return: The concatenated DataFrame.
+    :rtype: pd.DataFrame
+
+    **Example**::
+
+        dataframe = concat_frames([optimize_dtypes(frame) for frame in frames])
+    """
+    names = {
+        name
+        for frame in frames
+        for name, dtype in frame.dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype)
+    }
+    for name in names:
+        columns = [frame[name].astype("category") for frame in frames if name in frame]
+        try:
+            categories = union_categoricals(columns, ignore_order=True).categories
+        except TypeError:
+            continue
+        dtype = pd.CategoricalDtype(categories)
+        aligned = []
+        for frame in frames:
+            if name in frame:
+                frame = frame.copy(deep=False)
+                frame[name] = frame[name].astype(dtype)
+            aligned.append(frame)
+        frames = aligned
+    return pd.concat(frames)
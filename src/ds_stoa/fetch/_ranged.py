@@ -0,0 +1,403 @@
+"""
+Module for ranged requests against pre-signed URLs.
+
+Pre-signed URLs are signed for GET requests only, so object sizes are
+discovered with a one byte ranged GET instead of a HEAD request. The same
+range requests are used to download large objects as several parallel chunks
+that are reassembled into a single buffer or file, and `RangedFile` exposes a
+remote object as a seekable file, so readers such as pyarrow fetch only the
+parts they need, like the parquet footer or `read_row_groups` the column
+chunks of chosen row groups.
+
+`Dependencies`:
+- **requests**: For making ranged HTTP requests.
+- **pyarrow**: For reading chosen row groups of parquet files.
+- **concurrent.futures**: For parallel execution of ranged downloads.
+- **utils.logger**: For logging errors and information.
+
+`Example usage`::
+
+    sizes = discover_sizes(pre_signed_urls)
+    data = fetch_url_ranged(url, size=sizes["file1"])
+    metadata = pq.read_metadata(RangedFile(url, size=sizes["file1"]))
+    table = read_row_groups(url, [0, 3], size=sizes["file1"])
+"""
+
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
+
+from ..utils.decorators import rate_limited
+from ..utils.logger import LOGGER
+from ..utils.ratelimit import read_content
+from ._decode import dictionary_columns
+
+
+@rate_limited("download")
+def fetch_range(url: str, start: int, end: int) -> bytes:
+    """
+    Fetch an inclusive byte range of the object behind a URL.
+
+    The range is only accepted from a 206 response of exactly the requested
+    length. If the server ignores the range or returns a short body, the
+    whole object is fetched with a plain GET and the range is cut from it.
+
+    :param url: The URL to fetch the data from.
+    :type url: str
+    :param start: The first byte of the range.
+    :type start: int
+    :param end: The last byte of the range, inclusive.
+    :type end: int
+    :return: The bytes of the range.
+    :rtype: bytes
+    :raises ValueError: If the object does not hold the whole range.
+
+    **Example**::
+
+        >>> fetch_range("http://example.com/data.parquet", 0, 3)
+        b'PAR1'
+    """
+    length = end - start + 1
+    with requests.get(
+        url=url,
+        headers={"Range": f"bytes={start}-{end}"},
+        timeout=60,
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        status = response.status_code
+        if status == 206:
+            chunk = read_content(response)
+            if len(chunk) == length:
+                return chunk
+            status = f"206 with {len(chunk)} of {length} bytes"
+    LOGGER.warning(
+        f"Range {start}-{end} of {url} returned {status}, fetching the whole object"
+    )
+    with requests.get(url=url, timeout=60, stream=True) as response:
+        response.raise_for_status()
+        chunk = read_content(response)[start : end + 1]
+    if len(chunk) != length:
+        raise ValueError(f"Range {start}-{end} is beyond the end of {url}")
+    return chunk
+
+
+@rate_limited("download")
+def object_size(url: str) -> int:
+    """
+    Discover the size of the object behind a URL with a one byte ranged GET.
+
+    :param url: The URL of the object.
+    :type url: str
+    :return: The size of the object in bytes.
+    :rtype: int
+    :raises ValueError: If the size cannot be determined.
+
+    **Example**::
+
+        >>> object_size("http://example.com/data.parquet")
+        1048576
+    """
+    with requests.get(
+        url=url,
+        headers={"Range": "bytes=0-0"},
+        timeout=60,
+        stream=True,
+    ) as response:
+        response.raise_for_status()
+        content_range = response.headers.get("Content-Range", "")
+        if response.status_code == 206 and "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            if total.isdigit():
+                return int(total)
+        length = response.headers.get("Content-Length", "")
+        if response.status_code == 200 and length.isdigit():
+            return int(length)
+    raise ValueError(f"Unable to determine the size of {url}")
+
+
+class RangedFile(io.RawIOBase):
+    """
+    The RangedFile class is a read-only, seekable file over the object behind
+    a pre-signed URL. Every read is served by a ranged GET of exactly the
+    requested bytes; wrap it in an `io.BufferedReader` to coalesce small reads.
+    """
+
+    def __init__(self, url: str, size: Optional[int] = None) -> None:
+        """
+        Constructor for the RangedFile class.
+
+        :param url: The URL of the object.
+        :param size: The size of the object in bytes, discovered if not given.
+        """
+        super().__init__()
+        self.url = url
+        self.size = object_size(url) if size is None else size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Moves the position of the file.
+
+        :param offset: The offset relative to `whence`.
+        :param whence: The reference position (default: start of the file).
+        :return: The new position.
+        """
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        """
+        Reads bytes at the current position into a buffer.
+
+        :param buffer: The writable buffer.
+        :return: The number of bytes read, 0 at the end of the file.
+        """
+        end = min(self._position + len(buffer), self.size)
+        if end <= self._position:
+            return 0
+        chunk = fetch_range(self.url, self._position, end - 1)
+        buffer[: len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def readall(self) -> bytes:
+        """
+        Reads the remainder of the file with a single ranged GET.
+
+        :return: The bytes up to the end of the file.
+        """
+        if self._position >= self.size:
+            return b""
+        chunk = fetch_range(self.url, self._position, self.size - 1)
+        self._position += len(chunk)
+        return chunk
+
+
+def read_row_groups(
+    url: str,
+    row_groups: Sequence[int],
+    size: Optional[int] = None,
+    read_dictionary: Optional[Sequence[str]] = None,
+    categorical: bool = False,
+) -> pa.Table:
+    """
+    Read chosen row groups of a remote parquet file, transferring only its
+    footer and the column chunks of those row groups.
+
+    :param url: The URL of the object.
+    :type url: str
+    :param row_groups: The indices of the row groups to read.
+    :type row_groups: Sequence[int]
+    :param size: The size of the object in bytes, discovered if not given.
+    :type size: Optional[int]
+    :param read_dictionary: Columns to decode as dictionary arrays (default: None).
+    :type read_dictionary: Optional[Sequence[str]]
+    :param categorical: Whether to also decode the columns that are dictionary
+                        encoded in the file as dictionary arrays (default: False).
+    :type categorical: bool
+    :return: The rows of the row groups, in file order.
+    :rtype: pa.Table
+
+    **Example**::
+
+        table = read_row_groups("http://example.com/data.parquet", [0, 3])
+    """
+    with RangedFile(url, size=size) as file:
+        metadata = pq.read_metadata(file)
+        if categorical:
+            detected = dictionary_columns(metadata)
+            read_dictionary = sorted(set(read_dictionary or ()) | set(detected))
+        parquet_file = pq.ParquetFile(
+            file,
+            metadata=metadata,
+            read_dictionary=read_dictionary,
+            pre_buffer=True,
+        )
+        return parquet_file.read_row_groups(sorted(row_groups))
+
+
+def discover_sizes(pre_signed_urls: Dict, max_workers: int = 10) -> Dict[str, int]:
+    """
+    Discover the sizes of a collection of objects in parallel.
+
+    Objects whose size cannot be determined are logged and left out.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param max_workers: The number of parallel requests.
+    :type max_workers: int
+    :return: A dictionary mapping identifiers to sizes in bytes.
+    :rtype: Dict[str, int]
+
+    **Example**::
+
+        sizes = discover_sizes(pre_signed_urls)
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_key = {
+            executor.submit(object_size, url): key
+            for key, url in pre_signed_urls.items()
+        }
+        sizes = {}
+        for future in as_completed(future_to_key):
+            key = future_to_key[future]
+            try:
+                sizes[key] = future.result()
+            except Exception as exc:
+                LOGGER.error(f"{key} size discovery generated an exception: {exc}")
+        return sizes
+
+
+def _ranges(
+    size: int,
+    chunk_size: int,
+    parts: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    """
+    Split an object into inclusive byte ranges.
+
+    :param size: The size of the object in bytes.
+    :param chunk_size: The size of each range in bytes.
+    :param parts: The number of ranges, overriding `chunk_size` (default: None).
+    :return: The inclusive byte ranges.
+    """
+    if parts:
+        chunk_size = max(-(-size // parts), 1)
+    return [
+        (start, min(start + chunk_size, size) - 1)
+        for start in range(0, size, chunk_size)
+    ]
+
+
+def fetch_url_ranged(
+    url: str,
+    size: Optional[int] = None,
+    chunk_size: int = 16 << 20,
+    max_workers: int = 8,
+    parts: Optional[int] = None,
+) -> BytesIO:
+    """
+    Fetch an object as parallel ranged chunks and reassemble it in memory.
+
+    :param url: The URL to fetch the data from.
+    :type url: str
+    :param size: The size of the object in bytes, discovered if not given.
+    :type size: Optional[int]
+    :param chunk_size: The size of each ranged request in bytes.
+    :type chunk_size: int
+    :param max_workers: The number of parallel ranged requests.
+    :type max_workers: int
+    :param parts: Split the object into this many ranges instead of
+                  `chunk_size` sized ones (default: None).
+    :type parts: Optional[int]
+    :return: A BytesIO object containing the fetched data.
+    :rtype: BytesIO
+
+    **Example**::
+
+        >>> fetch_url_ranged("http://example.com/data.parquet", size=1 << 30)
+    """
+    if size is None:
+        size = object_size(url)
+    buffer = bytearray(size)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_start = {
+            executor.submit(fetch_range, url, start, end): start
+            for start, end in _ranges(size, chunk_size, parts)
+        }
+        for future in as_completed(future_to_start):
+            start = future_to_start[future]
+            chunk = future.result()
+            buffer[start : start + len(chunk)] = chunk
+    return BytesIO(buffer)
+
+
+def download_ranged(
+    url: str,
+    destination: str,
+    size: Optional[int] = None,
+    chunk_size: int = 16 << 20,
+    max_workers: int = 8,
+    parts: Optional[int] = None,
+) -> str:
+    """
+    Stream an object into a local file as parallel ranged chunks.
+
+    Every chunk is written at its offset in a preallocated temporary file,
+    which is moved into place once all chunks have completed, so at most
+    one chunk per worker is held in memory.
+
+    :param url: The URL to fetch the data from.
+    :type url: str
+    :param destination: The local file path to write to.
+    :type destination: str
+    :param size: The size of the object in bytes, discovered if not given.
+    :type size: Optional[int]
+    :param chunk_size: The size of each ranged request in bytes.
+    :type chunk_size: int
+    :param max_workers: The number of parallel ranged requests.
+    :type max_workers: int
+    :param parts: Split the object into this many ranges instead of
+                  `chunk_size` sized ones (default: None).
+    :type parts: Optional[int]
+    :return: The destination path.
+    :rtype: str
+
+    **Example**::
+
+        >>> download_ranged("http://example.com/data.parquet", "/tmp/data.parquet")
+        '/tmp/data.parquet'
+    """
+    if size is None:
+        size = object_size(url)
+    os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+    partial = f"{destination}.{os.getpid()}.{threading.get_ident()}.part"
+
+    def _write_range(start: int, end: int) -> None:
+        chunk = fetch_range(url, start, end)
+        with open(partial, "r+b") as file:
+            file.seek(start)
+            file.write(chunk)
+
+    try:
+        with open(partial, "wb") as file:
+            file.truncate(size)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_write_range, start, end)
+                for start, end in _ranges(size, chunk_size, parts)
+            ]
+            for future in as_completed(futures):
+                future.result()
+        os.replace(partial, destination)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+    return destination
@@ -0,0 +1,229 @@
+"""
+Module for fetching a sample of the data from GraspDP datalake.
+
+This module provides the row group stage of a sampled fetch. Every sampled
+object is opened as a `RangedFile`, so only its footer and the column chunks
+of a seeded random subset of its row groups are transferred and decoded.
+Row groups are the unit of sampling, so files written as a single row group
+are read whole; `object_fraction` accounts for this when splitting a sample
+between objects and row groups.
+
+`Dependencies`:
+- **pyarrow**: For reading selected row groups of parquet files.
+- **concurrent.futures**: For parallel execution of data fetching.
+- **utils.logger**: For logging errors and information.
+
+`Example usage`::
+
+    table = read_sample("http://example.com/data.parquet", fraction=0.1, seed=42)
+    dataframe = fetch_sample(pre_signed_urls, fraction=0.1, seed=42)
+"""
+
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..utils.logger import LOGGER
+from ._decode import DTYPE_BACKENDS, concat_tables, dictionary_columns, to_pandas
+from ._ranged import RangedFile
+
+
+def sample_row_groups(num_row_groups: int, fraction: float, seed: str) -> List[int]:
+    """
+    Select a seeded random sample of the row groups of a file.
+
+    :param num_row_groups: The number of row groups of the file.
+    :type num_row_groups: int
+    :param fraction: The fraction of row groups to select. At least one row
+                     group of a non-empty file is selected.
+    :type fraction: float
+    :param seed: The seed of the sample.
+    :type seed: str
+    :return: The indices of the sampled row groups, in ascending order.
+    :rtype: List[int]
+
+    **Example**::
+
+        >>> sample_row_groups(4, fraction=0.5, seed="42:file1")
+        [2, 3]
+    """
+    if not num_row_groups:
+        return []
+    count = max(1, round(fraction * num_row_groups))
+    return sorted(random.Random(seed).sample(range(num_row_groups), count))
+
+
+def object_fraction(
+    num_row_groups: Sequence[int],
+    fraction: float,
+    row_group_fraction: float,
+    weights: Optional[Sequence[float]] = None,
+) -> float:
+    """
+    Work out the fraction of objects to sample, so that reading
+    `row_group_fraction` of the row groups of every sampled object reads
+    about `fraction` of the product. A file gives at least one row group, so
+    files with few row groups are read in a larger share than asked, and
+    fewer of them are sampled.
+
+    :param num_row_groups: The number of row groups of every file.
+    :type num_row_groups: Sequence[int]
+    :param fraction: The fraction of the product to read.
+    :type fraction: float
+    :param row_group_fraction: The fraction of row groups read from every
+                               sampled file.
+    :type row_group_fraction: float
+    :param weights: The weight of every file in the product, such as its
+                    size in bytes (default: None, equal weights).
+    :type weights: Optional[Sequence[float]]
+    :return: The fraction of objects to sample, at most 1.
+    :rtype: float
+
+    **Example**::
+
+        >>> object_fraction([1, 1, 1, 1], fraction=0.01, row_group_fraction=0.1)
+        0.01
+    """
+    weights = [1.0] * len(num_row_groups) if weights is None else weights
+    total = expected = 0.0
+    for count, weight in zip(num_row_groups, weights):
+        if not count:
+            continue
+        total += weight
+        expected += weight * max(1, round(row_group_fraction * count)) / count
+    if not expected:
+        return fraction
+    return min(1.0, fraction * total / expected)
+
+
+def read_sample(
+    url: str,
+    fraction: float,
+    seed: str,
+    size: Optional[int] = None,
+    filters: Optional[List[Tuple]] = None,
+    read_dictionary: Optional[Sequence[str]] = None,
+    categorical: bool = False,
+) -> pa.Table:
+    """
+    Read a seeded random sample of the row groups of a remote parquet file,
+    transferring only its footer and the sampled row groups.
+
+    :param url: The URL of the object.
+    :type url: str
+    :param fraction: The fraction of row groups to read.
+    :type fraction: float
+    :param seed: The seed of the sample.
+    :type seed: str
+    :param size: The size of the object in bytes, discovered if not given.
+    :type size: Optional[int]
+    :param filters: Filters in DNF form, applied to the sampled rows (default: None).
+    :type filters: Optional[List[Tuple]]
+    :param read_dictionary: Columns to decode as dictionary arrays (default: None).
+    :type read_dictionary: Optional[Sequence[str]]
+    :param categorical: Whether to also decode the columns that are dictionary
+                        encoded in the file as dictionary arrays (default: False).
+    :type categorical: bool
+    :return: The sampled rows.
+    :rtype: pa.Table
+
+    **Example**::
+
+        table = read_sample("http://example.com/data.parquet", fraction=0.1, seed="42")
+    """
+    with RangedFile(url, size=size) as file:
+        metadata = pq.read_metadata(file)
+        if categorical:
+            detected = dictionary_columns(metadata)
+            read_dictionary = sorted(set(read_dictionary or ()) | set(detected))
+        parquet_file = pq.ParquetFile(
+            file,
+            metadata=metadata,
+            read_dictionary=read_dictionary,
+            pre_buffer=True,
+        )
+        row_groups = sample_row_groups(metadata.num_row_groups, fraction, seed)
+        table = parquet_file.read_row_groups(row_groups)
+    if filters:
+        table = table.filter(pq.filters_to_expression(filters))
+    return table
+
+
+def fetch_sample(
+    pre_signed_urls: Dict,
+    fraction: float,
+    seed: int = 0,
+    sizes: Optional[Dict[str, int]] = None,
+    filters: Optional[List[Tuple]] = None,
+    dtype_backend: Optional[str] = None,
+    read_dictionary: Optional[Sequence[str]] = None,
+    categorical: bool = False,
+) -> pd.DataFrame:
+    """
+    Fetch a seeded random sample of the row groups of a collection of
+    pre-signed URLs in parallel and consolidate it into a single DataFrame.
+
+    The row groups of every file are sampled with a seed derived from `seed`
+    and the identifier of the file, so the sample does not depend on which
+    other files are fetched.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param fraction: The fraction of the row groups of every file to read.
+    :type fraction: float
+    :param seed: The seed of the sample (default: 0).
+    :type seed: int
+    :param sizes: Object sizes in bytes, keyed by identifier (default: None).
+    :type sizes: Optional[Dict[str, int]]
+    :param filters: Filters in DNF form, applied to the sampled rows (default: None).
+    :type filters: Optional[List[Tuple]]
+    :param dtype_backend: "pyarrow" for Arrow-backed dtypes or "numpy_nullable"
+                          for nullable dtypes (default: None).
+    :type dtype_backend: Optional[str]
+    :param read_dictionary: Columns to return as categorical columns (default: None).
+    :type read_dictionary: Optional[Sequence[str]]
+    :param categorical: Whether to return the columns that are dictionary encoded
+                        in the files as categorical columns (default: False).
+    :type categorical: bool
+    :return: The sampled rows, in the order of the URLs, or an empty DataFrame.
+    :rtype: pd.DataFrame
+    :raises ValueError: If the fraction or the dtype backend is invalid.
+
+    **Example**::
+
+        dataframe = fetch_sample(pre_signed_urls, fraction=0.1, seed=42)
+    """
+    if not 0 < fraction <= 1:
+        raise ValueError("Sample fraction must be greater than 0 and at most 1")
+    if dtype_backend is not None and dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(f"Invalid dtype backend: {dtype_backend}")
+    sizes = sizes or {}
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        future_to_url = {
+            executor.submit(
+                read_sample,
+                url,
+                fraction,
+                f"{seed}:{key}",
+                size=sizes.get(key),
+                filters=filters,
+                read_dictionary=read_dictionary,
+                categorical=categorical,
+            ): (key, url)
+            for key, url in pre_signed_urls.items()
+        }
+        tables = {}
+        for future in as_completed(future_to_url):
+            key, url = future_to_url[future]
+            try:
+                tables[key] = future.result()
+            except Exception as exc:
+                LOGGER.error(f"{url} generated an exception: {exc}")
+    tables = [tables[key] for key in pre_signed_urls if key in tables]
+    if not tables:
+        return pd.DataFrame()
+    return to_pandas(concat_tables(tables), dtype_backend=dtype_backend)
@@ -0,0 +1,263 @@
+"""
+Module for streaming records from GraspDP datalake.
+
+This module provides methods for consuming a product as a stream of records
+instead of a single DataFrame. Files are consumed in the order of their keys
+while the next files are downloaded in the background, within a prefetch
+depth given in files, so at most that many downloaded files are held at any
+time. Each file is decoded batch by batch straight from its Arrow record
+batches, so only one batch of Python dictionaries exists at any time.
+`iter_frames` yields one DataFrame per file and can also bound the prefetch
+depth in bytes.
+
+`Dependencies`:
+- **pyarrow**: For decoding parquet files into record batches.
+- **concurrent.futures**: For parallel execution of data fetching.
+- **utils.logger**: For logging errors and information.
+
+`Example usage`::
+
+    pre_signed_urls = {
+        "file1": "http://example.com/data1.parquet",
+        "file2": "http://example.com/data2.parquet",
+    }
+    for record in iter_records(pre_signed_urls):
+        print(record)
+
+    with open("product.ndjson", "w") as file:
+        to_ndjson(pre_signed_urls, file)
+
+    for dataframe in iter_frames(pre_signed_urls, prefetch=4):
+        print(len(dataframe))
+"""
+
+import json
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Union
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from ..utils.hedging import HedgePolicy
+from ..utils.logger import LOGGER
+from ._fetch import fetch_url
+
+
+def _prefetched(
+    pre_signed_urls: Dict,
+    fetch: Callable[[str], Any],
+    prefetch: int,
+    prefetch_bytes: Optional[int] = None,
+    sizes: Optional[Dict[str, int]] = None,
+) -> Iterator[Any]:
+    """
+    Apply `fetch` to a collection of pre-signed URLs in a bounded window of
+    background threads and yield the results in the order of the URLs.
+    Failed URLs are logged and skipped.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param fetch: The function fetching and decoding a URL.
+    :type fetch: Callable[[str], Any]
+    :param prefetch: The maximum number of files fetched ahead of the consumer.
+    :type prefetch: int
+    :param prefetch_bytes: The maximum size in bytes of the files fetched
+                           ahead of the consumer (default: None).
+    :type prefetch_bytes: Optional[int]
+    :param sizes: Object sizes in bytes, keyed by identifier, used with
+                  `prefetch_bytes` (default: None).
+    :type sizes: Optional[Dict[str, int]]
+    :return: An iterator over the results of `fetch`.
+    :rtype: Iterator[Any]
+    :raises ValueError: If the prefetch depth is smaller than one.
+    """
+    if prefetch < 1:
+        raise ValueError("Prefetch depth must be at least 1")
+    sizes = sizes or {}
+
+    items = deque(pre_signed_urls.items())
+    in_flight = deque()
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+
+    def _fill() -> None:
+        while items and len(in_flight) < prefetch:
+            key, url = items[0]
+            size = sizes.get(key, 0)
+            if prefetch_bytes is not None and in_flight:
+                if sum(entry[1] for entry in in_flight) + size > prefetch_bytes:
+                    return
+            items.popleft()
+            in_flight.append((url, size, executor.submit(fetch, url)))
+
+    try:
+        _fill()
+        while in_flight:
+            url, _, future = in_flight.popleft()
+            _fill()
+            try:
+                result = future.result()
+            except Exception as exc:
+                LOGGER.error(f"{url} generated an exception: {exc}")
+                continue
+            yield result
+    finally:
+        # Closing the iterator must not wait for the downloads in flight:
+        # queued ones are cancelled and running ones finish in the background.
+        if sys.version_info >= (3, 9):
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            for _, _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+def iter_batches(
+    pre_signed_urls: Dict,
+    batch_size: int = 65536,
+    prefetch: int = 2,
+) -> Iterator[List[Dict]]:
+    """
+    Fetch data from a collection of pre-signed URLs and yield it as lists of
+    records, one Arrow record batch at a time, in the order of the URLs,
+    while the following files are downloaded in the background.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param batch_size: The maximum number of records per batch.
+    :type batch_size: int
+    :param prefetch: The maximum number of files fetched ahead of the consumer.
+    :type prefetch: int
+    :return: An iterator over lists of records.
+    :rtype: Iterator[List[Dict]]
+    :raises ValueError: If the prefetch depth is smaller than one.
+
+    **Example**::
+
+        for batch in iter_batches(pre_signed_urls, batch_size=1000):
+            print(len(batch))
+    """
+    for data in _prefetched(pre_signed_urls, fetch_url, prefetch):
+        parquet_file = pq.ParquetFile(data)
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield batch.to_pylist()
+
+
+def iter_frames(
+    pre_signed_urls: Dict,
+    prefetch: int = 2,
+    prefetch_bytes: Optional[int] = None,
+    sizes: Optional[Dict[str, int]] = None,
+    hedge: Optional[HedgePolicy] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Fetch data from a collection of pre-signed URLs and yield it one
+    DataFrame per file, in the order of the URLs, while the following files
+    are downloaded and decoded in the background.
+
+    At most `prefetch` files are in flight or waiting to be consumed. With
+    `prefetch_bytes`, no further file is started while the known sizes of
+    the files in flight would exceed it, though one file is always fetched.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param prefetch: The maximum number of files fetched ahead of the consumer.
+    :type prefetch: int
+    :param prefetch_bytes: The maximum size in bytes of the files fetched
+                           ahead of the consumer (default: None).
+    :type prefetch_bytes: Optional[int]
+    :param sizes: Object sizes in bytes, keyed by identifier, used with
+                  `prefetch_bytes` (default: None).
+    :type sizes: Optional[Dict[str, int]]
+    :param hedge: Policy for hedging slow downloads (default: None).
+    :type hedge: Optional[HedgePolicy]
+    :return: An iterator over the DataFrames of the files.
+    :rtype: Iterator[pd.DataFrame]
+    :raises ValueError: If the prefetch depth is smaller than one.
+
+    **Example**::
+
+        for dataframe in iter_frames(pre_signed_urls, prefetch=4):
+            print(len(dataframe))
+    """
+
+    def _fetch(url: str) -> pd.DataFrame:
+        data = hedge.call(fetch_url, url) if hedge else fetch_url(url)
+        return pd.read_parquet(data)
+
+    yield from _prefetched(pre_signed_urls, _fetch, prefetch, prefetch_bytes, sizes)
+
+
+def iter_records(
+    pre_signed_urls: Dict,
+    batch_size: int = 65536,
+    prefetch: int = 2,
+) -> Iterator[Dict]:
+    """
+    Fetch data from a collection of pre-signed URLs in parallel
+    and yield it record by record.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param batch_size: The number of records decoded at a time.
+    :type batch_size: int
+    :param prefetch: The maximum number of files fetched ahead of the consumer.
+    :type prefetch: int
+    :return: An iterator over records.
+    :rtype: Iterator[Dict]
+
+    **Example**::
+
+        for record in iter_records(pre_signed_urls):
+            print(record)
+    """
+    for batch in iter_batches(
+        pre_signed_urls, batch_size=batch_size, prefetch=prefetch
+    ):
+        yield from batch
+
+
+def to_ndjson(
+    pre_signed_urls: Dict,
+    destination: Union[str, IO[str]],
+    batch_size: int = 65536,
+    prefetch: int = 2,
+) -> int:
+    """
+    Fetch data from a collection of pre-signed URLs in parallel
+    and write it as newline delimited JSON, batch by batch.
+
+    Values that are not JSON serializable, such as timestamps and decimals,
+    are written as strings.
+
+    :param pre_signed_urls: A dictionary where keys are identifiers and values are pre-signed URLs.
+    :type pre_signed_urls: Dict[str, str]
+    :param destination: A file path or a writable text stream.
+    :type destination: Union[str, IO[str]]
+    :param batch_size: The number of records decoded at a time.
+    :type batch_size: int
+    :param prefetch: The maximum number of files fetched ahead of the consumer.
+    :type prefetch: int
+    :return: The number of records written.
+    :rtype: int
+
+    **Example**::
+
+        count = to_ndjson(pre_signed_urls, "product.ndjson")
+    """
+    if isinstance(destination, str):
+        with open(destination, "w", encoding="utf-8") as stream:
+            return to_ndjson(
+                pre_signed_urls, stream, batch_size=batch_size, prefetch=prefetch
+            )
+
+    count = 0
+    for batch in iter_batches(
+        pre_signed_urls, batch_size=batch_size, prefetch=prefetch
+    ):
+        destination.write(
+            "".join(json.dumps(record, default=str) + "\n" for record in batch)
+        )
+        count += len(batch)
+    return count
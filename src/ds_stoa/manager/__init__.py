@@ -52,10 +52,23 @@ communication and data exchange.
     dataframe = stoa.fetch()
 
 
+4. Fetch several products with one authentication and one download pool::
+
+    from ds_stoa.manager import ProductSpec
+
+    dataframes = stoa.fetch_many(
+        [
+            ProductSpec("exampleGroup", "exampleProduct", "owner123"),
+            ProductSpec("exampleGroup", "otherProduct", "owner123", "2.0"),
+        ]
+    )
+
+
 **Note**: Replace the placeholder values (e.g., "user@example.com", "securepassword", "client_id_example", etc.)
 with your actual data when implementing these examples.
 """
 
 from .client import StoaClient
+from .spec import ProductSpec
 
-__all__ = ["StoaClient"]
+__all__ = ["ProductSpec", "StoaClient"]
@@ -7,16 +7,57 @@ ordering messages, which are essential operations for communication and data
 exchange within our system.
 """
 
-from typing import Dict, List, Literal, Optional, Union
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 
 from ..authentication import oauth2, rest
-from ..fetch import fetch
-from ..order import order
+from ..fetch import (
+    aggregate,
+    concat_tables,
+    discover_sizes,
+    fetch,
+    fetch_grouped,
+    fetch_sample,
+    fetch_to_dataset,
+    fetch_to_directory,
+    groupby_agg,
+    iter_frames,
+    iter_records,
+    local_path,
+    object_fraction,
+    optimize_dtypes,
+    read_files,
+    read_head,
+    to_ndjson,
+    to_pandas,
+)
+from ..metadata import FooterCache, StatisticsIndex, describe
+from ..order import order, sample_keys, shard
+from ..plan import FetchPlan, execute
 from ..sign import sign
+from ..store import HostCache, Journal, Manifest
+from ..utils.hedging import HedgePolicy
 from ..utils.logger import LOGGER
 from ..utils.decorators import ensure_authenticated
+from .spec import ProductSpec
 
 
 class StoaClient:
@@ -24,6 +65,10 @@ class StoaClient:
     The Stoa class provides methods for handling messages within our system.
     These methods include operations for fetching, signing, authenticating,
     and ordering messages.
+
+    A client can be shared between threads: every call works on its own
+    ordered keys and signatures, and concurrent calls that find the client
+    unauthenticated share a single authentication request.
     """
 
     def __init__(
@@ -41,6 +86,13 @@ class StoaClient:
         password: Optional[str] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
+        shard_index: Optional[int] = None,
+        num_shards: Optional[int] = None,
+        shard_fn: Optional[Callable[[List[str]], List[str]]] = None,
+        sign_hedge: Optional[HedgePolicy] = None,
+        fetch_hedge: Optional[HedgePolicy] = None,
+        host_cache: Optional[str] = None,
+        host_cache_max_bytes: Optional[int] = None,
     ) -> None:
         """
         Constructor for the Stoa class. Initializes a new instance of the
@@ -59,12 +111,28 @@ class StoaClient:
         :param password: The password for authentication (default: None).
         :param client_id: The client ID for authentication (default: None).
         :param client_secret: The client secret for authentication (default: None).
+        :param shard_index: The shard of the ordered keys this client fetches (default: None).
+        :param num_shards: The total number of shards. Keys are sharded by a
+            stable hash of the key, as sizes are unknown before signing; use
+            `FetchPlan.shard` to balance shards by size (default: None).
+        :param shard_fn: A function selecting this client's keys from the
+            ordered keys, used instead of `shard_index`/`num_shards` (default: None).
+        :param sign_hedge: Policy for hedging slow sign requests (default: None).
+        :param fetch_hedge: Policy for hedging slow downloads (default: None).
+        :param host_cache: A local directory shared by the processes on this
+            host, so each object is downloaded once per host (default: None).
+        :param host_cache_max_bytes: The size in bytes above which the least
+            recently used objects of the host cache are evicted (default: None).
         """
         # Validate input parameters
         if not 0 <= offset:
             raise ValueError("Offset must be greater than or equal to 0")
         if not 0 < limit <= 20:
             raise ValueError("Limit must be less than or equal to 20")
+        if (shard_index is None) != (num_shards is None):
+            raise ValueError("Shard index and number of shards must be set together")
+        if num_shards is not None and not 0 <= shard_index < num_shards:
+            raise ValueError("Shard index must be between 0 and the number of shards")
 
         self.authentication = authentication
         self.product_group_name = product_group_name
@@ -79,10 +147,21 @@ class StoaClient:
         self.password = password
         self.client_id = client_id
         self.client_secret = client_secret
+        self.shard_index = shard_index
+        self.num_shards = num_shards
+        self.shard_fn = shard_fn
+        self.sign_hedge = sign_hedge
+        self.fetch_hedge = fetch_hedge
+        self.host_cache = (
+            HostCache(host_cache, max_bytes=host_cache_max_bytes)
+            if host_cache
+            else None
+        )
 
         self._token = None
-        self._order_ids: List = []
+        self._order_ids: Optional[List] = None
         self._signatures: Dict = {}
+        self._auth_lock = threading.Lock()
 
     @property
     def token(self) -> str:
@@ -112,12 +191,15 @@ class StoaClient:
     @property
     def order_ids(self) -> List[str]:
         """
-        Order IDs getter that retrieves the current list of order IDs.
+        Order IDs getter that retrieves the list of order IDs of the most
+        recent order. Kept for compatibility; concurrent callers should use
+        the keys returned by `order()` instead. The list is empty if the
+        product or the client's shard has no keys.
 
         :return: List of order IDs.
-        :raises ValueError: If no order IDs are found.
+        :raises ValueError: If nothing has been ordered yet.
         """
-        if not self._order_ids:
+        if self._order_ids is None:
             raise ValueError("No order IDs found.")
         return self._order_ids
 
@@ -141,7 +223,9 @@ class StoaClient:
     @property
     def signatures(self) -> Dict:
         """
-        Signatures getter that retrieves the current dictionary of signatures.
+        Signatures getter that retrieves the dictionary of signatures of the
+        most recent signing. Kept for compatibility; concurrent callers should
+        use the signatures returned by `sign()` instead.
 
         :return: Dictionary of signatures.
         :raises ValueError: If no signatures are found.
@@ -167,6 +251,20 @@ class StoaClient:
 
         self._signatures = value
 
+    @property
+    def spec(self) -> ProductSpec:
+        """
+        Spec getter that retrieves the product this client fetches.
+
+        :return: The product spec.
+        """
+        return ProductSpec(
+            product_group_name=self.product_group_name,
+            product_name=self.product_name,
+            owner_id=self.owner_id,
+            version=self.version,
+        )
+
     def authenticate(self) -> None:
         """
         Authenticates a message to verify its origin. This method is used to
@@ -234,7 +332,8 @@ class StoaClient:
         """
         Orders a message based on predefined rules. This method is used to
         sort or arrange messages according to certain criteria before they
-        are processed by the system.
+        are processed by the system. When the client is sharded, only the
+        keys of its own shard are kept.
 
         :return: Ordered keys.
         :rtype: List
@@ -250,29 +349,23 @@ class StoaClient:
         if self.workspace not in ["apps", "cart"]:
             raise ValueError("Invalid workspace.")
 
-        self.order_ids = order(
-            token=self.token,
-            params={
-                "product_group_name": self.product_group_name,
-                "product_name": self.product_name,
-                "workspace": self.workspace,
-                "owner_id": self.owner_id,
-                "version": self.version,
-                "offset": self.offset,
-                "limit": self.limit,
-                "ascending": self.ascending,
-            },
-        )
-        LOGGER.info(f"({len(self.order_ids)}) orders created")
-        return self.order_ids
+        order_ids = self._order_keys(self.spec)
+        if order_ids:
+            self.order_ids = order_ids
+        else:
+            self._order_ids = []
+            LOGGER.warning("No orders created, the product or shard is empty")
+        LOGGER.info(f"({len(order_ids)}) orders created")
+        return order_ids
 
     @ensure_authenticated
-    def sign(self) -> Dict:
+    def sign(self, keys: Optional[List[str]] = None) -> Dict:
         """
         Signs a message to ensure its integrity and authenticity. This method
         is used to add a layer of security to our messages, making sure they
         are not tampered with during transit.
 
+        :param keys: The keys to sign (default: the ordered keys).
         :return: The pre-signed URLs for the messages.
         :rtype: Dict
         :raises ValueError: If the order IDs are missing.
@@ -283,25 +376,219 @@ class StoaClient:
             >>> stoa.sign()
             >>> assert stoa.signatures
         """
-        LOGGER.info(f"Signing {len(self.order_ids)} orders...")
+        if keys is None:
+            keys = self.order_ids
+        LOGGER.info(f"Signing {len(keys)} orders...")
         signatures = {}
-        for id in self.order_ids:
-            signatures[id] = sign(
+        for id in keys:
+            signatures[id] = self._sign_key(id)
+        if signatures:
+            self.signatures = signatures
+        return signatures
+
+    def _order_keys(self, spec: ProductSpec) -> List[str]:
+        """
+        Orders the keys of a product, keeping only this client's shard. The
+        shard is chosen by key hash, since sizes are unknown before signing.
+
+        :param spec: The product to order.
+        :return: The ordered keys.
+        """
+        order_ids = order(
+            token=self.token,
+            params={
+                "product_group_name": spec.product_group_name,
+                "product_name": spec.product_name,
+                "workspace": self.workspace,
+                "owner_id": spec.owner_id,
+                "version": spec.version,
+                "offset": self.offset,
+                "limit": self.limit,
+                "ascending": self.ascending,
+            },
+        )
+        if self.shard_fn is not None:
+            return self.shard_fn(order_ids)
+        if self.num_shards is not None:
+            return shard(
+                keys=order_ids,
+                shard_index=self.shard_index,
+                num_shards=self.num_shards,
+            )
+        return order_ids
+
+    def _sign_key(self, key: str) -> str:
+        """
+        Signs a single key, hedged if the client has a sign hedging policy.
+
+        :param key: The key to sign.
+        :return: The pre-signed URL of the key.
+        """
+        if self.sign_hedge:
+            return self.sign_hedge.call(
+                sign,
                 token=self.token,
-                params={"key": id},
+                params={"key": key},
             )
-        self.signatures = signatures
-        return self.signatures
+        return sign(
+            token=self.token,
+            params={"key": key},
+        )
+
+    def plan(
+        self,
+        size_aware: bool = False,
+        filters: Optional[List[Tuple]] = None,
+        cache_dir: Optional[str] = None,
+    ) -> FetchPlan:
+        """
+        Orders and signs the product and returns the result as a fetch plan,
+        which can be serialised and executed elsewhere without this client.
+
+        :param size_aware: Whether to discover the object sizes, so the plan
+            can be scheduled largest first and sliced by size (default: False).
+        :param filters: Filters in DNF form; objects whose statistics rule
+            out any match are left out of the plan (default: None).
+        :param cache_dir: The local directory caching footers and statistics
+            used with `filters` (default: None).
+        :return: The fetch plan of the product.
+        :rtype: FetchPlan
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> plan = stoa.plan()
+            >>> payload = plan.to_json()
+        """
+        LOGGER.info(
+            f"Planning product: {self.product_name} | {self.owner_id}...",
+        )
+        row_groups: Dict[str, List[int]] = {}
+        plan = FetchPlan.from_signatures(
+            self._signed(filters, cache_dir, row_groups=row_groups),
+            row_groups=row_groups,
+        )
+        if size_aware:
+            plan.discover_sizes()
+        return plan
+
+    def describe(self, cache_dir: Optional[str] = None) -> Dict:
+        """
+        Describes the product from the parquet footers of its objects,
+        without downloading any data. Only the footers are read, with ranged
+        requests, and with a cache directory they are cached by object key,
+        so only objects that have not been described before are signed.
+
+        :param cache_dir: The local directory caching the footers (default: None).
+        :return: A dictionary with the combined `schema`, the total `num_rows`
+            and `size`, a `files` DataFrame with one row per object and a
+            `row_groups` DataFrame with one row per row group.
+        :rtype: Dict
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> summary = stoa.describe("/tmp/footers")
+            >>> print(summary["schema"], summary["num_rows"])
+        """
+        LOGGER.info(
+            f"Describing product: {self.product_name} | {self.owner_id}...",
+        )
+        keys = self.order()
+        cache = FooterCache(cache_dir)
+        missing = cache.missing(keys)
+        pre_signed_urls = self.sign(keys=missing) if missing else {}
+        metadata = cache.metadata(keys, pre_signed_urls)
+        return describe(metadata, {key: cache.size(key) for key in metadata})
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """
+        Previews the first rows of the product. Objects are signed one at a
+        time, in key order, and only their footers and the leading row
+        groups holding the rows are downloaded, so no other object is signed
+        or read once `n` rows are found.
+
+        :param n: The number of rows to return (default: 5).
+        :return: The first `n` rows of the product.
+        :rtype: pd.DataFrame
+        :raises ValueError: If `n` is smaller than one.
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> stoa.head(10)
+        """
+        if n < 1:
+            raise ValueError("Number of rows must be greater than 0")
+        LOGGER.info(
+            f"Previewing product: {self.product_name} | {self.owner_id}...",
+        )
+        tables = []
+        rows = 0
+        for key in self.order():
+            if rows >= n:
+                break
+            url = self.sign(keys=[key]).get(key)
+            if url is None:
+                continue
+            try:
+                table = read_head(url, n - rows)
+            except Exception as exc:
+                LOGGER.error(f"{url} generated an exception: {exc}")
+                continue
+            tables.append(table)
+            rows += table.num_rows
+        if not tables:
+            return pd.DataFrame()
+        return to_pandas(concat_tables(tables))
 
     def fetch(
         self,
         format: Literal["json", "dataframe"],
+        size_aware: bool = False,
+        filters: Optional[List[Tuple]] = None,
+        cache_dir: Optional[str] = None,
+        dtype_backend: Optional[Literal["numpy_nullable", "pyarrow"]] = None,
+        categorical: bool = False,
+        read_dictionary: Optional[List[str]] = None,
+        optimize_memory: bool = False,
+        sort_by: Optional[str] = None,
+        sample: Optional[float] = None,
+        seed: int = 0,
+        stratify: bool = False,
     ) -> Union[List[Dict], pd.DataFrame]:
         """
         Fetches a message from a predefined source. This method is responsible
         for retrieving messages that are to be processed by the system.
 
         :param format: The format in which to return the fetched data.
+        :param size_aware: Whether to discover the object sizes first, so the
+            largest objects are downloaded first and very large objects are
+            split into parallel ranged chunks (default: False).
+        :param filters: Filters in DNF form, as accepted by `pd.read_parquet`.
+            Objects whose row group statistics rule out any match are neither
+            signed nor downloaded, and the remaining rows are filtered while
+            decoding (default: None).
+        :param cache_dir: The local directory caching footers and statistics
+            used with `filters`, so they are only read once (default: None).
+        :param dtype_backend: "pyarrow" for Arrow-backed dtypes or
+            "numpy_nullable" for nullable dtypes (default: None).
+        :param categorical: Whether to return the columns that are dictionary
+            encoded in the parquet files as categorical columns (default: False).
+        :param read_dictionary: Columns to return as categorical columns (default: None).
+        :param optimize_memory: Whether to downcast numeric columns and
+            categorize low-cardinality string columns of every file before
+            concatenation, logging the bytes saved (default: False).
+        :param sort_by: The column to sort the result by. Files that are
+            already sorted by it are merged rather than sorted again
+            (default: None).
+        :param sample: The approximate fraction of the product to fetch, for
+            a quick look at the data. The square root of the fraction is
+            taken of the row groups of every sampled object, and only the
+            sampled row groups are transferred. The fraction of objects is
+            worked out from the row group counts in the footers, so objects
+            with a single row group, which are read whole, are sampled
+            more sparsely (default: None).
+        :param seed: The seed of the sample (default: 0).
+        :param stratify: Whether to sample every directory of the object
+            keys, such as every partition, separately (default: False).
         :return: The fetched data in the specified format.
         :rtype: List[Dict]
         :raises ValueError: If the format is invalid.
@@ -309,6 +596,8 @@ class StoaClient:
         **example**::
             >>> stoa = StoaClient(**params)
             >>> stoa.fetch(format="json")
+            >>> stoa.fetch(format="dataframe", filters=[("date", ">=", date(2024, 1, 1))])
+            >>> stoa.fetch(format="dataframe", sample=0.01, seed=42)
         """
         LOGGER.info(
             f"Fetching product: {self.product_name} | {self.owner_id}...",
@@ -316,13 +605,598 @@ class StoaClient:
         if format not in ["json", "dataframe"]:
             raise ValueError("Invalid format")
 
-        self.order()
-        self.sign()
-        dataframe = fetch(
-            pre_signed_urls=self.signatures,
-        )
+        if sample:
+            fraction = math.sqrt(sample)
+            pre_signed_urls = self._signed(
+                filters,
+                cache_dir,
+                sample=sample,
+                seed=seed,
+                stratify=stratify,
+                row_group_fraction=fraction,
+            )
+            dataframe = fetch_sample(
+                pre_signed_urls=pre_signed_urls,
+                fraction=fraction,
+                seed=seed,
+                filters=filters,
+                dtype_backend=dtype_backend,
+                read_dictionary=read_dictionary,
+                categorical=categorical,
+            )
+            if optimize_memory:
+                dataframe = optimize_dtypes(dataframe)
+            if sort_by and not dataframe.empty:
+                dataframe = dataframe.sort_values(sort_by, kind="stable")
+        elif size_aware:
+            plan = self.plan(size_aware=True, filters=filters, cache_dir=cache_dir)
+            if plan.entries:
+                dataframe = execute(
+                    plan,
+                    hedge=self.fetch_hedge,
+                    host_cache=self.host_cache,
+                    filters=filters,
+                    dtype_backend=dtype_backend,
+                    read_dictionary=read_dictionary,
+                    categorical=categorical,
+                    optimize_memory=optimize_memory,
+                    sort_by=sort_by,
+                )
+            else:
+                dataframe = pd.DataFrame()
+        else:
+            row_groups: Dict[str, List[int]] = {}
+            pre_signed_urls = self._signed(filters, cache_dir, row_groups=row_groups)
+            if pre_signed_urls:
+                dataframe = fetch(
+                    pre_signed_urls=pre_signed_urls,
+                    hedge=self.fetch_hedge,
+                    host_cache=self.host_cache,
+                    filters=filters,
+                    dtype_backend=dtype_backend,
+                    read_dictionary=read_dictionary,
+                    categorical=categorical,
+                    optimize_memory=optimize_memory,
+                    sort_by=sort_by,
+                    row_groups=row_groups,
+                )
+            else:
+                dataframe = pd.DataFrame()
 
         if format == "json":
             return dataframe.to_dict(orient="records")
         elif format == "dataframe":
             return dataframe
+
+    def _signed(
+        self,
+        filters: Optional[List[Tuple]] = None,
+        cache_dir: Optional[str] = None,
+        sample: Optional[float] = None,
+        seed: int = 0,
+        stratify: bool = False,
+        row_group_fraction: Optional[float] = None,
+        row_groups: Optional[Dict[str, List[int]]] = None,
+    ) -> Dict:
+        """
+        Orders and signs the product, leaving out the objects that cannot
+        match the filters and, with a sample, the objects not sampled.
+
+        :param filters: Filters in DNF form (default: None).
+        :param cache_dir: The local directory caching footers and statistics.
+        :param sample: The fraction of the objects to sample or, with a row
+            group fraction, of the product (default: None).
+        :param seed: The seed of the sample (default: 0).
+        :param stratify: Whether to sample every directory separately (default: False).
+        :param row_group_fraction: The fraction of row groups that will be
+            read from every sampled object (default: None).
+        :param row_groups: Filled with the row groups that may match the
+            filters of the objects of which only some may match (default: None).
+        :return: The pre-signed URLs of the objects to fetch, in key order.
+        """
+        keys = self.order()
+        if not filters and not sample:
+            return self.sign(keys=keys)
+        signatures = {}
+        partial: Dict[str, List[int]] = {}
+        if filters:
+            keys, signatures, partial = self._prune(keys, filters, cache_dir)
+        if sample and keys:
+            if row_group_fraction is not None:
+                sample = self._object_fraction(
+                    keys, signatures, cache_dir, sample, row_group_fraction
+                )
+            keys = sample_keys(keys, sample, seed=seed, stratify=stratify)
+        unsigned = [key for key in keys if key not in signatures]
+        if unsigned:
+            signatures.update(self.sign(keys=unsigned))
+        if row_groups is not None:
+            row_groups.update({key: partial[key] for key in keys if key in partial})
+        return {key: signatures[key] for key in keys}
+
+    def _object_fraction(
+        self,
+        keys: List[str],
+        signatures: Dict,
+        cache_dir: Optional[str],
+        sample: float,
+        row_group_fraction: float,
+    ) -> float:
+        """
+        Works out the fraction of objects to sample from the row group counts
+        in the footers of the objects. Objects whose footer is not cached are
+        signed to read it, and their pre-signed URLs are added to `signatures`.
+
+        :param keys: The ordered keys.
+        :param signatures: The pre-signed URLs signed so far, updated in place.
+        :param cache_dir: The local directory caching footers.
+        :param sample: The fraction of the product to fetch.
+        :param row_group_fraction: The fraction of row groups read from every
+            sampled object.
+        :return: The fraction of the objects to sample.
+        """
+        cache = FooterCache(cache_dir)
+        unsigned = [key for key in cache.missing(keys) if key not in signatures]
+        if unsigned:
+            signatures.update(self.sign(keys=unsigned))
+        metadata = cache.metadata(keys, signatures)
+        fraction = object_fraction(
+            [file.num_row_groups for file in metadata.values()],
+            sample,
+            row_group_fraction,
+            weights=[cache.size(key) for key in metadata],
+        )
+        LOGGER.info(f"Sampling {fraction:.2%} of the objects of the product")
+        return fraction
+
+    def _prune(
+        self,
+        keys: List[str],
+        filters: List[Tuple],
+        cache_dir: Optional[str] = None,
+    ) -> Tuple[List[str], Dict, Dict[str, List[int]]]:
+        """
+        Prunes ordered keys with the row group statistics of the product.
+        Objects missing from the statistics index have their footers read,
+        which signs the objects whose footer is not cached either.
+
+        :param keys: The ordered keys.
+        :param filters: Filters in DNF form.
+        :param cache_dir: The local directory caching footers and statistics.
+        :return: The keys that may match, the pre-signed URLs of those
+            signed while reading footers, and the row groups that may match
+            of the objects of which only some may.
+        """
+        cache = FooterCache(cache_dir)
+        index = StatisticsIndex(
+            os.path.join(self._product_path(cache_dir), "statistics.json")
+            if cache_dir
+            else None
+        )
+        signatures = {}
+        missing = index.missing(keys)
+        if missing:
+            unsigned = cache.missing(missing)
+            if unsigned:
+                signatures = self.sign(keys=unsigned)
+            for key, metadata in cache.metadata(missing, signatures).items():
+                index.add(key, metadata)
+            index.save()
+        candidates = index.prune(keys, filters)
+        LOGGER.info(
+            f"({len(candidates)}) of ({len(keys)}) objects may match the filters"
+        )
+        row_groups = index.partial_row_groups(candidates, filters)
+        LOGGER.info(f"({len(row_groups)}) objects are read by matching row groups")
+        return (
+            candidates,
+            {key: signatures[key] for key in candidates if key in signatures},
+            row_groups,
+        )
+
+    def _product_path(self, directory: str) -> str:
+        """
+        Returns the local directory of this client's product below a directory.
+
+        :param directory: The local directory.
+        :return: The local directory of the product.
+        """
+        return local_path(
+            directory,
+            "/".join(
+                [
+                    self.product_group_name,
+                    self.product_name,
+                    self.owner_id,
+                    self.version,
+                ]
+            ),
+        )
+
+    @ensure_authenticated
+    def fetch_many(
+        self,
+        specs: Iterable[Union[ProductSpec, Sequence[str]]],
+        format: Literal["json", "dataframe"] = "dataframe",
+        max_workers: int = 10,
+        size_aware: bool = False,
+        filters: Optional[List[Tuple]] = None,
+        dtype_backend: Optional[Literal["numpy_nullable", "pyarrow"]] = None,
+        categorical: bool = False,
+        read_dictionary: Optional[List[str]] = None,
+        optimize_memory: bool = False,
+        sort_by: Optional[str] = None,
+    ) -> Dict[ProductSpec, Union[List[Dict], pd.DataFrame]]:
+        """
+        Fetches several products with one authentication and one shared pool
+        of workers. The products are ordered concurrently, the keys of all
+        products are signed interleaved, and all objects are downloaded
+        through the same pool. The workspace, pagination, sharding, hedging
+        and host cache of this client apply to every product, and every
+        product is decoded with the same options as by `fetch`.
+
+        :param specs: The products to fetch, as ProductSpec tuples or
+            (product_group_name, product_name, owner_id[, version]) sequences.
+        :param format: The format in which to return the fetched data.
+        :param max_workers: The number of parallel requests.
+        :param size_aware: Whether to discover the object sizes first, so the
+            largest objects are downloaded first and very large objects are
+            split into parallel ranged chunks (default: False).
+        :param filters: Filters in DNF form, applied while decoding (default: None).
+        :param dtype_backend: "pyarrow" for Arrow-backed dtypes or
+            "numpy_nullable" for nullable dtypes (default: None).
+        :param categorical: Whether to return the columns that are dictionary
+            encoded in the parquet files as categorical columns (default: False).
+        :param read_dictionary: Columns to return as categorical columns (default: None).
+        :param optimize_memory: Whether to downcast numeric columns and
+            categorize low-cardinality string columns of every file before
+            concatenation, logging the bytes saved (default: False).
+        :param sort_by: The column to sort every product by (default: None).
+        :return: The fetched data of every product, keyed by product. Products
+            that fail to order are logged and left out.
+        :rtype: Dict[ProductSpec, Union[List[Dict], pd.DataFrame]]
+        :raises ValueError: If the format or the workspace is invalid.
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> dataframes = stoa.fetch_many(
+            ...     [("group", "product1", "owner"), ("group", "product2", "owner")]
+            ... )
+        """
+        if format not in ["json", "dataframe"]:
+            raise ValueError("Invalid format")
+        if self.workspace not in ["apps", "cart"]:
+            raise ValueError("Invalid workspace.")
+
+        specs = [ProductSpec(*spec) for spec in specs]
+        LOGGER.info(f"Fetching ({len(specs)}) products...")
+
+        ordered: Dict[ProductSpec, List[str]] = {}
+        signed: Dict[tuple, str] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_spec = {
+                executor.submit(self._order_keys, spec): spec for spec in specs
+            }
+            future_to_key = {}
+            for future in as_completed(future_to_spec):
+                spec = future_to_spec[future]
+                try:
+                    ordered[spec] = future.result()
+                except Exception as exc:
+                    LOGGER.error(f"{spec} order generated an exception: {exc}")
+                    continue
+                for key in ordered[spec]:
+                    future_to_key[executor.submit(self._sign_key, key)] = (spec, key)
+            for future in as_completed(future_to_key):
+                spec, key = future_to_key[future]
+                try:
+                    signed[spec, key] = future.result()
+                except Exception as exc:
+                    LOGGER.error(f"{key} sign generated an exception: {exc}")
+
+        groups = {
+            spec: {
+                key: signed[spec, key] for key in ordered[spec] if (spec, key) in signed
+            }
+            for spec in specs
+            if spec in ordered
+        }
+        sizes = None
+        if size_aware:
+            sizes = discover_sizes(
+                {key: url for urls in groups.values() for key, url in urls.items()},
+                max_workers=max_workers,
+            )
+        dataframes = fetch_grouped(
+            groups=groups,
+            hedge=self.fetch_hedge,
+            max_workers=max_workers,
+            sizes=sizes,
+            host_cache=self.host_cache,
+            filters=filters,
+            dtype_backend=dtype_backend,
+            read_dictionary=read_dictionary,
+            categorical=categorical,
+            optimize_memory=optimize_memory,
+            sort_by=sort_by,
+        )
+        if format == "json":
+            return {
+                spec: dataframe.to_dict(orient="records")
+                for spec, dataframe in dataframes.items()
+            }
+        return dataframes
+
+    def aggregate(
+        self,
+        map_fn: Callable[[pd.DataFrame], Any],
+        combine_fn: Callable[[Any, Any], Any],
+        max_workers: int = 10,
+    ) -> Any:
+        """
+        Aggregates the product without concatenating it. Every file is
+        reduced by `map_fn` as soon as it is decoded, in parallel, and the
+        partial results are merged by `combine_fn` as they complete.
+
+        :param map_fn: Reduces the DataFrame of one file to a partial result.
+        :param combine_fn: Combines two partial results; it must be
+            associative and commutative.
+        :param max_workers: The number of files fetched and mapped at a time.
+        :return: The combined result, or None if no file was fetched.
+        :rtype: Any
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> rows = stoa.aggregate(len, lambda a, b: a + b)
+        """
+        LOGGER.info(
+            f"Aggregating product: {self.product_name} | {self.owner_id}...",
+        )
+        return aggregate(
+            pre_signed_urls=self.sign(keys=self.order()),
+            map_fn=map_fn,
+            combine_fn=combine_fn,
+            hedge=self.fetch_hedge,
+            max_workers=max_workers,
+        )
+
+    def groupby(
+        self,
+        by: Union[str, List[str]],
+        agg: Dict[str, Union[str, List[str]]],
+        max_workers: int = 10,
+    ) -> pd.DataFrame:
+        """
+        Computes a group-by aggregation of the product, aggregating every
+        file as it is decoded and merging the partial aggregates, so memory
+        is proportional to the number of groups rather than rows.
+
+        :param by: The column or columns to group by.
+        :param agg: Aggregation functions keyed by column: "sum", "count",
+            "min", "max", "mean" or "size", or a list of them.
+        :param max_workers: The number of files fetched and aggregated at a time.
+        :return: The aggregated DataFrame, indexed by group.
+        :rtype: pd.DataFrame
+        :raises ValueError: If an aggregation function is not supported.
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> totals = stoa.groupby("country", {"amount": ["sum", "mean"]})
+        """
+        LOGGER.info(
+            f"Aggregating product: {self.product_name} | {self.owner_id}...",
+        )
+        return groupby_agg(
+            pre_signed_urls=self.sign(keys=self.order()),
+            by=by,
+            agg=agg,
+            hedge=self.fetch_hedge,
+            max_workers=max_workers,
+        )
+
+    def iter_frames(
+        self,
+        prefetch: int = 2,
+        prefetch_bytes: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Fetches the product as a stream of DataFrames, one per file, in key
+        order. While the caller works on a file, the next files are
+        downloaded and decoded in the background, so processing and I/O
+        overlap.
+
+        :param prefetch: The maximum number of files fetched ahead of the caller.
+        :param prefetch_bytes: The maximum size in bytes of the files fetched
+            ahead of the caller. The object sizes are discovered first
+            (default: None).
+        :return: An iterator over the DataFrames of the files.
+        :rtype: Iterator[pd.DataFrame]
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> for dataframe in stoa.iter_frames(prefetch=4):
+            ...     print(len(dataframe))
+        """
+        LOGGER.info(
+            f"Streaming product: {self.product_name} | {self.owner_id}...",
+        )
+        pre_signed_urls = self.sign(keys=self.order())
+        yield from iter_frames(
+            pre_signed_urls=pre_signed_urls,
+            prefetch=prefetch,
+            prefetch_bytes=prefetch_bytes,
+            sizes=discover_sizes(pre_signed_urls) if prefetch_bytes else None,
+            hedge=self.fetch_hedge,
+        )
+
+    def iter_records(self, batch_size: int = 65536) -> Iterator[Dict]:
+        """
+        Fetches the product as a stream of records. Records are decoded
+        batch by batch from the underlying Arrow record batches, so the
+        full list of records is never materialised.
+
+        :param batch_size: The number of records decoded at a time.
+        :return: An iterator over the fetched records.
+        :rtype: Iterator[Dict]
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> for record in stoa.iter_records():
+            ...     print(record)
+        """
+        LOGGER.info(
+            f"Streaming product: {self.product_name} | {self.owner_id}...",
+        )
+        yield from iter_records(
+            pre_signed_urls=self.sign(keys=self.order()),
+            batch_size=batch_size,
+        )
+
+    def to_ndjson(
+        self,
+        destination: Union[str, IO[str]],
+        batch_size: int = 65536,
+    ) -> int:
+        """
+        Fetches the product and writes it as newline delimited JSON to a
+        file or stream, batch by batch.
+
+        :param destination: A file path or a writable text stream.
+        :param batch_size: The number of records decoded at a time.
+        :return: The number of records written.
+        :rtype: int
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> stoa.to_ndjson("product.ndjson")
+        """
+        LOGGER.info(
+            f"Streaming product: {self.product_name} | {self.owner_id}...",
+        )
+        return to_ndjson(
+            pre_signed_urls=self.sign(keys=self.order()),
+            destination=destination,
+            batch_size=batch_size,
+        )
+
+    def fetch_to_dataset(
+        self,
+        path: str,
+        partition_by: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        Fetches the product and writes it to a local directory instead of
+        returning it. Without partitioning the files are copied byte for
+        byte; with partitioning they are rewritten as a hive partitioned
+        parquet dataset.
+
+        :param path: The local directory to write to.
+        :param partition_by: Columns to partition the dataset by (default: None).
+        :return: The paths of the written files.
+        :rtype: List[str]
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> stoa.fetch_to_dataset("/tmp/product", partition_by=["date"])
+        """
+        LOGGER.info(
+            f"Exporting product: {self.product_name} | {self.owner_id} to {path}...",
+        )
+        return fetch_to_dataset(
+            pre_signed_urls=self.sign(keys=self.order()),
+            path=path,
+            partition_by=partition_by,
+        )
+
+    def fetch_incremental(
+        self,
+        cache_dir: str,
+        merge: bool = False,
+        format: Literal["json", "dataframe"] = "dataframe",
+    ) -> Union[List[Dict], pd.DataFrame]:
+        """
+        Fetches only the objects that are new since the last run. A manifest
+        of fetched keys is kept per product, owner and version below the
+        cache directory, together with the fetched files, so only new keys
+        are signed and downloaded.
+
+        :param cache_dir: The local directory holding manifests and files.
+        :param merge: Whether to return the new data merged with the cached
+            data instead of only the new data (default: False).
+        :param format: The format in which to return the fetched data.
+        :return: The fetched data in the specified format.
+        :rtype: Union[List[Dict], pd.DataFrame]
+        :raises ValueError: If the format is invalid.
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> delta = stoa.fetch_incremental("/tmp/cache")
+            >>> everything = stoa.fetch_incremental("/tmp/cache", merge=True)
+        """
+        LOGGER.info(
+            f"Fetching new objects of product: {self.product_name} | {self.owner_id}...",
+        )
+        if format not in ["json", "dataframe"]:
+            raise ValueError("Invalid format")
+
+        manifest = Manifest(self._product_path(cache_dir))
+        new_keys = manifest.new_keys(self.order())
+        LOGGER.info(f"({len(new_keys)}) new objects since {manifest.updated_at}")
+
+        delta = {}
+        if new_keys:
+            delta = fetch_to_directory(
+                pre_signed_urls=self.sign(keys=new_keys),
+                path=manifest.objects_directory,
+                on_complete=manifest.add,
+            )
+            manifest.save()
+
+        files = manifest.files if merge else delta
+        dataframe = read_files([files[key] for key in sorted(files)])
+
+        if format == "json":
+            return dataframe.to_dict(orient="records")
+        return dataframe
+
+    def fetch_resumable(
+        self,
+        job_id: str,
+        directory: str,
+        chunk_size: int = 100,
+    ) -> Dict[str, str]:
+        """
+        Fetches the product into a local directory as a resumable job. Each
+        completed object is journaled as soon as it is on disk, so running
+        the same job id again after a failure skips the completed objects
+        and continues with the remainder. Keys are signed chunk by chunk,
+        right before they are downloaded, so the pre-signed URLs of a long
+        running job do not expire before they are used.
+
+        :param job_id: The identifier of the job.
+        :param directory: The local directory holding the jobs.
+        :param chunk_size: The number of keys signed and downloaded at a time.
+        :return: Dictionary mapping the object keys to local paths.
+        :rtype: Dict[str, str]
+
+        **example**::
+            >>> stoa = StoaClient(**params)
+            >>> files = stoa.fetch_resumable("nightly-2024-06-01", "/tmp/jobs")
+        """
+        keys = self.order()
+        journal = Journal(directory, job_id)
+        remaining = journal.remaining(keys)
+        LOGGER.info(
+            f"Resuming job {job_id}: ({len(keys) - len(remaining)}) completed, "
+            f"({len(remaining)}) remaining",
+        )
+
+        for start in range(0, len(remaining), chunk_size):
+            fetch_to_directory(
+                pre_signed_urls=self.sign(keys=remaining[start : start + chunk_size]),
+                path=journal.objects_directory,
+                on_complete=journal.record,
+            )
+
+        completed = journal.completed
+        return {key: completed[key] for key in keys if key in completed}
@@ -0,0 +1,20 @@
+"""
+manager.spec.py
+
+This module contains the ProductSpec tuple, which identifies a single product
+of the datalake in batch operations spanning several products.
+"""
+
+from typing import NamedTuple
+
+
+class ProductSpec(NamedTuple):
+    """
+    The ProductSpec tuple identifies a product by its product group, name,
+    owner and version.
+    """
+
+    product_group_name: str
+    product_name: str
+    owner_id: str
+    version: str = "1.0"
@@ -0,0 +1,36 @@
+"""
+This module provides the parquet metadata of datalake objects without
+downloading their data.
+
+It exposes the `FooterCache` class, which reads the parquet footer of every
+object with ranged requests and caches it on local disk keyed by object key,
+the `describe` function, which summarises the footers of a product into a
+combined schema, per-file row counts and sizes, and the row group layout, and
+the `StatisticsIndex` class, which prunes objects and row groups that cannot
+match a filter using the column statistics in the footers.
+
+**Example usage**::
+
+    from ds_stoa.metadata import FooterCache, describe
+
+    cache = FooterCache("/tmp/footers")
+    metadata = cache.metadata(order_ids, pre_signed_urls)
+    summary = describe(metadata, {key: cache.size(key) for key in metadata})
+
+    index = StatisticsIndex("/tmp/footers/statistics.json")
+    for key, file in metadata.items():
+        index.add(key, file)
+    keys = index.prune(order_ids, [("date", ">=", datetime.date(2024, 1, 1))])
+"""
+
+from ._describe import describe
+from ._footer import FooterCache, parse_footer, read_footer
+from ._index import StatisticsIndex
+
+__all__ = [
+    "FooterCache",
+    "StatisticsIndex",
+    "describe",
+    "parse_footer",
+    "read_footer",
+]
@@ -0,0 +1,89 @@
+"""
+Module for summarising the parquet metadata of a product.
+
+`Dependencies`:
+- **pandas**: For tabulating files and row groups.
+- **pyarrow**: For reading the schemas of the files.
+- **fetch**: For combining the schemas and reporting schema drift.
+
+`Example usage`::
+
+    summary = describe(cache.metadata(order_ids, pre_signed_urls), sizes)
+    print(summary["schema"])
+    print(summary["files"])
+    print(summary["drift"])
+"""
+
+from typing import Dict, Optional
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from ..fetch import schema_drift, unify_schemas
+
+
+def describe(
+    metadata: Dict[str, pq.FileMetaData],
+    sizes: Optional[Dict[str, int]] = None,
+) -> Dict:
+    """
+    Summarise the metadata of the files of a product.
+
+    :param metadata: File metadata keyed by object key.
+    :type metadata: Dict[str, pq.FileMetaData]
+    :param sizes: Object sizes in bytes, keyed by object key (default: None).
+    :type sizes: Optional[Dict[str, int]]
+    :return: A dictionary with the combined `schema`, the total `num_rows` and
+        `size`, a `files` DataFrame with one row per file, a `row_groups`
+        DataFrame with one row per row group, and the schema `drift` of
+        every file that differs from the combined schema.
+    :rtype: Dict
+
+    **Example**::
+
+        summary = describe({"file1": pq.read_metadata("/tmp/data.parquet")})
+    """
+    sizes = sizes or {}
+    files = pd.DataFrame(
+        [
+            {
+                "key": key,
+                "num_rows": file.num_rows,
+                "num_row_groups": file.num_row_groups,
+                "num_columns": file.num_columns,
+                "size": sizes.get(key),
+                "created_by": file.created_by,
+            }
+            for key, file in metadata.items()
+        ],
+        columns=[
+            "key",
+            "num_rows",
+            "num_row_groups",
+            "num_columns",
+            "size",
+            "created_by",
+        ],
+    )
+    row_groups = pd.DataFrame(
+        [
+            {
+                "key": key,
+                "row_group": index,
+                "num_rows": file.row_group(index).num_rows,
+                "total_byte_size": file.row_group(index).total_byte_size,
+            }
+            for key, file in metadata.items()
+            for index in range(file.num_row_groups)
+        ],
+        columns=["key", "row_group", "num_rows", "total_byte_size"],
+    )
+    schemas = {key: file.schema.to_arrow_schema() for key, file in metadata.items()}
+    return {
+        "schema": unify_schemas(list(schemas.values())),
+        "num_rows": int(files["num_rows"].sum()),
+        "size": int(files["size"].fillna(0).sum()),
+        "files": files,
+        "row_groups": row_groups,
+        "drift": schema_drift(schemas),
+    }
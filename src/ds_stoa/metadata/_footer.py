@@ -0,0 +1,264 @@
+"""
+Module for reading and caching parquet footers of datalake objects.
+
+A parquet file ends with its footer: the schema, the row groups and the
+column statistics, followed by the footer length and the `PAR1` magic. This
+module reads only that tail with ranged requests and caches it on local disk,
+keyed by object key, so the metadata of a product is available without
+downloading any data, and without any request at all once it is cached.
+
+`Dependencies`:
+- **pyarrow**: For parsing parquet footers.
+- **concurrent.futures**: For parallel footer reads.
+- **fetch**: For ranged reads and mapping object keys to local paths.
+- **utils.logger**: For logging errors and information.
+
+`Example usage`::
+
+    cache = FooterCache("/tmp/footers")
+    metadata = cache.metadata(order_ids, pre_signed_urls)
+    print(metadata["file1"].num_rows)
+"""
+
+import base64
+import json
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..fetch import RangedFile, local_path
+from ..utils.logger import LOGGER
+
+MAGIC = b"PAR1"
+
+
+def read_footer(
+    url: str,
+    size: Optional[int] = None,
+    tail: int = 64 << 10,
+) -> Tuple[bytes, int]:
+    """
+    Read the footer of a remote parquet file. The last `tail` bytes are read
+    in one request, which holds the whole footer of most files; larger
+    footers take a second request for the remainder.
+
+    :param url: The pre-signed URL of the parquet file.
+    :type url: str
+    :param size: The size of the file in bytes, discovered if not given.
+    :type size: Optional[int]
+    :param tail: The number of bytes read from the end of the file first.
+    :type tail: int
+    :return: The footer, including its length and magic, and the file size.
+    :rtype: Tuple[bytes, int]
+    :raises ValueError: If the object is not a parquet file.
+
+    **Example**::
+
+        footer, size = read_footer("http://example.com/data.parquet")
+    """
+    file = RangedFile(url, size=size)
+    file.seek(-min(tail, file.size), os.SEEK_END)
+    data = file.read()
+    if len(data) < 8 or data[-4:] != MAGIC:
+        raise ValueError(f"{url} is not a parquet file")
+    length = struct.unpack("<I", data[-8:-4])[0] + 8
+    if length > file.size:
+        raise ValueError(f"{url} has an invalid parquet footer")
+    if length > len(data):
+        file.seek(-length, os.SEEK_END)
+        data = file.read(length - len(data)) + data
+    return data[-length:], file.size
+
+
+def parse_footer(footer: bytes) -> pq.FileMetaData:
+    """
+    Parse a parquet footer into file metadata.
+
+    :param footer: The footer, including its length and magic.
+    :type footer: bytes
+    :return: The file metadata.
+    :rtype: pq.FileMetaData
+
+    **Example**::
+
+        metadata = parse_footer(footer)
+    """
+    return pq.read_metadata(pa.BufferReader(footer))
+
+
+class FooterCache:
+    """
+    The FooterCache class keeps the parquet footers of datalake objects,
+    keyed by object key, in memory and optionally as JSON files on disk.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """
+        Constructor for the FooterCache class.
+
+        :param directory: The local directory holding the cached footers,
+            or None to cache in memory only (default: None).
+        """
+        self.directory = directory
+        self._entries: Dict[str, Dict] = {}
+
+    def path(self, key: str) -> str:
+        """
+        Returns the local path of the cached footer of an object.
+
+        :param key: The object key.
+        :return: The local path of the cached footer.
+        """
+        return f"{local_path(self.directory, key)}.json"
+
+    def contains(self, key: str) -> bool:
+        """
+        Checks if the footer of an object is cached.
+
+        :param key: The object key.
+        :return: True if the footer is cached.
+        """
+        return self._load(key) is not None
+
+    def missing(self, keys: List[str]) -> List[str]:
+        """
+        Returns the keys whose footer is not cached, in their original order.
+
+        :param keys: The object keys.
+        :return: The keys that need a pre-signed URL to be described.
+        """
+        return [key for key in keys if not self.contains(key)]
+
+    def size(self, key: str) -> int:
+        """
+        Returns the size of a cached object.
+
+        :param key: The object key.
+        :return: The size of the object in bytes.
+        :raises KeyError: If the footer of the object is not cached.
+        """
+        entry = self._load(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry["size"]
+
+    def footer(self, key: str) -> bytes:
+        """
+        Returns the cached footer of an object.
+
+        :param key: The object key.
+        :return: The footer, including its length and magic.
+        :raises KeyError: If the footer of the object is not cached.
+        """
+        entry = self._load(key)
+        if entry is None:
+            raise KeyError(key)
+        return base64.b64decode(entry["footer"])
+
+    def get(
+        self,
+        key: str,
+        url: Optional[str] = None,
+        size: Optional[int] = None,
+    ) -> pq.FileMetaData:
+        """
+        Returns the metadata of an object, reading and caching its footer
+        if it is not cached yet.
+
+        :param key: The object key.
+        :param url: The pre-signed URL of the object, needed if it is not cached.
+        :param size: The size of the object in bytes, if known (default: None).
+        :return: The file metadata.
+        :raises KeyError: If the footer is not cached and no URL is given.
+        """
+        if not self.contains(key):
+            if url is None:
+                raise KeyError(key)
+            footer, size = read_footer(url, size=size)
+            self.add(key, footer, size)
+        return parse_footer(self.footer(key))
+
+    def add(self, key: str, footer: bytes, size: int) -> None:
+        """
+        Caches the footer of an object, on disk if the cache has a directory.
+
+        :param key: The object key.
+        :param footer: The footer, including its length and magic.
+        :param size: The size of the object in bytes.
+        """
+        entry = {
+            "key": key,
+            "size": size,
+            "footer": base64.b64encode(footer).decode("ascii"),
+        }
+        self._entries[key] = entry
+        if self.directory is None:
+            return
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial = f"{path}.{os.getpid()}.part"
+        with open(partial, "w", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(partial, path)
+
+    def metadata(
+        self,
+        keys: List[str],
+        pre_signed_urls: Optional[Dict] = None,
+        sizes: Optional[Dict[str, int]] = None,
+        max_workers: int = 10,
+    ) -> Dict[str, pq.FileMetaData]:
+        """
+        Returns the metadata of several objects, reading the footers that
+        are not cached yet in parallel. Objects whose footer cannot be read
+        are logged and left out.
+
+        :param keys: The object keys.
+        :param pre_signed_urls: Pre-signed URLs of the objects that are not cached.
+        :param sizes: Object sizes in bytes, keyed by object key (default: None).
+        :param max_workers: The number of parallel footer reads.
+        :return: A dictionary mapping object keys to file metadata, in key order.
+        """
+        pre_signed_urls = pre_signed_urls or {}
+        sizes = sizes or {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_key = {
+                executor.submit(
+                    self.get, key, pre_signed_urls.get(key), sizes.get(key)
+                ): key
+                for key in keys
+            }
+            metadata = {}
+            for future in as_completed(future_to_key):
+                key = future_to_key[future]
+                try:
+                    metadata[key] = future.result()
+                except Exception as exc:
+                    LOGGER.error(f"{key} footer read generated an exception: {exc}")
+        return {key: metadata[key] for key in keys if key in metadata}
+
+    def _load(self, key: str) -> Optional[Dict]:
+        """
+        Returns the cache entry of an object, loading it from disk if needed.
+
+        :param key: The object key.
+        :return: The cache entry, or None if the footer is not cached.
+        """
+        if key in self._entries:
+            return self._entries[key]
+        if self.directory is None:
+            return None
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except json.JSONDecodeError:
+            return None
+        self._entries[key] = entry
+        return entry
@@ -0,0 +1,314 @@
+"""
+Module for pruning datalake objects with parquet statistics.
+
+This module provides the `StatisticsIndex` class, a local index of the
+min/max/null-count statistics of every row group of every object of a
+product, taken from the parquet footers. Given filters in the DNF form used by
+pyarrow and pandas, the index tells which objects, and which row groups
+within them, may contain matching rows, so the others are never signed or
+downloaded. Pruning is conservative: a column without statistics, or a value
+that cannot be compared with them, always counts as a possible match.
+
+`Dependencies`:
+- **json**: For persisting the index, with tagged non-JSON values.
+- **pyarrow**: For reading statistics from parquet metadata.
+
+`Example usage`::
+
+    index = StatisticsIndex("/tmp/footers/statistics.json")
+    index.add("file1", pq.read_metadata("/tmp/data1.parquet"))
+    index.save()
+    keys = index.prune(order_ids, [("date", ">=", datetime.date(2024, 1, 1))])
+"""
+
+import base64
+import json
+import os
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import pyarrow.parquet as pq
+
+Filters = Union[List[Tuple], List[List[Tuple]]]
+
+
+def _encode(value: Any) -> Any:
+    """
+    Encode a statistics value as JSON, tagging types JSON cannot represent.
+
+    :param value: The value.
+    :return: The JSON compatible value.
+    """
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, time):
+        return {"$time": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    if isinstance(value, bytes):
+        return {"$bytes": base64.b64encode(value).decode("ascii")}
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """
+    Decode a value encoded by `_encode`.
+
+    :param value: The JSON value.
+    :return: The statistics value.
+    """
+    if not isinstance(value, dict):
+        return value
+    ((tag, body),) = value.items()
+    if tag == "$datetime":
+        return datetime.fromisoformat(body)
+    if tag == "$date":
+        return date.fromisoformat(body)
+    if tag == "$time":
+        return time.fromisoformat(body)
+    if tag == "$decimal":
+        return Decimal(body)
+    if tag == "$bytes":
+        return base64.b64decode(body)
+    raise ValueError(f"Unknown statistics type: {tag}")
+
+
+def _normalize(filters: Filters) -> List[List[Tuple]]:
+    """
+    Normalize filters into a disjunction of conjunctions.
+
+    :param filters: A list of predicates, or a list of lists of predicates.
+    :return: A list of lists of predicates.
+    """
+    if filters and isinstance(filters[0], tuple):
+        return [list(filters)]
+    return [list(conjunction) for conjunction in filters]
+
+
+def _may_match(statistics: Optional[Dict], op: str, value: Any) -> bool:
+    """
+    Check if a row group may contain rows matching a predicate.
+
+    :param statistics: The statistics of the column in the row group.
+    :param op: The comparison operator.
+    :param value: The value compared with.
+    :return: False only if the statistics prove that no row matches.
+    """
+    if not statistics or "min" not in statistics:
+        return True
+    low, high = statistics["min"], statistics["max"]
+    try:
+        if op in ("=", "=="):
+            return low <= value <= high
+        if op == "!=":
+            return not low == value == high
+        if op == "<":
+            return low < value
+        if op == "<=":
+            return low <= value
+        if op == ">":
+            return high > value
+        if op == ">=":
+            return high >= value
+        if op == "in":
+            return any(low <= item <= high for item in value)
+        if op == "not in":
+            return not (low == high and low in value)
+    except TypeError:
+        return True
+    raise ValueError(f"Invalid filter operator: {op}")
+
+
+class StatisticsIndex:
+    """
+    The StatisticsIndex class keeps the column statistics of every row
+    group of a product's objects and prunes objects and row groups that
+    cannot match a filter.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Constructor for the StatisticsIndex class. Loads the index from the
+        path if it exists.
+
+        :param path: The JSON file persisting the index, or None to keep it
+            in memory only (default: None).
+        """
+        self.path = path
+        self._objects: Dict[str, List[Dict]] = {}
+        self.load()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._objects
+
+    def missing(self, keys: Sequence[str]) -> List[str]:
+        """
+        Returns the keys that are not indexed, in their original order.
+
+        :param keys: The object keys.
+        :return: The keys whose statistics are unknown.
+        """
+        return [key for key in keys if key not in self._objects]
+
+    def add(self, key: str, metadata: pq.FileMetaData) -> None:
+        """
+        Indexes the statistics of an object from its parquet metadata.
+
+        :param key: The object key.
+        :param metadata: The parquet metadata of the object.
+        """
+        row_groups = []
+        for index in range(metadata.num_row_groups):
+            row_group = metadata.row_group(index)
+            columns = {}
+            for position in range(row_group.num_columns):
+                column = row_group.column(position)
+                statistics = column.statistics
+                if statistics is None:
+                    continue
+                entry = {}
+                if statistics.has_null_count:
+                    entry["null_count"] = statistics.null_count
+                if statistics.has_min_max:
+                    entry["min"] = statistics.min
+                    entry["max"] = statistics.max
+                columns[column.path_in_schema] = entry
+            row_groups.append({"num_rows": row_group.num_rows, "columns": columns})
+        self._objects[key] = row_groups
+
+    def statistics(self, key: str) -> Dict[str, Dict]:
+        """
+        Returns the statistics of an object, combined over its row groups.
+        Columns without statistics in any row group are left out.
+
+        :param key: The object key.
+        :return: Dictionary mapping column names to min, max and null count.
+        """
+        row_groups = self._objects[key]
+        names = (
+            set.intersection(*(set(row_group["columns"]) for row_group in row_groups))
+            if row_groups
+            else set()
+        )
+        combined = {}
+        for name in sorted(names):
+            columns = [row_group["columns"][name] for row_group in row_groups]
+            entry = {}
+            if all("null_count" in column for column in columns):
+                entry["null_count"] = sum(column["null_count"] for column in columns)
+            if all("min" in column for column in columns):
+                try:
+                    entry["min"] = min(column["min"] for column in columns)
+                    entry["max"] = max(column["max"] for column in columns)
+                except TypeError:
+                    pass
+            combined[name] = entry
+        return combined
+
+    def row_groups(self, key: str, filters: Filters) -> List[int]:
+        """
+        Returns the row groups of an object that may match the filters.
+
+        :param key: The object key.
+        :param filters: Filters in DNF form, as accepted by `pd.read_parquet`.
+        :return: The indices of the row groups that may match.
+        """
+        disjunction = _normalize(filters)
+        return [
+            index
+            for index, row_group in enumerate(self._objects[key])
+            if any(
+                all(
+                    _may_match(row_group["columns"].get(name), op, value)
+                    for name, op, value in conjunction
+                )
+                for conjunction in disjunction
+            )
+        ]
+
+    def partial_row_groups(
+        self, keys: Sequence[str], filters: Filters
+    ) -> Dict[str, List[int]]:
+        """
+        Returns the row groups that may match the filters of the indexed
+        objects of which only some row groups may match, so the others need
+        not be transferred.
+
+        :param keys: The object keys.
+        :param filters: Filters in DNF form, as accepted by `pd.read_parquet`.
+        :return: Dictionary mapping object keys to the indices of the row
+            groups that may match.
+        """
+        partial = {}
+        for key in keys:
+            if key not in self._objects:
+                continue
+            row_groups = self.row_groups(key, filters)
+            if row_groups and len(row_groups) < len(self._objects[key]):
+                partial[key] = row_groups
+        return partial
+
+    def prune(self, keys: Sequence[str], filters: Filters) -> List[str]:
+        """
+        Returns the keys of the objects that may match the filters, in their
+        original order. Objects that are not indexed are always kept.
+
+        :param keys: The object keys.
+        :param filters: Filters in DNF form, as accepted by `pd.read_parquet`.
+        :return: The keys of the objects that may contain matching rows.
+        """
+        return [
+            key
+            for key in keys
+            if key not in self._objects or self.row_groups(key, filters)
+        ]
+
+    def load(self) -> None:
+        """
+        Loads the index from disk, starting empty if it does not exist.
+        """
+        if self.path is None or not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as file:
+            body = json.load(file)
+        self._objects = {
+            key: [
+                {
+                    "num_rows": row_group["num_rows"],
+                    "columns": {
+                        name: {field: _decode(value) for field, value in entry.items()}
+                        for name, entry in row_group["columns"].items()
+                    },
+                }
+                for row_group in row_groups
+            ]
+            for key, row_groups in body.get("objects", {}).items()
+        }
+
+    def save(self) -> None:
+        """
+        Saves the index to disk, replacing the previous version atomically.
+        """
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        partial = f"{self.path}.{os.getpid()}.part"
+        objects = {
+            key: [
+                {
+                    "num_rows": row_group["num_rows"],
+                    "columns": {
+                        name: {field: _encode(value) for field, value in entry.items()}
+                        for name, entry in row_group["columns"].items()
+                    },
+                }
+                for row_group in row_groups
+            ]
+            for key, row_groups in self._objects.items()
+        }
+        with open(partial, "w", encoding="utf-8") as file:
+            json.dump({"objects": objects}, file)
+        os.replace(partial, self.path)
@@ -7,11 +7,14 @@ to order products or services.
 The `order` function is designed to be used by other parts of the
 application that require interaction with the Stoa API for placing
 orders. It simplifies the API interaction by abstracting the details
-of the HTTP request and response handling.
+of the HTTP request and response handling. The `shard` function partitions
+the ordered keys deterministically, so several nodes can each fetch their
+own slice of a product without coordination, and `sample_keys` selects a
+seeded random or stratified subset of the keys for exploratory fetches.
 
 **Example Usage**::
 
-    from ds_stoa.order import order
+    from ds_stoa.order import order, sample_keys, shard
 
     # Authentication token and parameters for the order
     token = "your_auth_token"
@@ -29,8 +32,16 @@ of the HTTP request and response handling.
     # Send an order request
     order_ids = order(token=token, params=params)
     print(order_ids)
+
+    # Keep only the keys of the second of four nodes
+    order_ids = shard(order_ids, shard_index=1, num_shards=4)
+
+    # Keep a reproducible tenth of the keys
+    order_ids = sample_keys(order_ids, fraction=0.1, seed=42)
 """
 
 from ._order import order
+from ._sample import sample_keys
+from ._shard import shard
 
-__all__ = ["order"]
+__all__ = ["order", "sample_keys", "shard"]
@@ -16,6 +16,7 @@ that was placed.
 Dependencies:
 - requests: For making HTTP requests to the Stoa API.
 - os: For reading environment variables to determine the running environment.
+- utils.decorators: For pacing requests with the shared rate limiter.
 - utils.exceptions: For enriching HTTP exceptions with more context.
 - utils.logger: For logging information about the order request and its outcome.
 
@@ -45,12 +46,14 @@ import os
 import requests
 from typing import Dict, List
 
+from ..utils.decorators import rate_limited
 from ..utils.exceptions import enrich_http_exception
 from ..utils.logger import LOGGER
 
 BUILDING_MODE = os.getenv("BUILDING_MODE", default="dev")
 
 
+@rate_limited("order")
 def order(token: str, params: Dict) -> List[str]:
     """
     Send order request to Stoa API.
@@ -0,0 +1,58 @@
+"""
+This module provides seeded sampling of ordered keys, so exploratory fetches
+download a small, reproducible subset of a product.
+
+A random sample draws keys uniformly from the whole product. A stratified
+sample draws the same fraction from every directory of the keys, such as
+every partition of a partitioned product, so each of them is represented.
+
+**Example Usage**::
+
+    from ds_stoa.order import sample_keys
+
+    keys = ["date=2024-01-01/a.parquet", "date=2024-01-02/b.parquet"]
+    sampled = sample_keys(keys, fraction=0.1, seed=42)
+    sampled = sample_keys(keys, fraction=0.1, seed=42, stratify=True)
+"""
+
+import posixpath
+import random
+from typing import Dict, List
+
+
+def sample_keys(
+    keys: List[str],
+    fraction: float,
+    seed: int = 0,
+    stratify: bool = False,
+) -> List[str]:
+    """
+    Select a seeded random sample of keys.
+
+    :param keys: The ordered keys to sample.
+    :param fraction: The fraction of keys to select, greater than 0 and at most 1.
+                     At least one key is selected from every non-empty stratum.
+    :param seed: The seed of the sample, so the same keys are selected again.
+    :param stratify: Whether to sample every directory of the keys separately.
+    :return: The sampled keys, in their original order.
+    :raises ValueError: If the fraction is invalid.
+
+    **Example**::
+
+            >>> sample_keys(["a", "b", "c", "d"], fraction=0.5, seed=1)
+            ["b", "c"]
+    """
+    if not 0 < fraction <= 1:
+        raise ValueError("Sample fraction must be greater than 0 and at most 1")
+
+    strata: Dict[str, List[str]] = {}
+    for key in keys:
+        strata.setdefault(posixpath.dirname(key) if stratify else "", []).append(key)
+
+    generator = random.Random(seed)
+    selected = set()
+    for stratum in sorted(strata):
+        members = sorted(set(strata[stratum]))
+        count = max(1, round(fraction * len(members)))
+        selected.update(generator.sample(members, count))
+    return [key for key in keys if key in selected]
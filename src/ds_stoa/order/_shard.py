@@ -0,0 +1,65 @@
+"""
+This module provides deterministic sharding of ordered keys, so a product can
+be fetched by several nodes at once without a coordinator.
+
+Every node orders the same product and keeps only its own slice of the keys.
+Without sizes, a key belongs to the shard given by a stable hash of the key,
+so nodes agree on the partition even if they see the keys in a different
+order. With sizes, keys are assigned largest first to the least loaded shard,
+which balances the number of bytes each node downloads.
+
+**Example Usage**::
+
+    from ds_stoa.order import shard
+
+    keys = ["a.parquet", "b.parquet", "c.parquet"]
+    mine = shard(keys, shard_index=0, num_shards=2)
+    mine = shard(keys, shard_index=0, num_shards=2, sizes={"a.parquet": 10})
+"""
+
+import zlib
+from typing import Dict, List, Optional
+
+
+def shard(
+    keys: List[str],
+    shard_index: int,
+    num_shards: int,
+    sizes: Optional[Dict[str, int]] = None,
+) -> List[str]:
+    """
+    Select the keys that belong to one shard.
+
+    :param keys: The ordered keys to partition.
+    :param shard_index: The index of the shard to select, from 0 to `num_shards` - 1.
+    :param num_shards: The total number of shards.
+    :param sizes: Optional object sizes in bytes, keyed by key. Keys with a
+                  known size are balanced by size; other keys are hashed.
+    :return: The keys of the shard, in their original order.
+    :raises ValueError: If the shard index or the number of shards is invalid.
+
+    **Example**::
+
+            >>> shard(["a", "b", "c", "d"], shard_index=0, num_shards=2)
+            ["d"]
+    """
+    if num_shards < 1:
+        raise ValueError("Number of shards must be greater than 0")
+    if not 0 <= shard_index < num_shards:
+        raise ValueError("Shard index must be between 0 and the number of shards")
+
+    sizes = sizes or {}
+    sized = sorted({key for key in keys if key in sizes}, key=lambda k: (-sizes[k], k))
+
+    owner = {}
+    loads = [0] * num_shards
+    for key in sized:
+        index = min(range(num_shards), key=lambda i: (loads[i], i))
+        loads[index] += sizes[key]
+        owner[key] = index
+
+    for key in keys:
+        if key not in owner:
+            owner[key] = zlib.crc32(key.encode("utf-8")) % num_shards
+
+    return [key for key in keys if owner[key] == shard_index]
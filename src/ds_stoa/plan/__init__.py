@@ -0,0 +1,22 @@
+"""
+This module separates planning a fetch from executing it.
+
+It exposes the `FetchPlan` class, produced by ordering and signing a product,
+and the `execute` function, which downloads a plan anywhere without any
+credentials or client state. Plans serialise to JSON, so a driver can plan
+once and have a pool of workers each execute a slice of the plan.
+
+**Example usage**::
+
+    from ds_stoa.plan import FetchPlan, execute
+
+    plan = stoa.plan()
+    payload = plan.to_json()
+
+    # On worker `index` of `num_workers`
+    dataframe = execute(FetchPlan.from_json(payload).shard(index, num_workers))
+"""
+
+from ._plan import FetchPlan, PlanEntry, execute, url_expiry
+
+__all__ = ["FetchPlan", "PlanEntry", "execute", "url_expiry"]
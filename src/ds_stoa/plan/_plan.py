@@ -0,0 +1,297 @@
+"""
+Module for planning fetches from GraspDP datalake.
+
+This module separates planning a fetch from executing it. Ordering and
+signing a product produce a `FetchPlan`: the object keys with their
+pre-signed URLs, URL expiries, when known, object sizes and, for objects
+pruned by filters, the row groups that may match. A plan holds no
+credentials or client state and serialises to plain JSON, so a driver can
+plan once and ship the plan, or slices of it, to worker processes or machines
+that execute it with `execute`.
+
+`Dependencies`:
+- **json**: For serialising plans.
+- **fetch**: For executing plans.
+- **order**: For slicing plans between workers.
+
+`Example usage`::
+
+    plan = FetchPlan.from_signatures(signatures)
+    payload = plan.to_json()
+
+    # On a worker
+    dataframe = execute(FetchPlan.from_json(payload).shard(index, num_workers))
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from ..fetch import discover_sizes, fetch
+from ..order import shard
+from ..store import HostCache
+from ..utils.hedging import HedgePolicy
+from ..utils.logger import LOGGER
+
+
+def url_expiry(url: str) -> Optional[str]:
+    """
+    Derive the expiry time of a pre-signed URL from its query string.
+
+    Both signature version 4 (`X-Amz-Date` and `X-Amz-Expires`) and
+    signature version 2 (`Expires`) URLs are understood.
+
+    :param url: The pre-signed URL.
+    :return: The expiry time as an ISO 8601 string, or None if unknown.
+
+    **Example**::
+
+        >>> url_expiry("https://bucket/key?X-Amz-Date=20240601T120000Z&X-Amz-Expires=3600")
+        '2024-06-01T13:00:00+00:00'
+    """
+    query = {
+        key.lower(): values[0] for key, values in parse_qs(urlparse(url).query).items()
+    }
+    try:
+        if "x-amz-date" in query and "x-amz-expires" in query:
+            signed = datetime.strptime(query["x-amz-date"], "%Y%m%dT%H%M%SZ")
+            expiry = signed.replace(tzinfo=timezone.utc) + timedelta(
+                seconds=int(query["x-amz-expires"])
+            )
+            return expiry.isoformat()
+        if "expires" in query:
+            return datetime.fromtimestamp(
+                int(query["expires"]), timezone.utc
+            ).isoformat()
+    except ValueError:
+        LOGGER.warning(
+            f"Unable to parse the expiry of pre-signed URL for {urlparse(url).path}"
+        )
+    return None
+
+
+@dataclass
+class PlanEntry:
+    """
+    A single object of a fetch plan.
+    """
+
+    key: str
+    url: str
+    expires_at: Optional[str] = None
+    size: Optional[int] = None
+    row_groups: Optional[List[int]] = None
+
+
+@dataclass
+class FetchPlan:
+    """
+    The FetchPlan class holds everything needed to download a product:
+    the object keys, their pre-signed URLs, URL expiries and sizes.
+    """
+
+    entries: List[PlanEntry] = field(default_factory=list)
+
+    @classmethod
+    def from_signatures(
+        cls,
+        signatures: Dict[str, str],
+        sizes: Optional[Dict[str, int]] = None,
+        row_groups: Optional[Dict[str, List[int]]] = None,
+    ) -> "FetchPlan":
+        """
+        Builds a plan from pre-signed URLs keyed by object key.
+
+        :param signatures: Dictionary mapping object keys to pre-signed URLs.
+        :param sizes: Optional object sizes in bytes, keyed by object key.
+        :param row_groups: Optional row groups to read of objects of which
+            only some may match, keyed by object key.
+        :return: The fetch plan.
+        """
+        sizes = sizes or {}
+        row_groups = row_groups or {}
+        return cls(
+            entries=[
+                PlanEntry(
+                    key=key,
+                    url=url,
+                    expires_at=url_expiry(url),
+                    size=sizes.get(key),
+                    row_groups=row_groups.get(key),
+                )
+                for key, url in signatures.items()
+            ]
+        )
+
+    @property
+    def pre_signed_urls(self) -> Dict[str, str]:
+        """
+        Pre-signed URLs getter, in the shape expected by `fetch`.
+
+        :return: Dictionary mapping object keys to pre-signed URLs.
+        """
+        return {entry.key: entry.url for entry in self.entries}
+
+    @property
+    def sizes(self) -> Dict[str, int]:
+        """
+        Sizes getter that retrieves the known object sizes.
+
+        :return: Dictionary mapping object keys to sizes in bytes.
+        """
+        return {
+            entry.key: entry.size for entry in self.entries if entry.size is not None
+        }
+
+    @property
+    def row_groups(self) -> Dict[str, List[int]]:
+        """
+        Row groups getter that retrieves the row groups to read of the
+        objects of which only some may match.
+
+        :return: Dictionary mapping object keys to row group indices.
+        """
+        return {
+            entry.key: entry.row_groups
+            for entry in self.entries
+            if entry.row_groups is not None
+        }
+
+    def expired(self, margin: timedelta = timedelta(0)) -> List[str]:
+        """
+        Returns the keys whose pre-signed URLs expire within the margin.
+
+        :param margin: How long the URLs must remain valid (default: 0).
+        :return: The keys of the expired entries.
+        """
+        deadline = datetime.now(timezone.utc) + margin
+        return [
+            entry.key
+            for entry in self.entries
+            if entry.expires_at and datetime.fromisoformat(entry.expires_at) <= deadline
+        ]
+
+    def shard(self, shard_index: int, num_shards: int) -> "FetchPlan":
+        """
+        Returns the slice of the plan for one worker, balanced by size
+        where sizes are known.
+
+        :param shard_index: The index of the worker, from 0 to `num_shards` - 1.
+        :param num_shards: The total number of workers.
+        :return: The fetch plan of the worker.
+        """
+        keys = set(
+            shard(
+                keys=[entry.key for entry in self.entries],
+                shard_index=shard_index,
+                num_shards=num_shards,
+                sizes=self.sizes,
+            )
+        )
+        return FetchPlan(entries=[entry for entry in self.entries if entry.key in keys])
+
+    def discover_sizes(self) -> "FetchPlan":
+        """
+        Discovers the sizes of the entries whose size is unknown, with
+        ranged requests against their pre-signed URLs.
+
+        :return: The plan itself, with sizes filled in.
+        """
+        unknown = {entry.key: entry.url for entry in self.entries if entry.size is None}
+        sizes = discover_sizes(unknown) if unknown else {}
+        for entry in self.entries:
+            if entry.key in sizes:
+                entry.size = sizes[entry.key]
+        return self
+
+    def to_dict(self) -> Dict:
+        """
+        Serialises the plan to a dictionary of plain types.
+
+        :return: The plan as a dictionary.
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, value: Dict) -> "FetchPlan":
+        """
+        Deserialises a plan from a dictionary created by `to_dict`.
+
+        :param value: The plan as a dictionary.
+        :return: The fetch plan.
+        """
+        return cls(entries=[PlanEntry(**entry) for entry in value["entries"]])
+
+    def to_json(self) -> str:
+        """
+        Serialises the plan to a JSON string.
+
+        :return: The plan as JSON.
+        """
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, value: str) -> "FetchPlan":
+        """
+        Deserialises a plan from a JSON string created by `to_json`.
+
+        :param value: The plan as JSON.
+        :return: The fetch plan.
+        """
+        return cls.from_dict(json.loads(value))
+
+
+def execute(
+    plan: FetchPlan,
+    hedge: Optional[HedgePolicy] = None,
+    host_cache: Optional[HostCache] = None,
+    filters: Optional[List[Tuple]] = None,
+    dtype_backend: Optional[str] = None,
+    read_dictionary: Optional[List[str]] = None,
+    categorical: bool = False,
+    optimize_memory: bool = False,
+    sort_by: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Execute a fetch plan and consolidate the downloaded data into
+    a single DataFrame. No authentication or client is needed. Known
+    sizes are used to schedule the largest downloads first, and only the
+    row groups of the plan are read of objects that have them.
+
+    :param plan: The fetch plan to execute.
+    :param hedge: Policy for hedging slow downloads (default: None).
+    :param host_cache: Cache shared with other processes on the host (default: None).
+    :param filters: Filters in DNF form, applied while decoding (default: None).
+    :param dtype_backend: "pyarrow" or "numpy_nullable" dtypes (default: None).
+    :param read_dictionary: Columns to return as categorical columns (default: None).
+    :param categorical: Whether to return dictionary encoded columns as
+        categorical columns (default: False).
+    :param optimize_memory: Whether to downcast numeric columns and categorize
+        low-cardinality string columns (default: False).
+    :param sort_by: The column to sort the result by (default: None).
+    :return: A consolidated Pandas DataFrame containing the data of the plan.
+
+    **Example**::
+
+        dataframe = execute(FetchPlan.from_json(payload))
+    """
+    expired = plan.expired()
+    if expired:
+        LOGGER.warning(f"({len(expired)}) pre-signed URLs of the plan have expired")
+    return fetch(
+        pre_signed_urls=plan.pre_signed_urls,
+        sizes=plan.sizes,
+        hedge=hedge,
+        host_cache=host_cache,
+        filters=filters,
+        dtype_backend=dtype_backend,
+        read_dictionary=read_dictionary,
+        categorical=categorical,
+        optimize_memory=optimize_memory,
+        sort_by=sort_by,
+        row_groups=plan.row_groups,
+    )
@@ -12,6 +12,7 @@ by selecting the appropriate URL to request the pre-signed URL from.
 Dependencies:
 - **requests**: For making HTTP requests to the Stoa service.
 - **os**: For reading environment variables to determine the running environment.
+- **utils.decorators**: For pacing requests with the shared rate limiter.
 - **utils.exceptions**: For enriching exceptions with more context.
 - **utils.logger**: For logging information and errors.
 
@@ -33,12 +34,14 @@ from typing import Dict
 
 import requests
 
+from ..utils.decorators import rate_limited
 from ..utils.exceptions import enrich_http_exception
 from ..utils.logger import LOGGER
 
 BUILDING_MODE = os.getenv("BUILDING_MODE", default="dev")
 
 
+@rate_limited("sign")
 def sign(token: str, params: Dict) -> str:
     """
     Generate a pre-signed URL for accessing data in the
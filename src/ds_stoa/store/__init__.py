@@ -0,0 +1,32 @@
+"""
+This module provides local state for fetches from the GraspDP datalake.
+
+It exposes three classes:
+
+- **Manifest**: Records the objects of a product that have already been
+  fetched into a local directory. Incremental fetches use the manifest to sign
+  and download only the keys that are new since the last run.
+- **Journal**: Records the objects a bulk fetch job has completed, so a failed
+  job can be resumed with the same job id.
+- **HostCache**: Shares downloaded objects between the processes on a host,
+  so each object is downloaded once per host.
+
+**Example usage**::
+
+    from ds_stoa.store import Manifest
+
+    manifest = Manifest("/tmp/cache/group/product/owner/1.0")
+    new_keys = manifest.new_keys(order_ids)
+
+    journal = Journal("/tmp/jobs", job_id="nightly")
+    remaining = journal.remaining(order_ids)
+
+    cache = HostCache("/dev/shm/stoa")
+    path = cache.get(key, url)
+"""
+
+from ._host import HostCache
+from ._journal import Journal
+from ._manifest import Manifest
+
+__all__ = ["HostCache", "Journal", "Manifest"]
@@ -0,0 +1,253 @@
+"""
+Module for sharing downloaded objects between processes on one host.
+
+This module provides the `HostCache` class, a directory of downloaded objects
+shared by every process on a host. Downloads are coordinated with lock files
+created exclusively next to the cached objects: the first process to request
+an object downloads it while the others wait for the finished file and then
+memory-map it, so each object crosses the network once per host. The owner of
+a lock refreshes its modification time while downloading, and a lock whose
+owner died is taken over once it has not been refreshed for the stale timeout:
+it is atomically renamed aside, so only one waiting process can remove it, and
+put back if it turns out to have been refreshed or replaced meanwhile. With a
+size cap, the least recently used objects are evicted after every download.
+
+`Dependencies`:
+- **pyarrow**: For memory-mapping cached objects.
+- **fetch**: For downloading objects and mapping keys to local paths.
+
+`Example usage`::
+
+    cache = HostCache("/dev/shm/stoa", max_bytes=8 << 30)
+    path = cache.get("2024/01/12345.snappy.parquet", url)
+    source = cache.open("2024/01/12345.snappy.parquet", url)
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+import pyarrow as pa
+
+from ..fetch import download, local_path
+from ..utils.logger import LOGGER
+
+
+class HostCache:
+    """
+    The HostCache class coalesces downloads of the same object by several
+    processes on one host into a single download.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        stale_after: float = 900.0,
+        poll_interval: float = 0.1,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Constructor for the HostCache class.
+
+        :param directory: The local directory shared by the processes.
+        :param stale_after: The age in seconds after which a lock that has not
+            been refreshed is considered abandoned (default: 900).
+        :param poll_interval: The delay in seconds between checks while
+            waiting for another process (default: 0.1).
+        :param max_bytes: The size in bytes above which the least recently
+            used objects are evicted, or None to keep every object
+            (default: None).
+        """
+        self.directory = directory
+        self.objects_directory = os.path.join(directory, "objects")
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self.max_bytes = max_bytes
+
+    def path(self, key: str) -> str:
+        """
+        Returns the local path of an object.
+
+        :param key: The object key.
+        :return: The local path of the object.
+        """
+        return local_path(self.objects_directory, key)
+
+    def get(self, key: str, url: str) -> str:
+        """
+        Returns the local path of an object, downloading it unless it is
+        cached or another process is already downloading it, in which case
+        the download is awaited.
+
+        :param key: The object key.
+        :param url: The pre-signed URL of the object.
+        :return: The local path of the object.
+        """
+        path = self.path(key)
+        lock = f"{path}.lock"
+        try:
+            # The modification time of an object records its last use.
+            os.utime(path)
+            return path
+        except FileNotFoundError:
+            pass
+        while not os.path.exists(path):
+            if self._acquire(lock):
+                stop = threading.Event()
+                heartbeat = threading.Thread(
+                    target=self._heartbeat, args=(lock, stop), daemon=True
+                )
+                heartbeat.start()
+                try:
+                    if not os.path.exists(path):
+                        download(url, path)
+                finally:
+                    stop.set()
+                    heartbeat.join()
+                    self._release(lock)
+                if self.max_bytes is not None:
+                    self.evict(keep=path)
+                break
+            self._wait(lock, path)
+        return path
+
+    def open(self, key: str, url: str) -> pa.MemoryMappedFile:
+        """
+        Returns a memory map of an object, fetching it through the cache.
+
+        :param key: The object key.
+        :param url: The pre-signed URL of the object.
+        :return: A read-only memory map of the object.
+        """
+        return pa.memory_map(self.get(key, url), "r")
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Removes the least recently used objects until the cached objects fit
+        in the size cap. Processes that memory-mapped a removed object keep
+        reading it, as the file is only unlinked.
+
+        :param keep: The path of an object that must not be removed (default: None).
+        :return: The number of bytes removed.
+        """
+        if self.max_bytes is None:
+            return 0
+        objects = []
+        for root, _, names in os.walk(self.objects_directory):
+            for name in names:
+                if name.endswith((".lock", ".part", ".stale")):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                objects.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in objects)
+        removed = 0
+        for _, size, path in sorted(objects):
+            if total - removed <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            removed += size
+        if removed:
+            LOGGER.info(f"Evicted ({removed}) bytes from the host cache")
+        return removed
+
+    def _acquire(self, lock: str) -> bool:
+        """
+        Creates a lock file, failing if it already exists.
+
+        :param lock: The path of the lock file.
+        :return: True if this process now holds the lock.
+        """
+        os.makedirs(os.path.dirname(lock), exist_ok=True)
+        try:
+            descriptor = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(descriptor, "w") as file:
+            file.write(str(os.getpid()))
+        return True
+
+    def _heartbeat(self, lock: str, stop: threading.Event) -> None:
+        """
+        Refreshes the modification time of a held lock until stopped, so
+        waiting processes do not take over a lock of a long download.
+
+        :param lock: The path of the lock file.
+        :param stop: The event that ends the refreshing.
+        """
+        while not stop.wait(self.stale_after / 3):
+            try:
+                os.utime(lock)
+            except FileNotFoundError:
+                return
+
+    def _release(self, lock: str) -> None:
+        """
+        Removes a lock file if this process still holds it. A lock taken over
+        by another process after it went stale is left in place.
+
+        :param lock: The path of the lock file.
+        """
+        try:
+            with open(lock) as file:
+                if file.read() != str(os.getpid()):
+                    return
+            os.remove(lock)
+        except FileNotFoundError:
+            pass
+
+    def _wait(self, lock: str, path: str) -> None:
+        """
+        Waits until another process releases a lock, removing the lock if
+        it has gone stale.
+
+        :param lock: The path of the lock file.
+        :param path: The path of the object being downloaded.
+        """
+        while os.path.exists(lock) and not os.path.exists(path):
+            try:
+                stat = os.stat(lock)
+            except FileNotFoundError:
+                return
+            age = time.time() - stat.st_mtime
+            if age > self.stale_after:
+                self._remove_stale(lock, stat)
+                return
+            time.sleep(self.poll_interval)
+
+    def _remove_stale(self, lock: str, stale: os.stat_result) -> None:
+        """
+        Removes a stale lock. The lock is renamed aside first, which only one
+        process can do, and put back if it is no longer the stale lock, as
+        when its owner refreshed it or another process replaced it since.
+
+        :param lock: The path of the lock file.
+        :param stale: The status of the lock when it was found stale.
+        """
+        aside = f"{lock}.{os.getpid()}.{threading.get_ident()}.stale"
+        try:
+            os.rename(lock, aside)
+        except FileNotFoundError:
+            return
+        try:
+            stat = os.stat(aside)
+            if (stat.st_ino, stat.st_mtime) != (stale.st_ino, stale.st_mtime):
+                try:
+                    os.link(aside, lock)
+                except FileExistsError:
+                    pass
+                return
+            LOGGER.warning(
+                f"Removing stale lock {lock} ({time.time() - stat.st_mtime:.0f}s old)"
+            )
+        finally:
+            os.remove(aside)
@@ -0,0 +1,102 @@
+"""
+Module for checkpointing bulk fetches on local disk.
+
+This module provides the `Journal` class, an append-only log of the objects a
+bulk fetch has completed, identified by a job id. Every completed object is
+written to the journal as soon as its file is on disk, so a fetch that dies
+part way can be restarted with the same job id and continue with only the
+remaining objects.
+
+`Dependencies`:
+- **json**: For encoding journal entries.
+- **fetch**: For mapping job ids and object keys to local paths.
+
+`Example usage`::
+
+    journal = Journal("/tmp/jobs", job_id="nightly-2024-06-01")
+    for key in journal.remaining(order_ids):
+        ...
+        journal.record(key, path)
+"""
+
+import json
+import os
+from typing import Dict, List
+
+from ..fetch import local_path
+
+
+class Journal:
+    """
+    The Journal class records the completed objects of a bulk fetch so it
+    can be resumed after a failure.
+    """
+
+    FILENAME = "journal.jsonl"
+
+    def __init__(self, directory: str, job_id: str) -> None:
+        """
+        Constructor for the Journal class. Replays the journal of the job if
+        it exists.
+
+        :param directory: The local directory holding the jobs.
+        :param job_id: The identifier of the job.
+        """
+        self.job_id = job_id
+        self.directory = local_path(directory, job_id)
+        self.path = os.path.join(self.directory, self.FILENAME)
+        self.objects_directory = os.path.join(self.directory, "objects")
+        self._completed: Dict[str, str] = {}
+        self.load()
+
+    @property
+    def completed(self) -> Dict[str, str]:
+        """
+        Completed getter that retrieves the journaled objects whose local
+        file still exists.
+
+        :return: Dictionary mapping object keys to local paths.
+        """
+        return {
+            key: path for key, path in self._completed.items() if os.path.exists(path)
+        }
+
+    def remaining(self, keys: List[str]) -> List[str]:
+        """
+        Returns the keys that have not been completed yet, in their
+        original order.
+
+        :param keys: The ordered object keys of the job.
+        :return: The keys that still need to be fetched.
+        """
+        completed = self.completed
+        return [key for key in keys if key not in completed]
+
+    def record(self, key: str, path: str) -> None:
+        """
+        Appends a completed object to the journal and flushes it to disk.
+
+        :param key: The object key.
+        :param path: The local path of the fetched object.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps({"key": key, "path": path}) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        self._completed[key] = path
+
+    def load(self) -> None:
+        """
+        Replays the journal from disk. A truncated last entry, left behind
+        by a crash during a write, is ignored.
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._completed[entry["key"]] = entry["path"]
@@ -0,0 +1,122 @@
+"""
+Module for tracking fetched objects of a product on local disk.
+
+This module provides the `Manifest` class, a small JSON document stored next
+to a local copy of a product. It records which object keys have already been
+fetched and where their files live, so repeated fetches of the same product
+only need to sign and download the keys that are new since the last run.
+
+`Dependencies`:
+- **json**: For persisting the manifest.
+- **fetch**: For mapping object keys to local paths.
+
+`Example usage`::
+
+    manifest = Manifest("/tmp/cache/group/product/owner/1.0")
+    new_keys = manifest.new_keys(["a.parquet", "b.parquet"])
+    manifest.add("a.parquet", manifest.object_path("a.parquet"))
+    manifest.save()
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from ..fetch import local_path
+
+
+class Manifest:
+    """
+    The Manifest class keeps track of the objects of a product that are
+    available in a local directory, keyed by object key.
+    """
+
+    FILENAME = "manifest.json"
+
+    def __init__(self, directory: str) -> None:
+        """
+        Constructor for the Manifest class. Loads the manifest from the
+        directory if it exists.
+
+        :param directory: The local directory of the product.
+        """
+        self.directory = directory
+        self.path = os.path.join(directory, self.FILENAME)
+        self.objects_directory = os.path.join(directory, "objects")
+        self.updated_at: Optional[str] = None
+        self._objects: Dict[str, Dict] = {}
+        self.load()
+
+    @property
+    def files(self) -> Dict[str, str]:
+        """
+        Files getter that retrieves the local files of all recorded objects
+        that still exist on disk.
+
+        :return: Dictionary mapping object keys to local paths.
+        """
+        files = {}
+        for key, entry in self._objects.items():
+            path = os.path.join(self.directory, entry["path"])
+            if os.path.exists(path):
+                files[key] = path
+        return files
+
+    def object_path(self, key: str) -> str:
+        """
+        Returns the local path where an object is stored.
+
+        :param key: The object key.
+        :return: The local path of the object.
+        """
+        return local_path(self.objects_directory, key)
+
+    def new_keys(self, keys: List[str]) -> List[str]:
+        """
+        Returns the keys that have not been fetched yet, in their original
+        order. Keys whose local file has gone missing count as new.
+
+        :param keys: The ordered object keys.
+        :return: The keys that still need to be fetched.
+        """
+        files = self.files
+        return [key for key in keys if key not in files]
+
+    def add(self, key: str, path: str) -> None:
+        """
+        Records an object as fetched.
+
+        :param key: The object key.
+        :param path: The local path of the fetched object.
+        """
+        self._objects[key] = {
+            "path": os.path.relpath(path, self.directory),
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def load(self) -> None:
+        """
+        Loads the manifest from disk, starting empty if it does not exist.
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as file:
+            body = json.load(file)
+        self.updated_at = body.get("updated_at")
+        self._objects = body.get("objects", {})
+
+    def save(self) -> None:
+        """
+        Saves the manifest to disk, replacing the previous version atomically.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self.updated_at = datetime.now(timezone.utc).isoformat()
+        partial = f"{self.path}.{os.getpid()}.part"
+        with open(partial, "w", encoding="utf-8") as file:
+            json.dump(
+                {"updated_at": self.updated_at, "objects": self._objects},
+                file,
+                indent=2,
+            )
+        os.replace(partial, self.path)
@@ -6,7 +6,9 @@ when the utility package is imported elsewhere in the project.
 The logger module provides logging functionality to track events
 and errors during the execution of the program. The exceptions module
 defines custom exceptions specific to the Stoa project,
-allowing for more precise error handling.
+allowing for more precise error handling. The hedging module provides
+the policy for hedging slow requests, and the ratelimit module the
+process-wide rate limiter shared by all requests.
 
 **Example usage**::
 
@@ -14,6 +16,6 @@ allowing for more precise error handling.
     LOGGER.info("Logging information")
 """
 
-from . import logger, exceptions
+from . import logger, exceptions, hedging, ratelimit
 
-__all__ = ["logger", "exceptions"]
+__all__ = ["logger", "exceptions", "hedging", "ratelimit"]
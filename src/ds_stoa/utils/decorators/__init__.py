@@ -3,5 +3,6 @@ Decorators for the DS Stoa API.
 """
 
 from .authentication import ensure_authenticated
+from .rate_limit import rate_limited
 
-__all__ = ["ensure_authenticated"]
+__all__ = ["ensure_authenticated", "rate_limited"]
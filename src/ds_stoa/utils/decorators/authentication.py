@@ -10,7 +10,15 @@ def ensure_authenticated(method) -> Callable[..., Any]:
     @wraps(method)
     def wrapper(self, *args, **kwargs) -> Any:
         if not self.is_authenticated():
-            self.authenticate()
+            lock = getattr(self, "_auth_lock", None)
+            if lock is None:
+                self.authenticate()
+            else:
+                # Single flight: threads waiting on the lock reuse the token
+                # obtained by the thread that held it.
+                with lock:
+                    if not self.is_authenticated():
+                        self.authenticate()
         return method(self, *args, **kwargs)
 
     return wrapper
@@ -0,0 +1,73 @@
+"""
+Rate limiting decorators.
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from requests import HTTPError, Response
+
+from ..logger import LOGGER
+from ..ratelimit import RATE_LIMITER
+
+RETRY_STATUS_CODES = (429, 503)
+
+
+def retry_after(response: Optional[Response], default: float = 1.0) -> float:
+    """
+    Read the delay requested by a `Retry-After` header.
+
+    :param response: The throttled response.
+    :param default: The delay in seconds when the header is missing or invalid.
+    :return: The delay in seconds.
+    """
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max((moment - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def rate_limited(endpoint: str, max_retries: int = 3) -> Callable[..., Any]:
+    """
+    Pace a request function with the process-wide rate limiter.
+
+    Throttled requests (429 and 503) pause the whole endpoint class for the
+    `Retry-After` delay and are retried, up to `max_retries` times.
+
+    :param endpoint: The endpoint class of the request.
+    :param max_retries: The maximum number of retries of throttled requests.
+    :return: The decorator.
+    """
+
+    def decorator(method) -> Callable[..., Any]:
+        @wraps(method)
+        def wrapper(*args, **kwargs) -> Any:
+            for attempt in range(max_retries + 1):
+                RATE_LIMITER.acquire(endpoint)
+                try:
+                    return method(*args, **kwargs)
+                except HTTPError as exc:
+                    response = exc.response
+                    status = getattr(response, "status_code", None)
+                    if status not in RETRY_STATUS_CODES or attempt == max_retries:
+                        raise
+                    delay = retry_after(response)
+                    LOGGER.warning(
+                        f"{endpoint} request throttled ({status}), "
+                        f"retrying in {delay:.1f}s"
+                    )
+                    RATE_LIMITER.pause(endpoint, delay)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,13 @@
+"""
+Hedging Module.
+
+This module contains the hedging policy for the DS-Stoa package.
+Hedged requests fire a duplicate of a request that is slower than a
+percentile of recent latencies, and use whichever completes first, so
+one slow connection does not set the end-to-end latency. Requests register
+with `on_cancel` how to stop them when the duplicate wins.
+"""
+
+from ._policy import HedgePolicy, on_cancel
+
+__all__ = ["HedgePolicy", "on_cancel"]
@@ -0,0 +1,321 @@
+"""
+Hedged requests.
+
+This module contains the hedging policy used to cut the tail latency of
+requests. A hedged call runs the request in the caller's thread and, if it
+has not completed after a delay derived from a percentile of recently
+observed latencies, starts a duplicate in a background thread and returns
+whichever completes first. The share of duplicated requests is capped by a
+budget. The losing attempt is cancelled: the callables it registered with
+`on_cancel`, such as closing its response stream, are called.
+"""
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from ..logger import LOGGER
+
+_CURRENT = threading.local()
+
+
+class _Attempt:
+    """
+    The cancellation state of one attempt of a hedged call.
+    """
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self._closers: List[Callable[[], Any]] = []
+        self._lock = threading.Lock()
+
+    def on_cancel(self, closer: Callable[[], Any]) -> None:
+        """
+        Register a callable stopping the attempt, called at once if the
+        attempt is already cancelled.
+
+        :param closer: The callable stopping the attempt.
+        :return: None
+        """
+        with self._lock:
+            if not self.cancelled:
+                self._closers.append(closer)
+                return
+        closer()
+
+    def cancel(self) -> None:
+        """
+        Cancel the attempt, calling the callables registered to stop it.
+
+        :return: None
+        """
+        with self._lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+            closers, self._closers = self._closers, []
+        for closer in closers:
+            try:
+                closer()
+            except Exception as exc:
+                LOGGER.debug(f"Cancelling a hedged attempt raised: {exc}")
+
+
+def on_cancel(closer: Callable[[], Any]) -> None:
+    """
+    Register a callable that stops the current attempt of a hedged call
+    when another attempt wins, such as closing its response stream.
+    Outside of hedged calls this does nothing.
+
+    :param closer: The callable stopping the attempt.
+    :return: None
+    """
+    attempt = getattr(_CURRENT, "attempt", None)
+    if attempt is not None:
+        attempt.on_cancel(closer)
+
+
+def _run(attempt: _Attempt, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run an attempt of a hedged call in the current thread.
+
+    :return: The result of the callable.
+    """
+    previous = getattr(_CURRENT, "attempt", None)
+    _CURRENT.attempt = attempt
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _CURRENT.attempt = previous
+
+
+class _Timers:
+    """
+    A single daemon thread running delayed callbacks, shared by the calls
+    of a policy so that calls that are not hedged start no thread.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._heap: List[list] = []
+        self._counter = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, delay: float, callback: Callable[[], Any]) -> list:
+        """
+        Run a callback after a delay.
+
+        :param delay: The delay in seconds.
+        :param callback: The callback to run.
+        :return: The timer, to pass to `cancel`.
+        """
+        timer = [time.monotonic() + delay, next(self._counter), callback]
+        with self._condition:
+            heapq.heappush(self._heap, timer)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return timer
+
+    def cancel(self, timer: list) -> None:
+        """
+        Cancel a timer that has not run yet.
+
+        :param timer: The timer returned by `schedule`.
+        :return: None
+        """
+        with self._condition:
+            timer[2] = None
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap:
+                    self._condition.wait()
+                remaining = self._heap[0][0] - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                callback = heapq.heappop(self._heap)[2]
+            if callback is not None:
+                try:
+                    callback()
+                except Exception as exc:
+                    LOGGER.error(f"Hedging timer raised: {exc}")
+
+
+class HedgePolicy:
+    """
+    Hedging policy with a percentile based delay and a hedging budget.
+
+    Usage:
+    policy = HedgePolicy(percentile=95, budget=0.05)
+    url = policy.call(sign, token=token, params={"key": key})
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        budget: float = 0.05,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.01,
+        min_samples: int = 20,
+        window: int = 1000,
+    ) -> None:
+        """
+        Initialize the hedging policy.
+
+        :param percentile: The latency percentile after which a request is hedged.
+        :param budget: The maximum share of requests that may be hedged.
+        :param initial_delay: The delay in seconds used until enough latencies are observed.
+        :param min_delay: The lower bound of the delay in seconds.
+        :param min_samples: The number of observed latencies needed to use the percentile.
+        :param window: The number of recent latencies the percentile is taken over.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        if not 0 <= budget <= 1:
+            raise ValueError("Budget must be between 0 and 1")
+
+        self.percentile = percentile
+        self.budget = budget
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._requests = 0
+        self._hedges = 0
+        self._lock = threading.Lock()
+        self._timers = _Timers()
+
+    @property
+    def hedges(self) -> int:
+        """
+        Number of duplicate requests issued so far.
+
+        :return: The number of hedged requests.
+        """
+        return self._hedges
+
+    def delay(self) -> float:
+        """
+        The time to wait for a request before hedging it.
+
+        :return: The delay in seconds.
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_delay
+            latencies = sorted(self._latencies)
+        index = max(math.ceil(self.percentile / 100 * len(latencies)) - 1, 0)
+        return max(latencies[index], self.min_delay)
+
+    def record(self, latency: float) -> None:
+        """
+        Record the latency of a completed request.
+
+        :param latency: The latency in seconds.
+        :return: None
+        """
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _acquire_hedge(self) -> bool:
+        """
+        Take a hedge from the budget if one is available.
+
+        :return: True if the request may be hedged.
+        """
+        with self._lock:
+            if self._hedges < self.budget * self._requests:
+                self._hedges += 1
+                return True
+            return False
+
+    @staticmethod
+    def _start(attempt: _Attempt, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Run an attempt of a hedged call in a daemon thread.
+
+        :return: A future holding the outcome of the attempt.
+        """
+        future: Future = Future()
+
+        def _target() -> None:
+            try:
+                future.set_result(_run(attempt, func, *args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        threading.Thread(target=_target, daemon=True).start()
+        return future
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call a function, hedging it if it is slower than the policy's delay.
+
+        The first attempt runs in the caller's thread and the hedge, if any,
+        in a background thread. The result of whichever attempt succeeds
+        first is returned and the other attempt is cancelled, which only
+        interrupts it if it registered a callable with `on_cancel`. The
+        exception of the first attempt is raised if all attempts fail.
+
+        :param func: The function to call.
+        :return: The result of the function.
+        """
+        with self._lock:
+            self._requests += 1
+        start = time.monotonic()
+        primary = _Attempt()
+        hedges: List[Tuple[_Attempt, Future]] = []
+        state = threading.Lock()
+        finished = False
+
+        def _hedge() -> None:
+            with state:
+                if finished or not self._acquire_hedge():
+                    return
+                LOGGER.debug(
+                    f"Hedging slow request to {getattr(func, '__name__', func)}"
+                )
+                attempt = _Attempt()
+                future = self._start(attempt, func, *args, **kwargs)
+                hedges.append((attempt, future))
+            future.add_done_callback(
+                lambda done: done.exception() is None and primary.cancel()
+            )
+
+        timer = self._timers.schedule(self.delay(), _hedge)
+        result, error = None, None
+        try:
+            result = _run(primary, func, *args, **kwargs)
+        except Exception as exc:
+            error = exc
+        finally:
+            self._timers.cancel(timer)
+            with state:
+                finished = True
+                hedge = hedges[0] if hedges else None
+
+        if error is None and not primary.cancelled:
+            self.record(time.monotonic() - start)
+            if hedge is not None:
+                hedge[0].cancel()
+            return result
+        if hedge is not None:
+            try:
+                value = hedge[1].result()
+            except Exception:
+                pass
+            else:
+                self.record(time.monotonic() - start)
+                return value
+        if error is not None:
+            raise error
+        return result
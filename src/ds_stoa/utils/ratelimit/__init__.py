@@ -0,0 +1,24 @@
+"""
+Rate Limit Module.
+
+This module contains the process-wide rate limiter for the DS-Stoa package.
+Requests are paced per endpoint class (auth, order, sign and download) with
+token buckets shared by all threads and clients in the process. Downloads
+are additionally capped in bytes per second by the shared `BANDWIDTH`
+bucket. No limits are applied until they are configured.
+"""
+
+from ._bandwidth import BANDWIDTH, iter_content, read_content
+from ._limiter import ENDPOINTS, RateLimiter, TokenBucket
+
+RATE_LIMITER = RateLimiter()
+
+__all__ = [
+    "BANDWIDTH",
+    "ENDPOINTS",
+    "RATE_LIMITER",
+    "RateLimiter",
+    "TokenBucket",
+    "iter_content",
+    "read_content",
+]
@@ -0,0 +1,44 @@
+"""
+Download bandwidth limiting.
+
+This module contains the process-wide bandwidth cap for downloads. Response
+bodies are streamed in chunks and every chunk takes its size in tokens from
+a shared bucket measured in bytes, so all concurrent downloads together stay
+below the configured bytes per second.
+"""
+
+from typing import Iterator
+
+from requests import Response
+
+from ._limiter import TokenBucket
+
+BANDWIDTH = TokenBucket()
+
+
+def iter_content(response: Response, chunk_size: int = 64 << 10) -> Iterator[bytes]:
+    """
+    Iterate over a streamed response body, paced by the bandwidth cap.
+
+    :param response: A response requested with `stream=True`.
+    :param chunk_size: The size of the streamed chunks in bytes.
+    :return: An iterator over the chunks of the body.
+    """
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        BANDWIDTH.acquire(len(chunk))
+        yield chunk
+
+
+def read_content(response: Response, chunk_size: int = 64 << 10) -> bytes:
+    """
+    Read a streamed response body, paced by the bandwidth cap.
+
+    Without a cap the body is read in one go.
+
+    :param response: A response requested with `stream=True`.
+    :param chunk_size: The size of the streamed chunks in bytes.
+    :return: The body of the response.
+    """
+    if BANDWIDTH.rate is None:
+        return response.content
+    return b"".join(iter_content(response, chunk_size=chunk_size))
@@ -0,0 +1,167 @@
+"""
+Client-side rate limiting.
+
+This module contains the token buckets that pace requests to the Stoa API
+and to object storage. One bucket is kept per endpoint class, and a single
+process-wide limiter is shared by every thread and `StoaClient` instance, so
+concurrent fetches together stay within the rate the API allows. A bucket can
+also be paused, which is how `Retry-After` responses hold back every request
+to the endpoint class rather than only the one that was throttled.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+ENDPOINTS = ("auth", "order", "sign", "download")
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at a constant rate up to a capacity.
+
+    Usage:
+    bucket = TokenBucket(rate=10, capacity=20)
+    bucket.acquire()
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the token bucket.
+
+        :param rate: Tokens added per second, or None for no limit.
+        :param capacity: The maximum number of tokens (default: one second of tokens).
+        """
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+        self.configure(rate, capacity)
+
+    def configure(
+        self,
+        rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+    ) -> None:
+        """
+        Change the rate and capacity of the bucket.
+
+        :param rate: Tokens added per second, or None for no limit.
+        :param capacity: The maximum number of tokens (default: one second of tokens).
+        :return: None
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("Rate must be greater than 0")
+        with self._lock:
+            self.rate = rate
+            self.capacity = capacity if capacity is not None else max(rate or 0, 1)
+            self._tokens = self.capacity
+            self._updated = time.monotonic()
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back every acquisition for a number of seconds.
+
+        :param seconds: How long to pause the bucket.
+        :return: None
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Take tokens from the bucket, waiting until they are available.
+
+        Requests for more tokens than the capacity are granted once the
+        bucket is full, and leave it in debt.
+
+        :param tokens: The number of tokens to take.
+        :return: None
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self.rate is None:
+                    return
+                else:
+                    self._tokens = min(
+                        self.capacity,
+                        self._tokens + (now - self._updated) * self.rate,
+                    )
+                    self._updated = now
+                    needed = min(tokens, self.capacity)
+                    if self._tokens >= needed:
+                        self._tokens -= tokens
+                        return
+                    wait = (needed - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Token buckets per endpoint class: auth, order, sign and download.
+
+    Usage:
+    from ds_stoa.utils.ratelimit import RATE_LIMITER
+    RATE_LIMITER.configure("sign", rate=20)
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the rate limiter without limits.
+        """
+        self._buckets: Dict[str, TokenBucket] = {
+            endpoint: TokenBucket() for endpoint in ENDPOINTS
+        }
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """
+        Return the bucket of an endpoint class.
+
+        :param endpoint: The endpoint class.
+        :return: The token bucket.
+        :raises ValueError: If the endpoint class is unknown.
+        """
+        if endpoint not in self._buckets:
+            raise ValueError(f"Unknown endpoint class: {endpoint}")
+        return self._buckets[endpoint]
+
+    def configure(
+        self,
+        endpoint: str,
+        rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+    ) -> None:
+        """
+        Limit the requests per second of an endpoint class.
+
+        :param endpoint: The endpoint class.
+        :param rate: Requests per second, or None for no limit.
+        :param capacity: The maximum burst of requests.
+        :return: None
+        """
+        self.bucket(endpoint).configure(rate, capacity)
+
+    def acquire(self, endpoint: str) -> None:
+        """
+        Wait until a request to an endpoint class is allowed.
+
+        :param endpoint: The endpoint class.
+        :return: None
+        """
+        self.bucket(endpoint).acquire()
+
+    def pause(self, endpoint: str, seconds: float) -> None:
+        """
+        Hold back every request to an endpoint class, e.g. after a
+        `Retry-After` response.
+
+        :param endpoint: The endpoint class.
+        :param seconds: How long to pause the endpoint class.
+        :return: None
+        """
+        self.bucket(endpoint).pause(seconds)
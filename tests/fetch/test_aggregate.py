@@ -0,0 +1,97 @@
+"""
+Test Module for Aggregating Data
+-------------------------------------------
+Test cases for the data aggregation module.
+"""
+
+from io import BytesIO
+from unittest import TestCase, mock
+
+import numpy as np
+import pandas as pd
+
+from src.ds_stoa.fetch._aggregate import aggregate, groupby_agg
+
+
+class TestAggregate(TestCase):
+    def setUp(self):
+        generator = np.random.default_rng(0)
+        self._frames = [
+            pd.DataFrame(
+                {
+                    "group": generator.choice(["a", "b", "c"], 50),
+                    "flag": generator.integers(0, 2, 50),
+                    "value": generator.random(50),
+                    "amount": generator.integers(0, 100, 50).astype(float),
+                }
+            )
+            for _ in range(4)
+        ]
+        self._frames[1].loc[3, "amount"] = np.nan
+        self._data = {}
+        for index, frame in enumerate(self._frames):
+            buffer = BytesIO()
+            frame.to_parquet(buffer, index=False)
+            self._data[f"http://{index}"] = buffer.getvalue()
+        self.pre_signed_urls = {url: url for url in self._data}
+
+    def _fetch_url(self, url):
+        if url not in self._data:
+            raise ValueError("Not found")
+        return BytesIO(self._data[url])
+
+    @mock.patch("src.ds_stoa.fetch._aggregate.fetch_url")
+    def test_aggregate(self, _fetch_url):
+        """
+        Test case for the aggregate function.
+        """
+        # Setup
+        _fetch_url.side_effect = self._fetch_url
+
+        # Exercise
+        rows = aggregate(self.pre_signed_urls, len, lambda a, b: a + b)
+        empty = aggregate({}, len, lambda a, b: a + b)
+
+        # Asserts
+        self.assertEqual(rows, 200)
+        self.assertIsNone(empty)
+
+    @mock.patch("src.ds_stoa.fetch._aggregate.LOGGER.error")
+    @mock.patch("src.ds_stoa.fetch._aggregate.fetch_url")
+    def test_groupby_agg(self, _fetch_url, _logger):
+        """
+        Test case for the groupby_agg function.
+        """
+        # Setup
+        _fetch_url.side_effect = self._fetch_url
+        agg = {"value": ["sum", "mean", "min"], "amount": ["count", "size", "max"]}
+        expected = pd.concat(self._frames).groupby(["group", "flag"]).agg(agg)
+
+        # Exercise
+        dataframe = groupby_agg(
+            {**self.pre_signed_urls, "missing": "http://missing"},
+            by=["group", "flag"],
+            agg=agg,
+        )
+
+        # Asserts
+        pd.testing.assert_frame_equal(dataframe, expected, check_dtype=False)
+        _logger.assert_called_once()
+
+    @mock.patch("src.ds_stoa.fetch._aggregate.fetch_url")
+    def test_groupby_agg_flat(self, _fetch_url):
+        """
+        Test case for the groupby_agg function with one function per column.
+        """
+        # Setup
+        _fetch_url.side_effect = self._fetch_url
+        agg = {"value": "mean", "amount": "sum"}
+        expected = pd.concat(self._frames).groupby("group").agg(agg)
+
+        # Exercise
+        dataframe = groupby_agg(self.pre_signed_urls, by="group", agg=agg)
+
+        # Asserts
+        pd.testing.assert_frame_equal(dataframe, expected)
+        with self.assertRaises(ValueError):
+            groupby_agg(self.pre_signed_urls, by="group", agg={"value": "median"})
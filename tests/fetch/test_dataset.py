@@ -0,0 +1,91 @@
+"""
+Test Module for Dataset Export
+-------------------------------------------
+Test cases for the dataset export module.
+"""
+
+import os
+import tempfile
+from io import BytesIO
+from unittest import TestCase, mock
+
+import pandas as pd
+
+from src.ds_stoa.fetch._dataset import fetch_to_dataset
+
+
+class TestDataset(TestCase):
+    def setUp(self):
+        self.pre_signed_urls = {
+            "2024/data1.parquet": "http://example.com/data1.parquet",
+        }
+        self._dataframe = pd.DataFrame(
+            {"column1": [1, 2, 3], "date": ["2024-01-01", "2024-01-01", "2024-01-02"]}
+        )
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = self._directory.name
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    @mock.patch("src.ds_stoa.fetch._dataset.download")
+    def test_fetch_to_dataset_raw(self, _download):
+        """
+        Test case for the raw byte copy path.
+        """
+        # Setup
+        _download.side_effect = lambda url, destination: destination
+
+        # Exercise
+        files = fetch_to_dataset(self.pre_signed_urls, self.path)
+
+        # Asserts
+        expected = os.path.join(self.path, "2024", "data1.parquet")
+        self.assertEqual(files, [expected])
+        _download.assert_called_once_with("http://example.com/data1.parquet", expected)
+
+    @mock.patch("src.ds_stoa.fetch._dataset.fetch_url")
+    def test_fetch_to_dataset_partitioned(self, _fetch_url):
+        """
+        Test case for the repartitioning path.
+        """
+        # Setup
+        _buffer = BytesIO()
+        self._dataframe.to_parquet(_buffer, index=False)
+        _buffer.seek(0)
+        _fetch_url.return_value = _buffer
+
+        # Exercise
+        files = fetch_to_dataset(self.pre_signed_urls, self.path, partition_by=["date"])
+
+        # Asserts
+        self.assertEqual(len(files), 2)
+        self.assertTrue(all("date=" in file for file in files))
+        self.assertEqual(len(pd.read_parquet(self.path)), 3)
+
+    @mock.patch("src.ds_stoa.fetch._dataset.fetch_url")
+    def test_fetch_to_dataset_similar_keys(self, _fetch_url):
+        """
+        Test case for repartitioning keys that share a prefix before a dot.
+        """
+
+        # Setup
+        def _buffer(url):
+            buffer = BytesIO()
+            self._dataframe.to_parquet(buffer, index=False)
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+        pre_signed_urls = {
+            "2024.01/a.parquet": "http://example.com/a.parquet",
+            "2024.01/b.parquet": "http://example.com/b.parquet",
+            "2024.01_a.parquet": "http://example.com/c.parquet",
+        }
+
+        # Exercise
+        files = fetch_to_dataset(pre_signed_urls, self.path, partition_by=["date"])
+
+        # Asserts
+        self.assertEqual(len(set(files)), 6)
+        self.assertEqual(len(pd.read_parquet(self.path)), 9)
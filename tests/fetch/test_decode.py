@@ -0,0 +1,166 @@
+"""
+Test Module for Decoding Data
+-------------------------------------------
+Test cases for the data decoding module.
+"""
+
+import os
+import tempfile
+from io import BytesIO
+from unittest import TestCase, mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.ds_stoa.fetch._decode import (
+    concat_tables,
+    dictionary_columns,
+    read_parquet_parallel,
+    read_table,
+    schema_drift,
+    to_pandas,
+    unify_schemas,
+)
+
+
+class TestDecode(TestCase):
+    def setUp(self):
+        self._dataframe = pd.DataFrame(
+            {"column1": np.arange(1000), "column2": np.arange(1000).astype(str)}
+        )
+
+    def test_read_parquet_parallel_buffer(self):
+        """
+        Test case for decoding a buffer with several row groups.
+        """
+        # Setup
+        _buffer = BytesIO()
+        self._dataframe.to_parquet(_buffer, index=False, row_group_size=100)
+
+        # Exercise
+        dataframe = read_parquet_parallel(_buffer, max_workers=4)
+
+        # Asserts
+        pd.testing.assert_frame_equal(dataframe, self._dataframe)
+
+    def test_read_parquet_parallel_file(self):
+        """
+        Test case for decoding a memory-mapped file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Setup
+            path = os.path.join(directory, "data.parquet")
+            self._dataframe.to_parquet(path, index=False)
+
+            # Exercise
+            dataframe = read_parquet_parallel(path)
+
+            # Asserts
+            pd.testing.assert_frame_equal(dataframe, self._dataframe)
+
+    def test_read_table_categorical(self):
+        """
+        Test case for decoding dictionary encoded columns as categoricals.
+        """
+        # Setup
+        _buffer = BytesIO()
+        self._dataframe.to_parquet(_buffer, index=False, row_group_size=100)
+        plain = BytesIO()
+        self._dataframe.to_parquet(plain, index=False, use_dictionary=False)
+
+        # Exercise
+        columns = dictionary_columns(pq.read_metadata(BytesIO(_buffer.getvalue())))
+        tables = [
+            read_table(_buffer, categorical=True, parallel=True),
+            read_table(plain, categorical=True),
+        ]
+        dataframe = to_pandas(concat_tables(tables))
+
+        # Asserts
+        self.assertEqual(columns, ["column2"])
+        self.assertEqual(dataframe["column2"].dtype, "category")
+        self.assertEqual(len(dataframe), 2000)
+        self.assertEqual(list(dataframe["column2"][:2]), ["0", "1"])
+
+    def test_to_pandas_dtype_backend(self):
+        """
+        Test case for converting to Arrow-backed and nullable dtypes.
+        """
+        # Setup
+        _buffer = BytesIO()
+        self._dataframe.to_parquet(_buffer, index=False)
+        table = read_table(_buffer, read_dictionary=["column2"])
+
+        # Exercise
+        arrow = to_pandas(table, dtype_backend="pyarrow")
+        nullable = to_pandas(table.drop_columns(["column2"]), "numpy_nullable")
+
+        # Asserts
+        self.assertIsInstance(arrow["column1"].dtype, pd.ArrowDtype)
+        self.assertEqual(arrow["column2"].dtype, "category")
+        self.assertEqual(nullable["column1"].dtype, pd.Int64Dtype())
+        with self.assertRaises(ValueError):
+            to_pandas(table, dtype_backend="invalid")
+        with self.assertRaises(ValueError):
+            concat_tables([])
+
+    def test_unify_schemas(self):
+        """
+        Test case for unifying drifted schemas.
+        """
+        # Setup
+        schemas = {
+            "a": pa.schema([("id", pa.int32()), ("name", pa.string())]),
+            "b": pa.schema([("id", pa.float64()), ("name", pa.int64())]),
+            "c": pa.schema([("id", pa.int64()), ("flag", pa.bool_())]),
+        }
+
+        # Exercise
+        unified = unify_schemas(list(schemas.values()))
+        drift = schema_drift(schemas)
+
+        # Asserts
+        self.assertEqual(
+            unified,
+            pa.schema(
+                [
+                    ("id", pa.float64()),
+                    ("name", pa.large_string()),
+                    ("flag", pa.bool_()),
+                ]
+            ),
+        )
+        self.assertEqual(drift["a"]["missing"], ["flag"])
+        self.assertEqual(drift["a"]["promoted"]["id"], (pa.int32(), pa.float64()))
+        self.assertEqual(drift["c"]["missing"], ["name"])
+        self.assertEqual(schema_drift({"a": schemas["a"], "b": schemas["a"]}), {})
+
+    @mock.patch("src.ds_stoa.fetch._decode.LOGGER.warning")
+    def test_concat_tables_drift(self, _logger):
+        """
+        Test case for concatenating tables with drifted schemas.
+        """
+        # Setup
+        tables = [
+            pa.table(
+                {"id": [1, 2], "status": pa.array(["a", "b"]).dictionary_encode()}
+            ),
+            pa.table({"id": [2.5], "status": ["c"], "extra": [True]}),
+            pa.table({"id": [3], "status": pa.array([7], pa.int8())}),
+        ]
+
+        # Exercise
+        table = concat_tables(tables, keys=["first", "second", "third"])
+
+        # Asserts
+        self.assertEqual(table.column_names, ["id", "status", "extra"])
+        self.assertEqual(table["id"].to_pylist(), [1.0, 2.0, 2.5, 3.0])
+        self.assertEqual(table["extra"].to_pylist(), [None, None, True, None])
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("status").type))
+        self.assertEqual(table["status"].to_pylist(), ["a", "b", "c", "7"])
+        self.assertEqual(_logger.call_count, 3)
+        self.assertIn(
+            "Schema drift in first: missing extra", _logger.call_args_list[0][0][0]
+        )
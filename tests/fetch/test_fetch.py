@@ -7,10 +7,22 @@ Test cases for the data fetching module.
 from unittest import TestCase, mock
 from unittest.mock import MagicMock
 
+import os
+import tempfile
 from io import BytesIO
 import pandas as pd
+import pyarrow as pa
 
-from src.ds_stoa.fetch._fetch import fetch, fetch_url
+from src.ds_stoa.fetch._fetch import (
+    download,
+    fetch,
+    fetch_grouped,
+    fetch_url,
+    local_path,
+    read_files,
+    schedule,
+)
+from src.ds_stoa.fetch._optimize import optimize_table
 
 
 class TestFetch(TestCase):
@@ -62,6 +74,309 @@ class TestFetch(TestCase):
         self.assertIsInstance(dataframe, pd.DataFrame)
         self.assertEqual(dataframe.shape, (3, 2))
 
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_dtype_backend(self, _fetch_url):
+        """
+        Test case for the fetch function with Arrow-backed dtypes.
+        """
+
+        # Setup
+        def _buffer(url):
+            buffer = BytesIO()
+            self._dataframe.to_parquet(buffer, index=False)
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+        pre_signed_urls = {"a": "http://a", "b": "http://b"}
+
+        # Exercise
+        dataframe = fetch(pre_signed_urls, dtype_backend="pyarrow", categorical=True)
+
+        # Asserts
+        self.assertEqual(dataframe.shape, (6, 2))
+        self.assertEqual(list(dataframe.index), list(range(6)))
+        self.assertIsInstance(dataframe["column1"].dtype, pd.ArrowDtype)
+        self.assertEqual(dataframe["column2"].dtype, "category")
+        with self.assertRaises(ValueError):
+            fetch(pre_signed_urls, dtype_backend="invalid")
+
+    @mock.patch("src.ds_stoa.fetch._fetch.LOGGER.info")
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_optimize_memory(self, _fetch_url, _logger):
+        """
+        Test case for the fetch function with memory optimization.
+        """
+
+        # Setup
+        def _buffer(url):
+            buffer = BytesIO()
+            pd.DataFrame({"id": [1, 2, 3, 4], "status": ["a", "b"] * 2}).to_parquet(
+                buffer, index=False
+            )
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+
+        # Exercise
+        dataframe = fetch({"a": "http://a", "b": "http://b"}, optimize_memory=True)
+
+        # Asserts
+        self.assertEqual(dataframe.shape, (8, 2))
+        self.assertEqual(dataframe["id"].dtype, "int8")
+        self.assertEqual(dataframe["status"].dtype, "category")
+        self.assertIn("Memory optimization saved", _logger.call_args[0][0])
+
+    @mock.patch("src.ds_stoa.fetch._decode.LOGGER.warning")
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_optimize_memory_drift(self, _fetch_url, _logger):
+        """
+        Test case for the fetch function with memory optimization of drifted files.
+        """
+
+        # Setup
+        frames = {
+            "http://a": pd.DataFrame({"x": [1, 2, 3, 4], "status": ["p", "q"] * 2}),
+            "http://b": pd.DataFrame({"x": [0.5, 1.5], "status": [1, 2]}),
+            "http://c": pd.DataFrame({"x": ["u", "v"], "status": ["p", "p"]}),
+        }
+
+        def _buffer(url):
+            buffer = BytesIO()
+            frames[url].to_parquet(buffer, index=False)
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+
+        # Exercise
+        numeric = fetch({"a": "http://a", "b": "http://b"}, optimize_memory=True)
+        mixed = fetch(
+            {"a": "http://a", "b": "http://b", "c": "http://c"}, optimize_memory=True
+        )
+
+        # Asserts
+        self.assertEqual(numeric["x"].dtype, "float32")
+        self.assertEqual(list(numeric["x"]), [1.0, 2.0, 3.0, 4.0, 0.5, 1.5])
+        self.assertEqual(numeric["status"].dtype, "category")
+        self.assertEqual(list(numeric["status"]), ["p", "q", "p", "q", "1", "2"])
+        self.assertTrue(all(isinstance(value, str) for value in mixed["x"]))
+        self.assertEqual(list(mixed["x"]), ["1", "2", "3", "4", "0.5", "1.5", "u", "v"])
+
+    @mock.patch("src.ds_stoa.fetch._fetch.optimize_table")
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_optimize_memory_arrow(self, _fetch_url, _optimize_table):
+        """
+        Test case for the fetch function optimizing every Arrow file before concatenation.
+        """
+
+        # Setup
+        def _buffer(url):
+            buffer = BytesIO()
+            pd.DataFrame({"id": [1, 2, 3, 4], "status": ["a", "b"] * 2}).to_parquet(
+                buffer, index=False
+            )
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+        _optimize_table.side_effect = optimize_table
+
+        # Exercise
+        dataframe = fetch(
+            {"a": "http://a", "b": "http://b"},
+            optimize_memory=True,
+            dtype_backend="pyarrow",
+        )
+
+        # Asserts
+        self.assertEqual(dataframe.shape, (8, 2))
+        self.assertEqual(str(dataframe["id"].dtype), "int8[pyarrow]")
+        self.assertEqual(dataframe["status"].dtype, "category")
+        self.assertEqual(_optimize_table.call_count, 2)
+
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_sort_by(self, _fetch_url):
+        """
+        Test case for the fetch function sorting the result by a column.
+        """
+
+        # Setup
+        frames = {
+            "http://a": pd.DataFrame({"id": [5, 1, 3], "file": "a"}),
+            "http://b": pd.DataFrame({"id": [1, 2, 6], "file": "b"}),
+        }
+
+        def _buffer(url):
+            buffer = BytesIO()
+            frames[url].to_parquet(buffer, index=False)
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+        pre_signed_urls = {"a": "http://a", "b": "http://b"}
+
+        # Exercise
+        dataframe = fetch(pre_signed_urls, sort_by="id")
+        table = fetch(pre_signed_urls, sort_by="id", dtype_backend="pyarrow")
+
+        # Asserts
+        self.assertEqual(list(dataframe["id"]), [1, 1, 2, 3, 5, 6])
+        self.assertEqual(list(dataframe["file"]), ["a", "b", "b", "a", "a", "b"])
+        self.assertEqual(list(dataframe.index), [1, 0, 1, 2, 0, 2])
+        self.assertEqual(list(table["id"]), [1, 1, 2, 3, 5, 6])
+        self.assertEqual(list(table["file"]), ["a", "b", "b", "a", "a", "b"])
+
+    @mock.patch("src.ds_stoa.fetch._decode.LOGGER.warning")
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_sort_by_missing_column(self, _fetch_url, _logger):
+        """
+        Test case for the fetch function sorting by a column some files lack.
+        """
+
+        # Setup
+        frames = {
+            "http://a": pd.DataFrame({"id": [3, 1], "file": "a"}),
+            "http://b": pd.DataFrame({"file": ["b"]}),
+            "http://c": pd.DataFrame({"id": [2], "file": "c"}),
+        }
+
+        def _buffer(url):
+            buffer = BytesIO()
+            frames[url].to_parquet(buffer, index=False)
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+        pre_signed_urls = {"a": "http://a", "b": "http://b", "c": "http://c"}
+
+        # Exercise
+        dataframe = fetch(pre_signed_urls, sort_by="id")
+        table = fetch(pre_signed_urls, sort_by="id", dtype_backend="pyarrow")
+
+        # Asserts
+        self.assertEqual(list(dataframe["file"]), ["a", "c", "a", "b"])
+        self.assertEqual(list(dataframe["id"][:3]), [1, 2, 3])
+        self.assertTrue(pd.isna(dataframe["id"].iloc[-1]))
+        self.assertEqual(list(table["file"]), ["a", "c", "a", "b"])
+
+    @mock.patch("src.ds_stoa.fetch._decode.LOGGER.warning")
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_schema_drift(self, _fetch_url, _logger):
+        """
+        Test case for the fetch function with drifted schemas.
+        """
+
+        # Setup
+        frames = {
+            "http://a": pd.DataFrame({"id": [1, 2], "code": ["x", "y"]}),
+            "http://b": pd.DataFrame({"id": [2.5], "code": [7], "extra": [True]}),
+        }
+
+        def _buffer(url):
+            buffer = BytesIO()
+            frames[url].to_parquet(buffer, index=False)
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+        pre_signed_urls = {"a": "http://a", "b": "http://b"}
+
+        # Exercise
+        dataframe = fetch(pre_signed_urls)
+        arrow = fetch(pre_signed_urls, dtype_backend="pyarrow")
+
+        # Asserts
+        self.assertEqual(list(dataframe["id"]), [1.0, 2.0, 2.5])
+        self.assertEqual(dataframe["id"].dtype, "float64")
+        self.assertEqual(list(dataframe["code"]), ["x", "y", "7"])
+        self.assertEqual(list(dataframe.index), [0, 1, 0])
+        self.assertEqual(str(arrow["extra"].dtype), "bool[pyarrow]")
+        self.assertEqual(_logger.call_count, 4)
+
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_filters_missing_column(self, _fetch_url):
+        """
+        Test case for the fetch function filtering on a column some files lack.
+        """
+
+        # Setup
+        frames = {
+            "http://a": pd.DataFrame({"id": [1, 2, 3], "x": [1, 2, 1]}),
+            "http://b": pd.DataFrame({"id": [4, 5]}),
+        }
+
+        def _buffer(url):
+            buffer = BytesIO()
+            frames[url].to_parquet(buffer, index=False)
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+        pre_signed_urls = {"a": "http://a", "b": "http://b"}
+
+        # Exercise
+        dataframe = fetch(pre_signed_urls, filters=[("x", "=", 1)])
+        arrow = fetch(pre_signed_urls, filters=[("x", "=", 1)], dtype_backend="pyarrow")
+        either = fetch(pre_signed_urls, filters=[[("x", "=", 2)], [("id", ">", 4)]])
+        empty = fetch({"b": "http://b"}, filters=[("x", "=", 1)])
+
+        # Asserts
+        self.assertEqual(list(dataframe["id"]), [1, 3])
+        self.assertEqual(list(arrow["id"]), [1, 3])
+        self.assertEqual(list(either["id"]), [2, 5])
+        self.assertTrue(empty.empty)
+
+    @mock.patch("src.ds_stoa.fetch._fetch.read_row_groups")
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_row_groups(self, _fetch_url, _read_row_groups):
+        """
+        Test case for the fetch function reading chosen row groups of objects.
+        """
+        # Setup
+        buffer = BytesIO()
+        pd.DataFrame({"id": [1, 2, 3]}).to_parquet(buffer, index=False)
+        buffer.seek(0)
+        _fetch_url.return_value = buffer
+        _read_row_groups.return_value = pa.table({"id": [11, 12, 13]})
+        pre_signed_urls = {"a": "http://a", "b": "http://b"}
+
+        # Exercise
+        dataframe = fetch(
+            pre_signed_urls, filters=[("id", "<=", 12)], row_groups={"b": [1]}
+        )
+
+        # Asserts
+        self.assertEqual(list(dataframe["id"]), [1, 2, 3, 11, 12])
+        _fetch_url.assert_called_once_with("http://a")
+        _read_row_groups.assert_called_once_with(
+            "http://b", [1], size=None, read_dictionary=None, categorical=False
+        )
+
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_host_cache(self, _fetch_url):
+        """
+        Test case for the fetch function with a host cache.
+        """
+        # Setup
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "key.parquet")
+        self._dataframe.to_parquet(path, index=False)
+        host_cache = MagicMock()
+        host_cache.get.return_value = path
+
+        # Exercise
+        dataframe = fetch(self.pre_signed_urls, host_cache=host_cache)
+
+        # Asserts
+        self.assertEqual(dataframe.shape, (3, 2))
+        host_cache.get.assert_called_once_with(
+            "key", "http://example.com/data1.parquet"
+        )
+        _fetch_url.assert_not_called()
+
     @mock.patch("src.ds_stoa.fetch._fetch.LOGGER.error")
     @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
     def test_fetch_error(self, _fetch_url, _logger):
@@ -91,3 +406,177 @@ class TestFetch(TestCase):
         _logger.assert_called_once_with(
             "http://example.com/data1.parquet generated an exception: Test exception"
         )
+
+    @mock.patch("src.ds_stoa.fetch._decode.LOGGER.warning")
+    def test_read_files_drift(self, _logger):
+        """
+        Test case for the read_files function with drifted schemas.
+        """
+        # Setup
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, f"{name}.parquet") for name in "ab"]
+            pd.DataFrame({"id": [1, 2], "x": [1, 2], "z": [1, 2]}).to_parquet(
+                paths[0], index=False
+            )
+            pd.DataFrame({"id": [3], "x": [0.5], "y": ["new"], "z": ["a"]}).to_parquet(
+                paths[1], index=False
+            )
+
+            # Exercise
+            dataframe = read_files(paths)
+
+        # Asserts
+        self.assertEqual(list(dataframe["x"]), [1.0, 2.0, 0.5])
+        self.assertEqual(dataframe["x"].dtype, "float64")
+        self.assertEqual(list(dataframe["y"].isna()), [True, True, False])
+        self.assertEqual(list(dataframe["z"]), ["1", "2", "a"])
+        _logger.assert_called()
+        self.assertTrue(read_files([]).empty)
+
+    def test_local_path(self):
+        """
+        Test case for the local_path function.
+        """
+        # Exercise & Asserts
+        self.assertEqual(
+            local_path("/tmp", "a/../b/./c.parquet"),
+            os.path.join("/tmp", "a", "b", "c.parquet"),
+        )
+        with self.assertRaises(ValueError):
+            local_path("/tmp", "../")
+
+    @mock.patch("src.ds_stoa.fetch._fetch.requests.get")
+    def test_download(self, mock_get):
+        """
+        Test case for the download function.
+        """
+        # Setup
+        _response = MagicMock()
+        _response.__enter__.return_value = _response
+        _response.iter_content.return_value = [b"mock ", b"data"]
+        mock_get.return_value = _response
+
+        with tempfile.TemporaryDirectory() as directory:
+            destination = os.path.join(directory, "nested", "data.parquet")
+
+            # Exercise
+            result = download("http://example.com/data.parquet", destination)
+
+            # Asserts
+            self.assertEqual(result, destination)
+            with open(destination, "rb") as file:
+                self.assertEqual(file.read(), b"mock data")
+            self.assertEqual(os.listdir(os.path.dirname(destination)), ["data.parquet"])
+
+    def test_schedule(self):
+        """
+        Test case for the schedule function.
+        """
+        # Setup
+        pre_signed_urls = {"small": "s", "unknown": "u", "large": "l"}
+
+        # Exercise
+        order = schedule(pre_signed_urls, sizes={"small": 1, "large": 100})
+
+        # Asserts
+        self.assertEqual([key for key, _ in order], ["unknown", "large", "small"])
+        self.assertEqual(schedule(pre_signed_urls), list(pre_signed_urls.items()))
+
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url_ranged")
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_split(self, _fetch_url, _fetch_url_ranged):
+        """
+        Test case for splitting large objects into ranged downloads.
+        """
+        # Setup
+        pre_signed_urls = {
+            "small": "http://example.com/small.parquet",
+            "large": "http://example.com/large.parquet",
+        }
+        buffers = []
+        for _ in range(2):
+            _buffer = BytesIO()
+            self._dataframe.to_parquet(_buffer, index=False)
+            _buffer.seek(0)
+            buffers.append(_buffer)
+        _fetch_url.return_value = buffers[0]
+        _fetch_url_ranged.return_value = buffers[1]
+
+        # Exercise
+        dataframe = fetch(
+            pre_signed_urls, sizes={"small": 10, "large": 1000}, split_threshold=100
+        )
+
+        # Asserts
+        self.assertEqual(dataframe.shape, (6, 2))
+        _fetch_url.assert_called_once_with("http://example.com/small.parquet")
+        _fetch_url_ranged.assert_called_once_with(
+            "http://example.com/large.parquet", 1000
+        )
+
+    @mock.patch("src.ds_stoa.fetch._fetch.LOGGER.error")
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_grouped(self, _fetch_url, _logger):
+        """
+        Test case for the fetch_grouped function.
+        """
+
+        # Setup
+        def _fetch(url):
+            if url == "bad":
+                raise Exception("Test exception")
+            _buffer = BytesIO()
+            self._dataframe.to_parquet(_buffer, index=False)
+            _buffer.seek(0)
+            return _buffer
+
+        _fetch_url.side_effect = _fetch
+        groups = {
+            "product1": {"a": "good", "b": "good"},
+            "product2": {"c": "bad"},
+        }
+
+        # Exercise
+        dataframes = fetch_grouped(groups)
+
+        # Asserts
+        self.assertEqual(dataframes["product1"].shape, (6, 2))
+        self.assertTrue(dataframes["product2"].empty)
+        _logger.assert_called_once()
+
+    @mock.patch("src.ds_stoa.fetch._decode.LOGGER.warning")
+    @mock.patch("src.ds_stoa.fetch._fetch.fetch_url")
+    def test_fetch_grouped_options(self, _fetch_url, _logger):
+        """
+        Test case for the fetch_grouped function with drifted schemas and options.
+        """
+
+        # Setup
+        frames = {
+            "http://a": pd.DataFrame({"id": [3, 1], "code": ["x", "y"]}),
+            "http://b": pd.DataFrame({"id": [2.5], "code": [7]}),
+            "http://c": pd.DataFrame({"id": [2, 1]}),
+        }
+
+        def _buffer(url):
+            buffer = BytesIO()
+            frames[url].to_parquet(buffer, index=False)
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+        groups = {
+            "product1": {"a": "http://a", "b": "http://b"},
+            "product2": {"c": "http://c"},
+        }
+
+        # Exercise
+        dataframes = fetch_grouped(groups, sort_by="id", dtype_backend="pyarrow")
+
+        # Asserts
+        self.assertEqual(list(dataframes["product1"]["id"]), [1.0, 2.5, 3.0])
+        self.assertEqual(list(dataframes["product1"]["code"]), ["y", "7", "x"])
+        self.assertEqual(list(dataframes["product2"]["id"]), [1, 2])
+        self.assertIsInstance(dataframes["product2"]["id"].dtype, pd.ArrowDtype)
+        with self.assertRaises(ValueError):
+            fetch_grouped(groups, dtype_backend="invalid")
@@ -0,0 +1,45 @@
+"""
+Test Module for Previewing Data
+-------------------------------------------
+Test cases for the data preview module.
+"""
+
+from io import BytesIO
+from unittest import TestCase, mock
+
+import numpy as np
+import pandas as pd
+
+from src.ds_stoa.fetch._head import read_head
+
+
+class TestHead(TestCase):
+    def setUp(self):
+        buffer = BytesIO()
+        pd.DataFrame(
+            {"id": np.arange(100000), "value": np.random.default_rng(0).random(100000)}
+        ).to_parquet(buffer, index=False, row_group_size=10000)
+        self._data = buffer.getvalue()
+        self._ranges = []
+
+    def _fetch_range(self, url, start, end):
+        self._ranges.append(end + 1 - start)
+        return self._data[start : end + 1]
+
+    @mock.patch("src.ds_stoa.fetch._ranged.fetch_range")
+    def test_read_head(self, _fetch_range):
+        """
+        Test case for reading the first rows of a remote file.
+        """
+        # Setup
+        _fetch_range.side_effect = self._fetch_range
+
+        # Exercise
+        table = read_head("http://example.com", 15000, size=len(self._data))
+        transferred = sum(self._ranges)
+        everything = read_head("http://example.com", 500000, size=len(self._data))
+
+        # Asserts
+        self.assertEqual(table["id"].to_pylist(), list(range(15000)))
+        self.assertLess(transferred, len(self._data) / 2)
+        self.assertEqual(everything.num_rows, 100000)
@@ -0,0 +1,74 @@
+"""
+Test Module for Merging Sorted Data
+-------------------------------------------
+Test cases for the sorted merge module.
+"""
+
+from unittest import TestCase, mock
+
+import numpy as np
+import pandas as pd
+
+from src.ds_stoa.fetch._merge import is_sorted, merge_order, merge_sorted
+
+
+class TestMerge(TestCase):
+    def setUp(self):
+        generator = np.random.default_rng(0)
+        self._frames = []
+        for index in range(5):
+            values = generator.integers(0, 20, 30).astype(float)
+            values[generator.random(30) < 0.1] = np.nan
+            frame = pd.DataFrame(
+                {
+                    "timestamp": pd.to_datetime(values, unit="s"),
+                    "value": values,
+                    "file": index,
+                }
+            )
+            if index != 2:
+                frame = frame.sort_values("timestamp", kind="stable")
+            self._frames.append(frame)
+
+    def test_is_sorted(self):
+        """
+        Test case for checking if keys are sorted.
+        """
+        # Asserts
+        self.assertTrue(is_sorted(np.array([1.0, 1.0, 2.0, np.nan])))
+        self.assertTrue(is_sorted(np.array([], dtype=float)))
+        self.assertFalse(is_sorted(np.array([2.0, 1.0])))
+        self.assertFalse(is_sorted(np.array([1.0, np.nan, 2.0])))
+
+    @mock.patch("src.ds_stoa.fetch._merge.LOGGER.info")
+    def test_merge_sorted(self, _logger):
+        """
+        Test case for merging DataFrames sorted by a column.
+        """
+        # Setup
+        expected = pd.concat(self._frames).sort_values(
+            "timestamp", kind="stable", na_position="last"
+        )
+
+        # Exercise
+        by_timestamp = merge_sorted(self._frames, "timestamp")
+        by_value = merge_sorted(self._frames, "value")
+
+        # Asserts
+        pd.testing.assert_frame_equal(by_timestamp, expected)
+        pd.testing.assert_frame_equal(by_value, expected)
+        _logger.assert_called_with("Sorted 1 of 5 files before merging")
+
+    def test_merge_order_fallback(self):
+        """
+        Test case for merging keys numpy cannot compare.
+        """
+        # Exercise
+        order = merge_order(
+            [np.array(["b", None, "a"], dtype=object), np.array(["a", "c"])]
+        )
+        empty = merge_order([])
+
+        # Asserts
+        self.assertEqual(list(order), [2, 3, 0, 4, 1])
+        self.assertEqual(len(empty), 0)
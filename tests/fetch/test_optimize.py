@@ -0,0 +1,120 @@
+"""
+Test Module for Memory Optimization
+-------------------------------------------
+Test cases for the memory optimization module.
+"""
+
+from io import BytesIO
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.ds_stoa.fetch._optimize import (
+    concat_frames,
+    memory_usage,
+    optimize_dtypes,
+    optimize_table,
+)
+
+
+class TestOptimize(TestCase):
+    def setUp(self):
+        self._first = pd.DataFrame(
+            {
+                "small": np.arange(100),
+                "large": np.arange(100) * 100000,
+                "half": np.arange(100) / 2,
+                "random": np.linspace(0, 1, 100) / 3,
+                "status": ["open", "closed"] * 50,
+                "name": [f"name{i}" for i in range(100)],
+            }
+        )
+        self._second = self._first.assign(
+            status=["open", "pending"] * 50, small=np.arange(100) + 1000
+        )
+
+    def test_optimize_dtypes(self):
+        """
+        Test case for downcasting and categorizing columns.
+        """
+        # Exercise
+        dataframe = optimize_dtypes(self._first)
+
+        # Asserts
+        self.assertEqual(dataframe["small"].dtype, np.int8)
+        self.assertEqual(dataframe["large"].dtype, np.int32)
+        self.assertEqual(dataframe["half"].dtype, np.float32)
+        self.assertEqual(dataframe["random"].dtype, np.float64)
+        self.assertEqual(dataframe["status"].dtype, "category")
+        self.assertNotEqual(dataframe["name"].dtype, "category")
+        self.assertLess(memory_usage(dataframe), memory_usage(self._first))
+        pd.testing.assert_frame_equal(dataframe.astype(self._first.dtypes), self._first)
+
+    def test_optimize_dtypes_nested(self):
+        """
+        Test case for leaving nested columns untouched.
+        """
+        # Setup
+        buffer = BytesIO()
+        pd.DataFrame(
+            {
+                "tags": [["a", "b"], ["a"], ["a", "b"], []],
+                "point": [{"x": 1}, {"x": 2}, {"x": 1}, {"x": 1}],
+                "status": ["open", "open", "closed", "open"],
+            }
+        ).to_parquet(buffer, index=False)
+        dataframe = pd.read_parquet(BytesIO(buffer.getvalue()))
+
+        # Exercise
+        optimized = optimize_dtypes(dataframe)
+
+        # Asserts
+        self.assertEqual(optimized["tags"].dtype, object)
+        self.assertEqual(optimized["point"].dtype, object)
+        self.assertEqual(optimized["status"].dtype, "category")
+        self.assertEqual(list(optimized["tags"][0]), ["a", "b"])
+
+    def test_optimize_table(self):
+        """
+        Test case for downcasting and dictionary encoding Arrow columns.
+        """
+        # Setup
+        table = pa.Table.from_pandas(self._first, preserve_index=False)
+
+        # Exercise
+        optimized = optimize_table(table)
+
+        # Asserts
+        self.assertEqual(optimized.schema.field("small").type, pa.int8())
+        self.assertEqual(optimized.schema.field("large").type, pa.int32())
+        self.assertEqual(optimized.schema.field("half").type, pa.float32())
+        self.assertEqual(optimized.schema.field("random").type, pa.float64())
+        self.assertTrue(pa.types.is_dictionary(optimized.schema.field("status").type))
+        self.assertFalse(pa.types.is_dictionary(optimized.schema.field("name").type))
+        self.assertLess(optimized.nbytes, table.nbytes)
+        self.assertEqual(optimized.schema.metadata, table.schema.metadata)
+        pd.testing.assert_frame_equal(
+            optimized.to_pandas().astype(self._first.dtypes), self._first
+        )
+
+    def test_concat_frames(self):
+        """
+        Test case for concatenating frames with different categories.
+        """
+        # Exercise
+        dataframe = concat_frames(
+            [optimize_dtypes(self._first), optimize_dtypes(self._second)]
+        )
+
+        # Asserts
+        self.assertEqual(dataframe["status"].dtype, "category")
+        self.assertEqual(
+            sorted(dataframe["status"].cat.categories), ["closed", "open", "pending"]
+        )
+        self.assertEqual(dataframe["small"].dtype, np.int16)
+        self.assertEqual(
+            list(dataframe["status"]),
+            list(self._first["status"]) + list(self._second["status"]),
+        )
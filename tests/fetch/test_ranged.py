@@ -0,0 +1,188 @@
+"""
+Test Module for Ranged Requests
+-------------------------------------------
+Test cases for the ranged requests module.
+"""
+
+import os
+import tempfile
+from io import BytesIO
+from unittest import TestCase, mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.ds_stoa.fetch._ranged import (
+    RangedFile,
+    discover_sizes,
+    download_ranged,
+    fetch_range,
+    fetch_url_ranged,
+    object_size,
+    read_row_groups,
+)
+
+
+class TestRanged(TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * 4
+
+    def _ranged_get(self, url, headers, timeout, stream=False):
+        start, end = headers["Range"][len("bytes=") :].split("-")
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.status_code = 206
+        response.content = self.data[int(start) : int(end) + 1]
+        response.headers = {
+            "Content-Range": f"bytes {start}-{end}/{len(self.data)}",
+        }
+        return response
+
+    @mock.patch("src.ds_stoa.fetch._ranged.requests.get")
+    def test_fetch_range(self, mock_get):
+        """
+        Test case for the fetch_range function.
+        """
+        # Setup
+        mock_get.side_effect = self._ranged_get
+
+        # Exercise & Asserts
+        self.assertEqual(fetch_range("http://example.com", 4, 7), self.data[4:8])
+        self.assertEqual(mock_get.call_count, 1)
+
+    @mock.patch("src.ds_stoa.fetch._ranged.LOGGER.warning")
+    @mock.patch("src.ds_stoa.fetch._ranged.requests.get")
+    def test_fetch_range_fallback(self, mock_get, _logger):
+        """
+        Test case for the fetch_range function falling back to a plain GET.
+        """
+
+        # Setup
+        def _response(status_code, content):
+            response = MagicMock(status_code=status_code, content=content)
+            response.__enter__.return_value = response
+            return response
+
+        full = _response(200, self.data)
+
+        # Exercise & Asserts
+        mock_get.side_effect = [_response(200, self.data), full]
+        self.assertEqual(fetch_range("http://example.com", 4, 7), self.data[4:8])
+        self.assertNotIn("headers", mock_get.call_args.kwargs)
+        full.__enter__.assert_called_once()
+
+        mock_get.side_effect = [_response(206, self.data[4:6]), full]
+        self.assertEqual(fetch_range("http://example.com", 4, 7), self.data[4:8])
+
+        mock_get.side_effect = [_response(206, b""), full]
+        with self.assertRaises(ValueError):
+            fetch_range("http://example.com", len(self.data), len(self.data) + 3)
+        self.assertEqual(_logger.call_count, 3)
+
+    @mock.patch("src.ds_stoa.fetch._ranged.requests.get")
+    def test_object_size(self, mock_get):
+        """
+        Test case for the object_size and discover_sizes functions.
+        """
+        # Setup
+        mock_get.side_effect = self._ranged_get
+
+        # Exercise & Asserts
+        self.assertEqual(object_size("http://example.com"), len(self.data))
+        self.assertEqual(
+            discover_sizes({"a": "http://a", "b": "http://b"}),
+            {"a": len(self.data), "b": len(self.data)},
+        )
+
+    @mock.patch("src.ds_stoa.fetch._ranged.requests.get")
+    def test_fetch_url_ranged(self, mock_get):
+        """
+        Test case for the fetch_url_ranged function.
+        """
+        # Setup
+        mock_get.side_effect = self._ranged_get
+
+        # Exercise
+        buffer = fetch_url_ranged("http://example.com", len(self.data), chunk_size=100)
+
+        # Asserts
+        self.assertEqual(buffer.getvalue(), self.data)
+        self.assertEqual(mock_get.call_count, 11)
+
+    @mock.patch("src.ds_stoa.fetch._ranged.requests.get")
+    def test_download_ranged(self, mock_get):
+        """
+        Test case for the download_ranged function.
+        """
+        # Setup
+        mock_get.side_effect = self._ranged_get
+
+        with tempfile.TemporaryDirectory() as directory:
+            destination = os.path.join(directory, "data.parquet")
+
+            # Exercise
+            download_ranged("http://example.com", destination, parts=3)
+
+            # Asserts
+            with open(destination, "rb") as file:
+                self.assertEqual(file.read(), self.data)
+            self.assertEqual(os.listdir(directory), ["data.parquet"])
+            self.assertEqual(mock_get.call_count, 4)
+
+    @mock.patch("src.ds_stoa.fetch._ranged.requests.get")
+    def test_ranged_file(self, mock_get):
+        """
+        Test case for the RangedFile class.
+        """
+        # Setup
+        mock_get.side_effect = self._ranged_get
+        file = RangedFile("http://example.com")
+
+        # Exercise & Asserts
+        self.assertEqual(file.size, len(self.data))
+        file.seek(-8, os.SEEK_END)
+        self.assertEqual(file.read(4), self.data[-8:-4])
+        self.assertEqual(file.read(), self.data[-4:])
+        self.assertEqual(file.read(4), b"")
+        file.seek(10)
+        self.assertEqual(file.read(5), self.data[10:15])
+        self.assertEqual(file.tell(), 15)
+        self.assertEqual(mock_get.call_count, 4)
+
+    @mock.patch("src.ds_stoa.fetch._ranged.fetch_range")
+    def test_read_row_groups(self, _fetch_range):
+        """
+        Test case for the read_row_groups function.
+        """
+        # Setup
+        buffer = BytesIO()
+        pd.DataFrame(
+            {
+                "id": range(100000),
+                "value": np.random.default_rng(42).random(100000),
+                "status": ["open", "closed"] * 50000,
+            }
+        ).to_parquet(buffer, index=False, row_group_size=10000)
+        data = buffer.getvalue()
+        ranges = []
+
+        def _ranged(url, start, end):
+            ranges.append((start, end))
+            return data[start : end + 1]
+
+        _fetch_range.side_effect = _ranged
+
+        # Exercise
+        table = read_row_groups(
+            "http://example.com", [7, 2], size=len(data), categorical=True
+        )
+
+        # Asserts
+        self.assertEqual(
+            table["id"].to_pylist(),
+            list(range(20000, 30000)) + list(range(70000, 80000)),
+        )
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("status").type))
+        self.assertLess(sum(end - start + 1 for start, end in ranges), len(data) / 2)
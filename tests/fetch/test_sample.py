@@ -0,0 +1,118 @@
+"""
+Test Module for Sampling Data
+-------------------------------------------
+Test cases for the data sampling module.
+"""
+
+from io import BytesIO
+from unittest import TestCase, mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.ds_stoa.fetch._sample import (
+    fetch_sample,
+    object_fraction,
+    read_sample,
+    sample_row_groups,
+)
+
+
+class TestSample(TestCase):
+    def setUp(self):
+        self._data = {}
+        for index in range(2):
+            buffer = BytesIO()
+            pd.DataFrame(
+                {
+                    "id": np.arange(1000) + index * 1000,
+                    "status": ["open", "closed"] * 500,
+                }
+            ).to_parquet(buffer, index=False, row_group_size=100)
+            self._data[f"http://{index}"] = buffer.getvalue()
+        self.pre_signed_urls = {f"file{index}": f"http://{index}" for index in range(2)}
+        self._ranges = []
+
+    def _fetch_range(self, url, start, end):
+        self._ranges.append((url, start, end))
+        return self._data[url][start : end + 1]
+
+    def test_sample_row_groups(self):
+        """
+        Test case for sampling row groups.
+        """
+        # Exercise
+        row_groups = sample_row_groups(10, fraction=0.3, seed="42:file0")
+
+        # Asserts
+        self.assertEqual(len(row_groups), 3)
+        self.assertEqual(row_groups, sorted(row_groups))
+        self.assertEqual(row_groups, sample_row_groups(10, 0.3, "42:file0"))
+        self.assertEqual(len(sample_row_groups(10, 0.01, "42")), 1)
+        self.assertEqual(sample_row_groups(0, 0.5, "42"), [])
+
+    @mock.patch("src.ds_stoa.fetch._ranged.fetch_range")
+    def test_read_sample(self, _fetch_range):
+        """
+        Test case for reading sampled row groups of a remote file.
+        """
+        # Setup
+        _fetch_range.side_effect = self._fetch_range
+        url = "http://0"
+        size = len(self._data[url])
+
+        # Exercise
+        table = read_sample(url, 0.2, "42", size=size, categorical=True)
+
+        # Asserts
+        self.assertEqual(table.num_rows, 200)
+        self.assertEqual(len({value // 100 for value in table["id"].to_pylist()}), 2)
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("status").type))
+
+    @mock.patch("src.ds_stoa.fetch._sample.LOGGER.error")
+    @mock.patch("src.ds_stoa.fetch._ranged.fetch_range")
+    def test_fetch_sample(self, _fetch_range, _logger):
+        """
+        Test case for the fetch_sample function.
+        """
+        # Setup
+        _fetch_range.side_effect = self._fetch_range
+        sizes = {key: len(self._data[url]) for key, url in self.pre_signed_urls.items()}
+        pre_signed_urls = {**self.pre_signed_urls, "missing": "http://missing"}
+        sizes["missing"] = 10
+
+        # Exercise
+        dataframe = fetch_sample(
+            pre_signed_urls,
+            fraction=0.3,
+            seed=42,
+            sizes=sizes,
+            filters=[("status", "=", "open")],
+            dtype_backend="pyarrow",
+        )
+        again = fetch_sample(pre_signed_urls, fraction=0.3, seed=42, sizes=sizes)
+
+        # Asserts
+        self.assertEqual(len(dataframe), 300)
+        self.assertTrue((dataframe["status"] == "open").all())
+        self.assertIsInstance(dataframe["id"].dtype, pd.ArrowDtype)
+        self.assertEqual(list(dataframe["id"]), sorted(dataframe["id"]))
+        self.assertEqual(list(again["id"][::2]), list(dataframe["id"]))
+        self.assertEqual(_logger.call_count, 2)
+        with self.assertRaises(ValueError):
+            fetch_sample(pre_signed_urls, fraction=0)
+
+    def test_object_fraction(self):
+        """
+        Test case for splitting a sample between objects and row groups.
+        """
+        # Exercise & Asserts
+        self.assertAlmostEqual(object_fraction([1] * 10, 0.01, 0.1), 0.01)
+        self.assertAlmostEqual(object_fraction([10] * 10, 0.01, 0.1), 0.1)
+        self.assertAlmostEqual(
+            object_fraction([1, 10], 0.1, 0.1, weights=[1, 1]), 0.1 * 2 / 1.1
+        )
+        self.assertEqual(object_fraction([1, 1], 0.9, 0.5), 0.9)
+        self.assertEqual(object_fraction([4, 4], 0.9, 0.1), 1.0)
+        self.assertEqual(object_fraction([0, 0], 0.1, 0.5), 0.1)
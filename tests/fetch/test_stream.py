@@ -0,0 +1,247 @@
+"""
+Test Module for Streaming Data
+-------------------------------------------
+Test cases for the data streaming module.
+"""
+
+import json
+import threading
+import time
+from io import BytesIO, StringIO
+from unittest import TestCase, mock
+
+import pandas as pd
+
+from src.ds_stoa.fetch._stream import (
+    iter_batches,
+    iter_frames,
+    iter_records,
+    to_ndjson,
+)
+
+
+class TestStream(TestCase):
+    def setUp(self):
+        self.pre_signed_urls = {
+            "key": "http://example.com/data1.parquet",
+        }
+        self._dataframe = pd.DataFrame(
+            {"column1": [1, 2, 3], "column2": ["a", "b", "c"]}
+        )
+        self._buffer = BytesIO()
+        self._dataframe.to_parquet(self._buffer, index=False)
+        self._buffer.seek(0)
+
+    @mock.patch("src.ds_stoa.fetch._stream.fetch_url")
+    def test_iter_batches(self, _fetch_url):
+        """
+        Test case for the iter_batches function.
+        """
+        # Setup
+        _fetch_url.return_value = self._buffer
+
+        # Exercise
+        batches = list(iter_batches(self.pre_signed_urls, batch_size=2))
+
+        # Asserts
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+
+    @mock.patch("src.ds_stoa.fetch._stream.fetch_url")
+    def test_iter_batches_prefetch(self, _fetch_url):
+        """
+        Test case for the iter_batches function keeping the key order within
+        a bounded prefetch window.
+        """
+        # Setup
+        calls = []
+        lock = threading.Lock()
+
+        def _buffer(url):
+            with lock:
+                calls.append(url)
+            if url == "http://a":
+                time.sleep(0.05)
+            buffer = BytesIO()
+            pd.DataFrame({"url": [url]}).to_parquet(buffer, index=False)
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+        pre_signed_urls = {key: f"http://{key}" for key in "abcdef"}
+
+        # Exercise
+        batches = iter_batches(pre_signed_urls, prefetch=2)
+        first = next(batches)
+        self._wait_for(calls, 3)
+        time.sleep(0.05)
+        ahead = len(calls)
+        rest = list(batches)
+
+        # Asserts
+        self.assertEqual(first, [{"url": "http://a"}])
+        self.assertEqual(ahead, 3)
+        self.assertEqual(
+            [batch[0]["url"] for batch in rest],
+            [f"http://{key}" for key in "bcdef"],
+        )
+
+    @mock.patch("src.ds_stoa.fetch._stream.fetch_url")
+    def test_iter_records(self, _fetch_url):
+        """
+        Test case for the iter_records function.
+        """
+        # Setup
+        _fetch_url.return_value = self._buffer
+
+        # Exercise
+        records = list(iter_records(self.pre_signed_urls))
+
+        # Asserts
+        self.assertEqual(records, self._dataframe.to_dict(orient="records"))
+
+    @mock.patch("src.ds_stoa.fetch._stream.LOGGER.error")
+    @mock.patch("src.ds_stoa.fetch._stream.fetch_url")
+    def test_to_ndjson(self, _fetch_url, _logger):
+        """
+        Test case for the to_ndjson function.
+        """
+        # Setup
+        pre_signed_urls = {
+            "bad_file": "http://example.com/data1.parquet",
+            "good_file": "http://example.com/data2.parquet",
+        }
+        _fetch_url.side_effect = [
+            Exception("Test exception"),
+            self._buffer,
+        ]
+        stream = StringIO()
+
+        # Exercise
+        count = to_ndjson(pre_signed_urls, stream)
+
+        # Asserts
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(count, 3)
+        self.assertEqual(json.loads(lines[0]), {"column1": 1, "column2": "a"})
+        _logger.assert_called_once()
+
+    def _wait_for(self, calls, count):
+        deadline = time.monotonic() + 2
+        while len(calls) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    @mock.patch("src.ds_stoa.fetch._stream.LOGGER.error")
+    @mock.patch("src.ds_stoa.fetch._stream.fetch_url")
+    def test_iter_frames(self, _fetch_url, _logger):
+        """
+        Test case for the iter_frames function.
+        """
+        # Setup
+        calls = []
+        lock = threading.Lock()
+
+        def _buffer(url):
+            with lock:
+                calls.append(url)
+            if url == "http://c":
+                raise Exception("Test exception")
+            buffer = BytesIO()
+            pd.DataFrame({"url": [url]}).to_parquet(buffer, index=False)
+            buffer.seek(0)
+            return buffer
+
+        _fetch_url.side_effect = _buffer
+        pre_signed_urls = {key: f"http://{key}" for key in "abcde"}
+
+        # Exercise
+        frames = iter_frames(pre_signed_urls, prefetch=2)
+        first = next(frames)
+        self._wait_for(calls, 3)
+        ahead = len(calls)
+        rest = list(frames)
+
+        # Asserts
+        self.assertEqual(list(first["url"]), ["http://a"])
+        self.assertEqual(ahead, 3)
+        self.assertEqual(
+            [frame["url"][0] for frame in rest], ["http://b", "http://d", "http://e"]
+        )
+        _logger.assert_called_once()
+        with self.assertRaises(ValueError):
+            next(iter_frames(pre_signed_urls, prefetch=0))
+
+    @mock.patch("src.ds_stoa.fetch._stream.fetch_url")
+    def test_iter_frames_prefetch_bytes(self, _fetch_url):
+        """
+        Test case for the iter_frames function with a prefetch size.
+        """
+        # Setup
+        calls = []
+        _fetch_url.side_effect = lambda url: calls.append(url) or BytesIO(
+            self._buffer.getvalue()
+        )
+        pre_signed_urls = {key: f"http://{key}" for key in "abc"}
+
+        # Exercise
+        frames = iter_frames(
+            pre_signed_urls,
+            prefetch=3,
+            prefetch_bytes=15,
+            sizes={"a": 10, "b": 10, "c": 10},
+        )
+        next(frames)
+        self._wait_for(calls, 2)
+        time.sleep(0.05)
+        ahead = len(calls)
+        count = 1 + len(list(frames))
+
+        # Asserts
+        self.assertEqual(ahead, 2)
+        self.assertEqual(count, 3)
+
+    @mock.patch("src.ds_stoa.fetch._stream.fetch_url")
+    def test_iter_frames_close(self, _fetch_url):
+        """
+        Test case for closing the iter_frames iterator early.
+        """
+        # Setup
+        calls = []
+        _fetch_url.side_effect = lambda url: calls.append(url) or BytesIO(
+            self._buffer.getvalue()
+        )
+        pre_signed_urls = {str(key): f"http://{key}" for key in range(20)}
+
+        # Exercise
+        frames = iter_frames(pre_signed_urls, prefetch=2)
+        next(frames)
+        frames.close()
+
+        # Asserts
+        self.assertLessEqual(len(calls), 3)
+
+    @mock.patch("src.ds_stoa.fetch._stream.fetch_url")
+    def test_iter_frames_close_running(self, _fetch_url):
+        """
+        Test case for closing the iter_frames iterator while downloads run.
+        """
+        # Setup
+        release = threading.Event()
+
+        def _buffer(url):
+            if url != "http://0":
+                release.wait(2)
+            return BytesIO(self._buffer.getvalue())
+
+        _fetch_url.side_effect = _buffer
+        pre_signed_urls = {str(key): f"http://{key}" for key in range(5)}
+
+        # Exercise
+        frames = iter_frames(pre_signed_urls, prefetch=2)
+        next(frames)
+        start = time.monotonic()
+        frames.close()
+        elapsed = time.monotonic() - start
+        release.set()
+
+        # Asserts
+        self.assertLess(elapsed, 1)
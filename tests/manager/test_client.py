@@ -4,12 +4,21 @@ Test Module for Manager
 Test cases for the Manager class.
 """
 
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
 from unittest import TestCase, mock
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from requests import HTTPError
 
-from src.ds_stoa.manager import StoaClient
+from src.ds_stoa.manager import ProductSpec, StoaClient
+from src.ds_stoa.utils.hedging import HedgePolicy
 
 
 class TestManager(TestCase):
@@ -223,6 +232,92 @@ class TestManager(TestCase):
         self.assertEqual(self.stoa.order_ids, ["1234", "5678"])
         _order.called_once()
 
+    @mock.patch("src.ds_stoa.manager.client.order")
+    @mock.patch.object(StoaClient, "authenticate")
+    def test_order_sharded(self, _auth, _order) -> None:
+        """
+        Test case for the order method of a sharded client.
+        """
+        # Setup
+        keys = [f"{i}.parquet" for i in range(10)]
+        _order.return_value = keys
+        clients = [
+            StoaClient(
+                authentication="rest",
+                product_group_name="product_group_name",
+                product_name="product_name",
+                workspace="cart",
+                owner_id="owner_id",
+                shard_index=index,
+                num_shards=2,
+            )
+            for index in range(2)
+        ]
+        custom = StoaClient(
+            authentication="rest",
+            product_group_name="product_group_name",
+            product_name="product_name",
+            workspace="cart",
+            owner_id="owner_id",
+            shard_fn=lambda keys: keys[:1],
+        )
+        for client in clients + [custom]:
+            client.token = "token"
+
+        # Exercise
+        shards = [client.order() for client in clients]
+
+        # Asserts
+        self.assertEqual(sorted(shards[0] + shards[1]), keys)
+        self.assertEqual(custom.order(), ["0.parquet"])
+        with self.assertRaises(ValueError):
+            StoaClient(
+                authentication="rest",
+                product_group_name="product_group_name",
+                product_name="product_name",
+                workspace="cart",
+                owner_id="owner_id",
+                shard_index=0,
+            )
+
+    @mock.patch("src.ds_stoa.manager.client.sign")
+    @mock.patch("src.ds_stoa.manager.client.order")
+    @mock.patch.object(StoaClient, "authenticate")
+    def test_order_empty_shard(self, _auth, _order, _sign) -> None:
+        """
+        Test case for a shard without any keys.
+        """
+        # Setup
+        _order.return_value = ["0.parquet", "1.parquet"]
+        clients = [
+            StoaClient(
+                authentication="rest",
+                product_group_name="product_group_name",
+                product_name="product_name",
+                workspace="cart",
+                owner_id="owner_id",
+                shard_index=index,
+                num_shards=4,
+            )
+            for index in range(4)
+        ]
+        for client in clients:
+            client.token = "token"
+
+        # Exercise
+        shards = [client.order() for client in clients]
+        empty = clients[shards.index([])]
+
+        # Asserts
+        self.assertEqual(sorted(sum(shards, [])), _order.return_value)
+        self.assertEqual(empty.sign(), {})
+        self.assertTrue(empty.fetch(format="dataframe").empty)
+        self.assertEqual(empty.fetch(format="json"), [])
+        self.assertEqual(list(empty.iter_records()), [])
+        self.assertEqual(list(empty.iter_frames()), [])
+        self.assertEqual(empty.plan().entries, [])
+        _sign.assert_not_called()
+
     @mock.patch("src.ds_stoa.manager.client.sign")
     @mock.patch.object(StoaClient, "authenticate")
     def test_sign(self, _auth, _sign) -> None:
@@ -244,6 +339,90 @@ class TestManager(TestCase):
         )
         _sign.called_once()
 
+    @mock.patch("src.ds_stoa.manager.client.sign")
+    @mock.patch("src.ds_stoa.manager.client.rest")
+    def test_authenticate_single_flight(self, _rest, _sign) -> None:
+        """
+        Test case for concurrent calls sharing one authentication.
+        """
+        # Setup
+        barrier = threading.Barrier(8)
+
+        def _token(email, password):
+            time.sleep(0.05)
+            return "token"
+
+        _rest.side_effect = _token
+
+        # Exercise
+        def _call(index):
+            barrier.wait()
+            return self.stoa.sign(keys=["1234"])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(_call, range(8)))
+
+        # Asserts
+        _rest.assert_called_once()
+        self.assertEqual(self.stoa.token, "token")
+
+    @mock.patch("src.ds_stoa.manager.client.sign")
+    @mock.patch("src.ds_stoa.manager.client.order")
+    @mock.patch.object(StoaClient, "authenticate")
+    def test_sign_concurrent(self, _auth, _order, _sign) -> None:
+        """
+        Test case for concurrent calls receiving their own signatures.
+        """
+        # Setup
+        self.stoa.token = "token"
+        _sign.side_effect = lambda token, params: f"https://{params['key']}"
+
+        # Exercise
+        def _call(index):
+            keys = [f"{index}/{i}" for i in range(3)]
+            return keys, self.stoa.sign(keys=keys)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(_call, range(16)))
+
+        # Asserts
+        for keys, signatures in results:
+            self.assertEqual(signatures, {key: f"https://{key}" for key in keys})
+
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_plan(self, _order, _sign) -> None:
+        """
+        Test case for the plan method.
+        """
+        # Setup
+        _sign.return_value = {"1234": "https://example.com/1234.parquet"}
+
+        # Exercise
+        plan = self.stoa.plan()
+
+        # Asserts
+        self.assertEqual(plan.pre_signed_urls, _sign.return_value)
+        _order.assert_called_once()
+
+    @mock.patch("src.ds_stoa.manager.client.sign")
+    @mock.patch.object(StoaClient, "authenticate")
+    def test_sign_hedged(self, _auth, _sign) -> None:
+        """
+        Test case for the sign method with a hedging policy.
+        """
+        # Setup
+        self.stoa.token = "token"
+        self.stoa.sign_hedge = HedgePolicy()
+        _sign.return_value = "https://example.com/1234.parquet"
+
+        # Exercise
+        signatures = self.stoa.sign(keys=["1234"])
+
+        # Asserts
+        self.assertEqual(signatures, {"1234": "https://example.com/1234.parquet"})
+        _sign.assert_called_once_with(token="token", params={"key": "1234"})
+
     @mock.patch("src.ds_stoa.manager.client.fetch")
     @mock.patch.object(StoaClient, "sign")
     @mock.patch.object(StoaClient, "order")
@@ -269,6 +448,311 @@ class TestManager(TestCase):
         self.assertIsInstance(dataframe, pd.DataFrame)
         self.assertIsInstance(data, list)
 
+    @mock.patch("src.ds_stoa.manager.client.execute")
+    @mock.patch.object(StoaClient, "plan")
+    def test_fetch_size_aware(self, _plan, _execute) -> None:
+        """
+        Test case for the fetch method with size discovery.
+        """
+        # Setup
+        _execute.return_value = pd.DataFrame()
+
+        # Exercise
+        dataframe = self.stoa.fetch(format="dataframe", size_aware=True)
+
+        # Asserts
+        self.assertIsInstance(dataframe, pd.DataFrame)
+        _plan.assert_called_once_with(size_aware=True, filters=None, cache_dir=None)
+        _execute.assert_called_once_with(
+            _plan.return_value,
+            hedge=None,
+            host_cache=None,
+            filters=None,
+            dtype_backend=None,
+            read_dictionary=None,
+            categorical=False,
+            optimize_memory=False,
+            sort_by=None,
+        )
+
+    @mock.patch("src.ds_stoa.manager.client.fetch")
+    @mock.patch("src.ds_stoa.manager.client.FooterCache")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_fetch_filters(self, _order, _sign, _cache, _fetch) -> None:
+        """
+        Test case for the fetch method pruning objects with statistics.
+        """
+        # Setup
+        metadata = {}
+        for key, start in [("1234", 0), ("5678", 10)]:
+            buffer = BytesIO()
+            pd.DataFrame({"id": range(start, start + 10)}).to_parquet(
+                buffer, index=False, row_group_size=5
+            )
+            metadata[key] = pq.read_metadata(BytesIO(buffer.getvalue()))
+        _order.return_value = ["1234", "5678"]
+        _sign.side_effect = lambda keys: {key: f"https://{key}" for key in keys}
+        _cache.return_value.missing.return_value = ["1234", "5678"]
+        _cache.return_value.metadata.return_value = metadata
+        _fetch.return_value = pd.DataFrame({"id": [12]})
+        filters = [("id", "=", 12)]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Exercise
+            dataframe = self.stoa.fetch(
+                format="dataframe", filters=filters, cache_dir=cache_dir
+            )
+            self.stoa.fetch(format="dataframe", filters=filters, cache_dir=cache_dir)
+
+        # Asserts
+        self.assertEqual(len(dataframe), 1)
+        _cache.return_value.metadata.assert_called_once()
+        _fetch.assert_called_with(
+            pre_signed_urls={"5678": "https://5678"},
+            hedge=None,
+            host_cache=None,
+            filters=filters,
+            dtype_backend=None,
+            read_dictionary=None,
+            categorical=False,
+            optimize_memory=False,
+            sort_by=None,
+            row_groups={"5678": [0]},
+        )
+        self.assertEqual(_sign.call_count, 2)
+        _sign.assert_called_with(keys=["5678"])
+
+    @mock.patch("src.ds_stoa.manager.client.read_head")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_head(self, _order, _sign, _read_head) -> None:
+        """
+        Test case for the head method.
+        """
+        # Setup
+        _order.return_value = ["1234", "5678", "9012"]
+        _sign.side_effect = lambda keys: {key: f"https://{key}" for key in keys}
+        _read_head.side_effect = lambda url, n: pa.table({"id": [url] * min(n, 3)})
+
+        # Exercise
+        dataframe = self.stoa.head(5)
+
+        # Asserts
+        self.assertEqual(
+            list(dataframe["id"]), ["https://1234"] * 3 + ["https://5678"] * 2
+        )
+        self.assertEqual(_sign.call_count, 2)
+        _read_head.assert_called_with("https://5678", 2)
+        with self.assertRaises(ValueError):
+            self.stoa.head(0)
+
+    @mock.patch("src.ds_stoa.fetch._ranged.object_size")
+    @mock.patch("src.ds_stoa.fetch._ranged.fetch_range")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_fetch_sample(self, _order, _sign, _fetch_range, _object_size) -> None:
+        """
+        Test case for the fetch method with a sample of single row group objects.
+        """
+        # Setup
+        files = {}
+        for i in range(200):
+            buffer = BytesIO()
+            pd.DataFrame({"id": range(i * 10, i * 10 + 10)}).to_parquet(
+                buffer, index=False
+            )
+            files[f"https://{i}.parquet"] = buffer.getvalue()
+        data = {
+            url: len(file) - 8 - int.from_bytes(file[-8:-4], "little")
+            for url, file in files.items()
+        }
+        transferred = []
+
+        def _range(url, start, end):
+            if end < data[url]:
+                transferred.append(end + 1 - start)
+            return files[url][start : end + 1]
+
+        _order.return_value = [f"{i}.parquet" for i in range(200)]
+        _sign.side_effect = lambda keys: {key: f"https://{key}" for key in keys}
+        _fetch_range.side_effect = _range
+        _object_size.side_effect = lambda url: len(files[url])
+
+        # Exercise
+        dataframe = self.stoa.fetch(
+            format="dataframe", sample=0.05, seed=42, sort_by="id"
+        )
+
+        # Asserts
+        self.assertEqual(len(dataframe), 100)
+        self.assertEqual(list(dataframe["id"]), sorted(dataframe["id"]))
+        self.assertAlmostEqual(sum(transferred) / sum(data.values()), 0.05, delta=0.01)
+
+    @mock.patch("src.ds_stoa.manager.client.fetch_sample")
+    @mock.patch("src.ds_stoa.manager.client.FooterCache")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_fetch_sample_row_groups(
+        self, _order, _sign, _cache, _fetch_sample
+    ) -> None:
+        """
+        Test case for the fetch method with a sample of objects with many row groups.
+        """
+        # Setup
+        keys = [f"{i}.parquet" for i in range(100)]
+        _order.return_value = keys
+        _sign.side_effect = lambda keys: {key: f"https://{key}" for key in keys}
+        _cache.return_value.missing.side_effect = lambda keys: keys
+        _cache.return_value.metadata.side_effect = lambda keys, signatures: {
+            key: mock.Mock(num_row_groups=10) for key in keys
+        }
+        _cache.return_value.size.return_value = 1000
+        _fetch_sample.return_value = pd.DataFrame({"id": [3, 1, 2]})
+
+        # Exercise
+        self.stoa.fetch(format="dataframe", sample=0.04, seed=42)
+
+        # Asserts
+        pre_signed_urls = _fetch_sample.call_args.kwargs["pre_signed_urls"]
+        self.assertEqual(len(pre_signed_urls), 20)
+        self.assertEqual(_fetch_sample.call_args.kwargs["fraction"], 0.2)
+
+    @mock.patch("src.ds_stoa.manager.client.fetch_grouped")
+    @mock.patch("src.ds_stoa.manager.client.sign")
+    @mock.patch("src.ds_stoa.manager.client.order")
+    @mock.patch.object(StoaClient, "authenticate")
+    def test_fetch_many(self, _auth, _order, _sign, _fetch_grouped) -> None:
+        """
+        Test case for the fetch_many method.
+        """
+        # Setup
+        self.stoa.token = "token"
+        _order.side_effect = lambda token, params: (
+            [f"{params['product_name']}/{i}" for i in range(2)]
+        )
+        _sign.side_effect = lambda token, params: f"https://{params['key']}"
+        _fetch_grouped.side_effect = lambda groups, **kwargs: {
+            spec: pd.DataFrame({"key": list(urls)}) for spec, urls in groups.items()
+        }
+
+        # Exercise
+        data = self.stoa.fetch_many(
+            [("group", "product1", "owner"), ProductSpec("group", "product2", "owner")],
+            format="json",
+        )
+
+        # Asserts
+        _auth.assert_not_called()
+        self.assertEqual(
+            data,
+            {
+                ProductSpec("group", "product1", "owner"): [
+                    {"key": "product1/0"},
+                    {"key": "product1/1"},
+                ],
+                ProductSpec("group", "product2", "owner"): [
+                    {"key": "product2/0"},
+                    {"key": "product2/1"},
+                ],
+            },
+        )
+        self.assertEqual(_order.call_count, 2)
+        self.assertEqual(_sign.call_count, 4)
+        _fetch_grouped.assert_called_once()
+
+        # Exercise
+        self.stoa.fetch_many(
+            [("group", "product1", "owner")],
+            filters=[("id", ">", 1)],
+            categorical=True,
+            optimize_memory=True,
+            sort_by="id",
+        )
+
+        # Asserts
+        _fetch_grouped.assert_called_with(
+            groups={
+                ProductSpec("group", "product1", "owner"): {
+                    "product1/0": "https://product1/0",
+                    "product1/1": "https://product1/1",
+                }
+            },
+            hedge=None,
+            max_workers=10,
+            sizes=None,
+            host_cache=None,
+            filters=[("id", ">", 1)],
+            dtype_backend=None,
+            read_dictionary=None,
+            categorical=True,
+            optimize_memory=True,
+            sort_by="id",
+        )
+
+    @mock.patch("src.ds_stoa.manager.client.FooterCache")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_describe(self, _order, _sign, _cache) -> None:
+        """
+        Test case for the describe method.
+        """
+        # Setup
+        buffer = BytesIO()
+        pd.DataFrame({"a": [1, 2, 3]}).to_parquet(buffer, index=False)
+        metadata = pq.read_metadata(BytesIO(buffer.getvalue()))
+        _order.return_value = ["1234", "5678"]
+        _sign.return_value = {"5678": "https://example.com/5678.parquet"}
+        cache = _cache.return_value
+        cache.missing.return_value = ["5678"]
+        cache.metadata.return_value = {"1234": metadata, "5678": metadata}
+        cache.size.return_value = 100
+
+        # Exercise
+        summary = self.stoa.describe("/tmp/footers")
+
+        # Asserts
+        _cache.assert_called_once_with("/tmp/footers")
+        _sign.assert_called_once_with(keys=["5678"])
+        cache.metadata.assert_called_once_with(["1234", "5678"], _sign.return_value)
+        self.assertEqual(summary["num_rows"], 6)
+        self.assertEqual(summary["size"], 200)
+
+    @mock.patch("src.ds_stoa.manager.client.groupby_agg")
+    @mock.patch("src.ds_stoa.manager.client.aggregate")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_aggregate(self, _order, _sign, _aggregate, _groupby_agg) -> None:
+        """
+        Test case for the aggregate and groupby methods.
+        """
+        # Setup
+        _sign.return_value = {"1234": "https://example.com/1234.parquet"}
+        _aggregate.return_value = 10
+        _groupby_agg.return_value = pd.DataFrame({"amount": [1.0]})
+
+        # Exercise
+        rows = self.stoa.aggregate(len, sum)
+        totals = self.stoa.groupby("country", {"amount": "sum"})
+
+        # Asserts
+        self.assertEqual(rows, 10)
+        self.assertIs(totals, _groupby_agg.return_value)
+        _aggregate.assert_called_once_with(
+            pre_signed_urls=_sign.return_value,
+            map_fn=len,
+            combine_fn=sum,
+            hedge=None,
+            max_workers=10,
+        )
+        _groupby_agg.assert_called_once_with(
+            pre_signed_urls=_sign.return_value,
+            by="country",
+            agg={"amount": "sum"},
+            hedge=None,
+            max_workers=10,
+        )
+
     def test_invalid_format(self) -> None:
         """
         Test case for invalid format.
@@ -276,3 +760,171 @@ class TestManager(TestCase):
         # Setup, Exercise & Asserts
         with self.assertRaises(ValueError):
             self.stoa.fetch(format="invalid")
+
+    @mock.patch("src.ds_stoa.manager.client.discover_sizes")
+    @mock.patch("src.ds_stoa.manager.client.iter_frames")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_iter_frames(self, _order, _sign, _iter_frames, _discover_sizes) -> None:
+        """
+        Test case for the iter_frames method.
+        """
+        # Setup
+        _sign.return_value = {"1234": "https://example.com/1234.parquet"}
+        _iter_frames.return_value = iter([pd.DataFrame({"column": [1]})])
+        _discover_sizes.return_value = {"1234": 10}
+
+        # Exercise
+        frames = list(self.stoa.iter_frames(prefetch=4, prefetch_bytes=1 << 20))
+
+        # Asserts
+        self.assertEqual(len(frames), 1)
+        _iter_frames.assert_called_once_with(
+            pre_signed_urls=_sign.return_value,
+            prefetch=4,
+            prefetch_bytes=1 << 20,
+            sizes={"1234": 10},
+            hedge=None,
+        )
+
+    @mock.patch("src.ds_stoa.manager.client.iter_records")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_iter_records(self, _order, _sign, _iter_records) -> None:
+        """
+        Test case for the iter_records method.
+        """
+        # Setup
+        _sign.return_value = {"1234": "https://example.com/1234.parquet"}
+        _iter_records.return_value = iter([{"column": 1}, {"column": 2}])
+
+        # Exercise
+        records = list(self.stoa.iter_records(batch_size=10))
+
+        # Asserts
+        self.assertEqual(records, [{"column": 1}, {"column": 2}])
+        _iter_records.assert_called_once_with(
+            pre_signed_urls={"1234": "https://example.com/1234.parquet"},
+            batch_size=10,
+        )
+
+    @mock.patch("src.ds_stoa.manager.client.to_ndjson")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_to_ndjson(self, _order, _sign, _to_ndjson) -> None:
+        """
+        Test case for the to_ndjson method.
+        """
+        # Setup
+        self.stoa.signatures = {"1234": "https://example.com/1234.parquet"}
+        _to_ndjson.return_value = 2
+        stream = StringIO()
+
+        # Exercise
+        count = self.stoa.to_ndjson(stream)
+
+        # Asserts
+        self.assertEqual(count, 2)
+        _order.assert_called_once()
+        _sign.assert_called_once()
+
+    @mock.patch("src.ds_stoa.manager.client.fetch_to_dataset")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_fetch_to_dataset(self, _order, _sign, _fetch_to_dataset) -> None:
+        """
+        Test case for the fetch_to_dataset method.
+        """
+        # Setup
+        _sign.return_value = {"1234": "https://example.com/1234.parquet"}
+        _fetch_to_dataset.return_value = ["/tmp/product/1234"]
+
+        # Exercise
+        files = self.stoa.fetch_to_dataset("/tmp/product", partition_by=["date"])
+
+        # Asserts
+        self.assertEqual(files, ["/tmp/product/1234"])
+        _fetch_to_dataset.assert_called_once_with(
+            pre_signed_urls={"1234": "https://example.com/1234.parquet"},
+            path="/tmp/product",
+            partition_by=["date"],
+        )
+
+    @mock.patch("src.ds_stoa.manager.client.read_files")
+    @mock.patch("src.ds_stoa.manager.client.fetch_to_directory")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_fetch_incremental(
+        self, _order, _sign, _fetch_to_directory, _read_files
+    ) -> None:
+        """
+        Test case for the fetch_incremental method.
+        """
+
+        # Setup
+        def _download(pre_signed_urls, path, on_complete):
+            os.makedirs(path, exist_ok=True)
+            files = {}
+            for key in pre_signed_urls:
+                files[key] = os.path.join(path, key)
+                with open(files[key], "wb") as file:
+                    file.write(b"data")
+                on_complete(key, files[key])
+            return files
+
+        _order.return_value = ["1234", "5678"]
+        _sign.side_effect = lambda keys: {key: f"https://{key}" for key in keys}
+        _fetch_to_directory.side_effect = _download
+        _read_files.return_value = pd.DataFrame()
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Exercise
+            self.stoa.fetch_incremental(cache_dir)
+            _order.return_value = ["1234", "5678", "9012"]
+            self.stoa.fetch_incremental(cache_dir)
+            self.stoa.fetch_incremental(cache_dir, merge=True)
+
+            # Asserts
+            self.assertEqual(
+                [c.kwargs["keys"] for c in _sign.call_args_list],
+                [["1234", "5678"], ["9012"]],
+            )
+            (delta,) = _read_files.call_args_list[1].args
+            (merged,) = _read_files.call_args_list[2].args
+            self.assertEqual([os.path.basename(p) for p in delta], ["9012"])
+            self.assertEqual(len(merged), 3)
+
+    @mock.patch("src.ds_stoa.manager.client.fetch_to_directory")
+    @mock.patch.object(StoaClient, "sign")
+    @mock.patch.object(StoaClient, "order")
+    def test_fetch_resumable(self, _order, _sign, _fetch_to_directory) -> None:
+        """
+        Test case for the fetch_resumable method.
+        """
+
+        # Setup
+        def _download(pre_signed_urls, path, on_complete):
+            os.makedirs(path, exist_ok=True)
+            for key in pre_signed_urls:
+                if key == "9012":
+                    continue
+                with open(os.path.join(path, key), "wb") as file:
+                    file.write(b"data")
+                on_complete(key, os.path.join(path, key))
+
+        _order.return_value = ["1234", "5678", "9012"]
+        _sign.side_effect = lambda keys: {key: f"https://{key}" for key in keys}
+        _fetch_to_directory.side_effect = _download
+
+        with tempfile.TemporaryDirectory() as directory:
+            # Exercise
+            first = self.stoa.fetch_resumable("job", directory, chunk_size=2)
+            second = self.stoa.fetch_resumable("job", directory, chunk_size=2)
+
+            # Asserts
+            self.assertEqual(list(first), ["1234", "5678"])
+            self.assertEqual(list(second), ["1234", "5678"])
+            self.assertEqual(
+                [c.kwargs["keys"] for c in _sign.call_args_list],
+                [["1234", "5678"], ["9012"], ["9012"]],
+            )
@@ -0,0 +1,109 @@
+"""
+Test Module for Footers
+-------------------------------------------
+Test cases for the footer and describe modules.
+"""
+
+import os
+import tempfile
+from io import BytesIO
+from unittest import TestCase, mock
+
+import pandas as pd
+
+from src.ds_stoa.metadata import FooterCache, describe, parse_footer, read_footer
+
+
+class TestFooter(TestCase):
+    def setUp(self) -> None:
+        buffer = BytesIO()
+        pd.DataFrame({"a": range(100), "b": ["x"] * 100}).to_parquet(
+            buffer, index=False, row_group_size=25
+        )
+        self.data = buffer.getvalue()
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _fetch_range(self, url, start, end):
+        return self.data[start : end + 1]
+
+    @mock.patch("src.ds_stoa.fetch._ranged.fetch_range")
+    def test_read_footer(self, _fetch_range) -> None:
+        """
+        Test case for reading a footer with one or two ranged requests.
+        """
+        # Setup
+        _fetch_range.side_effect = self._fetch_range
+
+        # Exercise
+        footer, size = read_footer("http://a", size=len(self.data))
+        small_footer, _ = read_footer("http://a", size=len(self.data), tail=16)
+
+        # Asserts
+        self.assertEqual(size, len(self.data))
+        self.assertEqual(footer, small_footer)
+        self.assertTrue(self.data.endswith(footer))
+        self.assertEqual(_fetch_range.call_count, 3)
+        metadata = parse_footer(footer)
+        self.assertEqual(metadata.num_rows, 100)
+        self.assertEqual(metadata.num_row_groups, 4)
+
+    @mock.patch("src.ds_stoa.fetch._ranged.fetch_range")
+    def test_not_parquet(self, _fetch_range) -> None:
+        """
+        Test case for reading the footer of an object that is not parquet.
+        """
+        # Setup
+        _fetch_range.return_value = b"not a parquet file"
+
+        # Exercise & Asserts
+        with self.assertRaises(ValueError):
+            read_footer("http://a", size=18)
+
+    @mock.patch("src.ds_stoa.fetch._ranged.fetch_range")
+    def test_cache(self, _fetch_range) -> None:
+        """
+        Test case for caching footers on disk.
+        """
+        # Setup
+        _fetch_range.side_effect = self._fetch_range
+        cache = FooterCache(self.directory)
+        with mock.patch("src.ds_stoa.fetch._ranged.object_size") as _object_size:
+            _object_size.return_value = len(self.data)
+            cache.metadata(["2024/a"], {"2024/a": "http://a"})
+
+        # Exercise
+        cached = FooterCache(self.directory)
+        metadata = cached.metadata(["2024/a", "b"])
+
+        # Asserts
+        self.assertTrue(os.path.exists(cache.path("2024/a")))
+        self.assertEqual(cached.missing(["2024/a", "b"]), ["b"])
+        self.assertEqual(list(metadata), ["2024/a"])
+        self.assertEqual(cached.size("2024/a"), len(self.data))
+        self.assertEqual(_fetch_range.call_count, 1)
+
+    @mock.patch("src.ds_stoa.fetch._ranged.fetch_range")
+    def test_describe(self, _fetch_range) -> None:
+        """
+        Test case for describing files from their footers.
+        """
+        # Setup
+        _fetch_range.side_effect = self._fetch_range
+        cache = FooterCache()
+        sizes = {"a": len(self.data), "b": len(self.data)}
+        metadata = cache.metadata(["a", "b"], {"a": "http://a", "b": "http://b"}, sizes)
+
+        # Exercise
+        summary = describe(metadata, sizes)
+
+        # Asserts
+        self.assertEqual(summary["schema"].names, ["a", "b"])
+        self.assertEqual(summary["num_rows"], 200)
+        self.assertEqual(summary["size"], 2 * len(self.data))
+        self.assertEqual(list(summary["files"]["num_rows"]), [100, 100])
+        self.assertEqual(len(summary["row_groups"]), 8)
+        self.assertEqual(summary["drift"], {})
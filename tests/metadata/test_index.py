@@ -0,0 +1,88 @@
+"""
+Test Module for StatisticsIndex
+-------------------------------------------
+Test cases for the statistics index module.
+"""
+
+import datetime
+import os
+import tempfile
+from decimal import Decimal
+from io import BytesIO
+from unittest import TestCase
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.ds_stoa.metadata import StatisticsIndex
+
+
+class TestStatisticsIndex(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._directory.name, "statistics.json")
+        self.index = StatisticsIndex(self.path)
+        for key, month in [("jan", 1), ("feb", 2)]:
+            dataframe = pd.DataFrame(
+                {
+                    "date": [datetime.date(2024, month, day) for day in range(1, 5)],
+                    "id": [month * 10 + i for i in range(4)],
+                    "price": [Decimal("1.50")] * 4,
+                    "name": ["a", "b", None, "d"],
+                }
+            )
+            buffer = BytesIO()
+            dataframe.to_parquet(buffer, index=False, row_group_size=2)
+            self.index.add(key, pq.read_metadata(BytesIO(buffer.getvalue())))
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def test_prune(self) -> None:
+        """
+        Test case for pruning objects and row groups.
+        """
+        # Exercise & Asserts
+        keys = ["jan", "feb", "mar"]
+        self.assertEqual(
+            self.index.prune(keys, [("date", ">=", datetime.date(2024, 2, 1))]),
+            ["feb", "mar"],
+        )
+        self.assertEqual(self.index.prune(keys, [("id", "in", [11, 23])]), keys)
+        self.assertEqual(
+            self.index.prune(keys, [[("id", "<", 10)], [("id", ">", 22)]]),
+            ["feb", "mar"],
+        )
+        self.assertEqual(self.index.row_groups("jan", [("id", ">=", 12)]), [1])
+        self.assertEqual(
+            self.index.partial_row_groups(keys, [("id", ">=", 12)]), {"jan": [1]}
+        )
+        self.assertEqual(self.index.prune(keys, [("unknown", "=", 1)]), keys)
+        self.assertEqual(self.index.prune(keys, [("date", "=", "text")]), keys)
+        with self.assertRaises(ValueError):
+            self.index.prune(keys, [("id", "~", 1)])
+
+    def test_statistics(self) -> None:
+        """
+        Test case for the per-file statistics.
+        """
+        # Exercise
+        statistics = self.index.statistics("feb")
+
+        # Asserts
+        self.assertEqual(statistics["id"], {"null_count": 0, "min": 20, "max": 23})
+        self.assertEqual(statistics["name"]["null_count"], 1)
+        self.assertEqual(statistics["date"]["max"], datetime.date(2024, 2, 4))
+
+    def test_save(self) -> None:
+        """
+        Test case for persisting the index with typed values.
+        """
+        # Exercise
+        self.index.save()
+        loaded = StatisticsIndex(self.path)
+
+        # Asserts
+        self.assertEqual(loaded.missing(["jan", "feb", "mar"]), ["mar"])
+        self.assertEqual(loaded.statistics("jan"), self.index.statistics("jan"))
+        self.assertEqual(loaded.statistics("jan")["price"]["min"], Decimal("1.50"))
@@ -0,0 +1,61 @@
+"""
+Test Module for sample_keys
+-------------------------------------------
+Test cases for sample_keys module.
+"""
+
+from unittest import TestCase
+
+from src.ds_stoa.order import sample_keys
+
+
+class TestSampleKeys(TestCase):
+    def setUp(self) -> None:
+        """
+        Setup for the test cases.
+        """
+        self.keys = [
+            f"date=2024-01-0{day}/{i}.snappy.parquet"
+            for day in range(1, 4)
+            for i in range(day * 10)
+        ]
+
+    def test_sample(self) -> None:
+        """
+        Test case for sampling keys at random.
+        """
+        # Exercise
+        keys = sample_keys(self.keys, fraction=0.1, seed=42)
+
+        # Asserts
+        self.assertEqual(len(keys), 6)
+        self.assertEqual(keys, [key for key in self.keys if key in keys])
+        self.assertEqual(keys, sample_keys(list(reversed(self.keys)), 0.1, 42)[::-1])
+        self.assertNotEqual(keys, sample_keys(self.keys, fraction=0.1, seed=7))
+        self.assertEqual(sample_keys(self.keys, fraction=1), self.keys)
+
+    def test_stratified(self) -> None:
+        """
+        Test case for sampling keys of every directory.
+        """
+        # Exercise
+        keys = sample_keys(self.keys, fraction=0.1, seed=42, stratify=True)
+
+        # Asserts
+        self.assertEqual(
+            [
+                sum(key.startswith(f"date=2024-01-0{day}") for key in keys)
+                for day in (1, 2, 3)
+            ],
+            [1, 2, 3],
+        )
+
+    def test_invalid_fraction(self) -> None:
+        """
+        Test case for sampling with an invalid fraction.
+        """
+        # Asserts
+        with self.assertRaises(ValueError):
+            sample_keys(self.keys, fraction=0)
+        with self.assertRaises(ValueError):
+            sample_keys(self.keys, fraction=1.5)
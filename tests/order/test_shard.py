@@ -0,0 +1,53 @@
+"""
+Test Module for shard
+-------------------------------------------
+Test cases for shard module.
+"""
+
+from unittest import TestCase
+
+from src.ds_stoa.order import shard
+
+
+class TestShard(TestCase):
+    def setUp(self) -> None:
+        """
+        Setup for the test cases.
+        """
+        self.keys = [f"{i}.snappy.parquet" for i in range(50)]
+
+    def test_partition(self) -> None:
+        """
+        Test case for partitioning keys without sizes.
+        """
+        # Exercise
+        shards = [shard(self.keys, i, 4) for i in range(4)]
+
+        # Asserts
+        self.assertEqual(sorted(sum(shards, [])), sorted(self.keys))
+        self.assertEqual(shards[2], shard(list(reversed(self.keys)), 2, 4)[::-1])
+        for keys in shards:
+            self.assertEqual(keys, [key for key in self.keys if key in keys])
+
+    def test_balanced_by_size(self) -> None:
+        """
+        Test case for partitioning keys by size.
+        """
+        # Setup
+        sizes = {"a": 100, "b": 60, "c": 50, "d": 40, "e": 10}
+
+        # Exercise
+        shards = [shard(list(sizes), i, 2, sizes=sizes) for i in range(2)]
+
+        # Asserts
+        self.assertEqual(shards, [["a", "d"], ["b", "c", "e"]])
+
+    def test_invalid_shard(self) -> None:
+        """
+        Test case for invalid shard parameters.
+        """
+        # Exercise & Asserts
+        with self.assertRaises(ValueError):
+            shard(self.keys, 0, 0)
+        with self.assertRaises(ValueError):
+            shard(self.keys, 4, 4)
@@ -0,0 +1,105 @@
+"""
+Test Module for Plan
+-------------------------------------------
+Test cases for the plan module.
+"""
+
+from datetime import timedelta
+from unittest import TestCase, mock
+
+import pandas as pd
+
+from src.ds_stoa.plan import FetchPlan, execute, url_expiry
+
+
+class TestPlan(TestCase):
+    def setUp(self) -> None:
+        self.signatures = {
+            "1234": "https://bucket/1234?X-Amz-Date=20240601T120000Z&X-Amz-Expires=3600",
+            "5678": "https://bucket/5678?Expires=1717243200",
+            "9012": "https://bucket/9012",
+        }
+        self.plan = FetchPlan.from_signatures(
+            self.signatures, sizes={"1234": 10}, row_groups={"5678": [0, 2]}
+        )
+
+    def test_url_expiry(self) -> None:
+        """
+        Test case for the url_expiry function.
+        """
+        # Exercise & Asserts
+        self.assertEqual(
+            url_expiry(self.signatures["1234"]), "2024-06-01T13:00:00+00:00"
+        )
+        self.assertEqual(
+            url_expiry(self.signatures["5678"]), "2024-06-01T12:00:00+00:00"
+        )
+        self.assertIsNone(url_expiry(self.signatures["9012"]))
+
+    def test_serialisation(self) -> None:
+        """
+        Test case for serialising a plan to JSON and back.
+        """
+        # Exercise
+        plan = FetchPlan.from_json(self.plan.to_json())
+
+        # Asserts
+        self.assertEqual(plan, self.plan)
+        self.assertEqual(plan.pre_signed_urls, self.signatures)
+        self.assertEqual(plan.sizes, {"1234": 10})
+        self.assertEqual(plan.row_groups, {"5678": [0, 2]})
+        self.assertEqual(plan.expired(margin=timedelta(days=1)), ["1234", "5678"])
+
+    def test_shard(self) -> None:
+        """
+        Test case for slicing a plan between workers.
+        """
+        # Exercise
+        shards = [self.plan.shard(index, 2) for index in range(2)]
+
+        # Asserts
+        keys = [entry.key for plan in shards for entry in plan.entries]
+        self.assertEqual(sorted(keys), sorted(self.signatures))
+
+    @mock.patch("src.ds_stoa.plan._plan.fetch")
+    def test_execute(self, _fetch) -> None:
+        """
+        Test case for the execute function.
+        """
+        # Setup
+        _fetch.return_value = pd.DataFrame({"column": [1]})
+
+        # Exercise
+        dataframe = execute(self.plan)
+
+        # Asserts
+        self.assertEqual(len(dataframe), 1)
+        _fetch.assert_called_once_with(
+            pre_signed_urls=self.signatures,
+            sizes={"1234": 10},
+            hedge=None,
+            host_cache=None,
+            filters=None,
+            dtype_backend=None,
+            read_dictionary=None,
+            categorical=False,
+            optimize_memory=False,
+            sort_by=None,
+            row_groups={"5678": [0, 2]},
+        )
+
+    @mock.patch("src.ds_stoa.plan._plan.discover_sizes")
+    def test_discover_sizes(self, _discover_sizes) -> None:
+        """
+        Test case for discovering the sizes of a plan.
+        """
+        # Setup
+        _discover_sizes.return_value = {"5678": 20}
+
+        # Exercise
+        self.plan.discover_sizes()
+
+        # Asserts
+        self.assertEqual(self.plan.sizes, {"1234": 10, "5678": 20})
+        (unknown,), _ = _discover_sizes.call_args
+        self.assertEqual(sorted(unknown), ["5678", "9012"])
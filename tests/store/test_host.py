@@ -0,0 +1,219 @@
+"""
+Test Module for HostCache
+-------------------------------------------
+Test cases for the host cache module.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, mock
+
+from src.ds_stoa.store import HostCache
+
+
+class TestHostCache(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    @staticmethod
+    def _download(url: str, destination: str) -> str:
+        time.sleep(0.05)
+        with open(destination, "wb") as file:
+            file.write(url.encode())
+        return destination
+
+    @mock.patch("src.ds_stoa.store._host.download")
+    def test_coalesce(self, _download) -> None:
+        """
+        Test case for concurrent requests of one object sharing a download.
+        """
+        # Setup
+        _download.side_effect = self._download
+        cache = HostCache(self.directory, poll_interval=0.01)
+        barrier = threading.Barrier(8)
+
+        def _get(index):
+            barrier.wait()
+            return HostCache(self.directory, poll_interval=0.01).get(
+                "2024/a.parquet", "http://a"
+            )
+
+        # Exercise
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = list(executor.map(_get, range(8)))
+
+        # Asserts
+        _download.assert_called_once()
+        self.assertEqual(set(paths), {cache.path("2024/a.parquet")})
+        self.assertFalse(os.path.exists(f"{paths[0]}.lock"))
+        self.assertEqual(cache.open("2024/a.parquet", "http://a").read(), b"http://a")
+
+    @mock.patch("src.ds_stoa.store._host.download")
+    def test_stale_lock(self, _download) -> None:
+        """
+        Test case for taking over a lock abandoned by a dead process.
+        """
+        # Setup
+        _download.side_effect = self._download
+        cache = HostCache(self.directory, stale_after=60.0, poll_interval=0.01)
+        lock = f"{cache.path('a.parquet')}.lock"
+        os.makedirs(os.path.dirname(lock), exist_ok=True)
+        with open(lock, "w") as file:
+            file.write("0")
+        os.utime(lock, (time.time() - 120, time.time() - 120))
+
+        # Exercise
+        path = cache.get("a.parquet", "http://a")
+
+        # Asserts
+        _download.assert_called_once_with("http://a", path)
+        self.assertFalse(os.path.exists(lock))
+
+    @mock.patch("src.ds_stoa.store._host.download")
+    def test_failed_download(self, _download) -> None:
+        """
+        Test case for releasing the lock when a download fails.
+        """
+        # Setup
+        _download.side_effect = ValueError("boom")
+        cache = HostCache(self.directory)
+
+        # Exercise & Asserts
+        with self.assertRaises(ValueError):
+            cache.get("a.parquet", "http://a")
+        self.assertFalse(os.path.exists(f"{cache.path('a.parquet')}.lock"))
+
+    @mock.patch("src.ds_stoa.store._host.download")
+    def test_long_download(self, _download) -> None:
+        """
+        Test case for keeping the lock of a download longer than the stale timeout.
+        """
+
+        # Setup
+        def _slow(url, destination):
+            time.sleep(0.6)
+            return self._download(url, destination)
+
+        _download.side_effect = _slow
+        barrier = threading.Barrier(4)
+
+        def _get(index):
+            barrier.wait()
+            time.sleep(0.05 * index)
+            return HostCache(self.directory, stale_after=0.3, poll_interval=0.01).get(
+                "a.parquet", "http://a"
+            )
+
+        # Exercise
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            paths = list(executor.map(_get, range(4)))
+
+        # Asserts
+        _download.assert_called_once()
+        self.assertEqual(len(set(paths)), 1)
+        self.assertFalse(os.path.exists(f"{paths[0]}.lock"))
+
+    @mock.patch("src.ds_stoa.store._host.download")
+    def test_release_taken_over_lock(self, _download) -> None:
+        """
+        Test case for leaving a lock alone once another process took it over.
+        """
+        # Setup
+        cache = HostCache(self.directory)
+        lock = f"{cache.path('a.parquet')}.lock"
+
+        def _taken_over(url, destination):
+            with open(lock, "w") as file:
+                file.write("0")
+            return self._download(url, destination)
+
+        _download.side_effect = _taken_over
+
+        # Exercise
+        cache.get("a.parquet", "http://a")
+
+        # Asserts
+        with open(lock) as file:
+            self.assertEqual(file.read(), "0")
+
+    @mock.patch("src.ds_stoa.store._host.download")
+    def test_stale_lock_takeover_race(self, _download) -> None:
+        """
+        Test case for several processes taking over one stale lock.
+        """
+        # Setup
+        _download.side_effect = self._download
+        lock = f"{HostCache(self.directory).path('a.parquet')}.lock"
+        os.makedirs(os.path.dirname(lock), exist_ok=True)
+        with open(lock, "w") as file:
+            file.write("0")
+        os.utime(lock, (time.time() - 120, time.time() - 120))
+        barrier = threading.Barrier(8)
+
+        def _get(index):
+            barrier.wait()
+            return HostCache(self.directory, stale_after=60.0, poll_interval=0.01).get(
+                "a.parquet", "http://a"
+            )
+
+        # Exercise
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = list(executor.map(_get, range(8)))
+
+        # Asserts
+        _download.assert_called_once()
+        self.assertEqual(len(set(paths)), 1)
+        self.assertEqual(os.listdir(os.path.dirname(lock)), ["a.parquet"])
+
+    def test_remove_replaced_stale_lock(self) -> None:
+        """
+        Test case for keeping a stale lock that was replaced before its removal.
+        """
+        # Setup
+        cache = HostCache(self.directory, stale_after=60.0)
+        lock = f"{cache.path('a.parquet')}.lock"
+        os.makedirs(os.path.dirname(lock), exist_ok=True)
+        with open(lock, "w") as file:
+            file.write("0")
+        os.utime(lock, (time.time() - 120, time.time() - 120))
+        stale = os.stat(lock)
+        os.utime(lock)
+
+        # Exercise
+        cache._remove_stale(lock, stale)
+
+        # Asserts
+        with open(lock) as file:
+            self.assertEqual(file.read(), "0")
+        self.assertEqual(os.listdir(os.path.dirname(lock)), ["a.parquet.lock"])
+
+    @mock.patch("src.ds_stoa.store._host.download")
+    def test_evict(self, _download) -> None:
+        """
+        Test case for evicting the least recently used objects over the size cap.
+        """
+        # Setup
+        _download.side_effect = self._download
+        cache = HostCache(self.directory, max_bytes=20)
+        cache.get("a.parquet", "http://a")
+        cache.get("b.parquet", "http://b")
+        os.utime(cache.path("a.parquet"), (time.time() - 60, time.time() - 60))
+        os.utime(cache.path("b.parquet"), (time.time() - 30, time.time() - 30))
+        cache.get("a.parquet", "http://a")
+
+        # Exercise
+        cache.get("c.parquet", "http://c")
+
+        # Asserts
+        self.assertTrue(os.path.exists(cache.path("a.parquet")))
+        self.assertFalse(os.path.exists(cache.path("b.parquet")))
+        self.assertTrue(os.path.exists(cache.path("c.parquet")))
+        self.assertEqual(_download.call_count, 3)
+        self.assertEqual(HostCache(self.directory).evict(), 0)
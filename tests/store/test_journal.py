@@ -0,0 +1,58 @@
+"""
+Test Module for Journal
+-------------------------------------------
+Test cases for the journal module.
+"""
+
+import os
+import tempfile
+from unittest import TestCase
+
+from src.ds_stoa.store import Journal
+
+
+class TestJournal(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _touch(self, journal: Journal, key: str) -> str:
+        os.makedirs(journal.objects_directory, exist_ok=True)
+        path = os.path.join(journal.objects_directory, key)
+        with open(path, "wb") as file:
+            file.write(b"data")
+        return path
+
+    def test_resume(self) -> None:
+        """
+        Test case for resuming a job from its journal.
+        """
+        # Setup
+        journal = Journal(self.directory, "job")
+        journal.record("a", self._touch(journal, "a"))
+
+        # Exercise
+        resumed = Journal(self.directory, "job")
+
+        # Asserts
+        self.assertEqual(resumed.remaining(["a", "b"]), ["b"])
+        self.assertEqual(Journal(self.directory, "other").remaining(["a"]), ["a"])
+
+    def test_truncated_entry(self) -> None:
+        """
+        Test case for a journal with a truncated last entry.
+        """
+        # Setup
+        journal = Journal(self.directory, "job")
+        journal.record("a", self._touch(journal, "a"))
+        with open(journal.path, "a", encoding="utf-8") as file:
+            file.write('{"key": "b", "pa')
+
+        # Exercise
+        resumed = Journal(self.directory, "job")
+
+        # Asserts
+        self.assertEqual(list(resumed.completed), ["a"])
@@ -0,0 +1,71 @@
+"""
+Test Module for Manifest
+-------------------------------------------
+Test cases for the manifest module.
+"""
+
+import os
+import tempfile
+from unittest import TestCase
+
+from src.ds_stoa.store import Manifest
+
+
+class TestManifest(TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def _touch(self, path: str) -> str:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(b"data")
+        return path
+
+    def test_new_keys(self) -> None:
+        """
+        Test case for the new_keys method.
+        """
+        # Setup
+        manifest = Manifest(self.directory)
+        manifest.add("a", self._touch(manifest.object_path("a")))
+
+        # Exercise
+        new_keys = manifest.new_keys(["c", "a", "b"])
+
+        # Asserts
+        self.assertEqual(new_keys, ["c", "b"])
+
+    def test_save_and_load(self) -> None:
+        """
+        Test case for persisting the manifest.
+        """
+        # Setup
+        manifest = Manifest(self.directory)
+        path = self._touch(manifest.object_path("dir/a.parquet"))
+        manifest.add("dir/a.parquet", path)
+
+        # Exercise
+        manifest.save()
+        reloaded = Manifest(self.directory)
+
+        # Asserts
+        self.assertEqual(reloaded.files, {"dir/a.parquet": path})
+        self.assertEqual(reloaded.updated_at, manifest.updated_at)
+
+    def test_missing_file(self) -> None:
+        """
+        Test case for a recorded object whose file has been removed.
+        """
+        # Setup
+        manifest = Manifest(self.directory)
+        path = self._touch(manifest.object_path("a"))
+        manifest.add("a", path)
+        os.remove(path)
+
+        # Exercise & Asserts
+        self.assertEqual(manifest.files, {})
+        self.assertEqual(manifest.new_keys(["a"]), ["a"])
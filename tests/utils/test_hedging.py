@@ -0,0 +1,109 @@
+"""
+Test Module for Hedging
+-------------------------------------------
+Test cases for the hedging policy.
+"""
+
+import threading
+import time
+from unittest import TestCase
+
+from src.ds_stoa.utils.hedging import HedgePolicy, on_cancel
+
+
+class TestHedgePolicy(TestCase):
+    def test_delay(self) -> None:
+        """
+        Test case for the percentile based delay.
+        """
+        # Setup
+        policy = HedgePolicy(percentile=90, initial_delay=2.0, min_samples=10)
+
+        # Exercise & Asserts
+        self.assertEqual(policy.delay(), 2.0)
+        for latency in range(1, 11):
+            policy.record(latency / 100)
+        self.assertAlmostEqual(policy.delay(), 0.09)
+
+    def test_hedged_call(self) -> None:
+        """
+        Test case for a slow request that is hedged.
+        """
+        # Setup
+        policy = HedgePolicy(budget=1.0, initial_delay=0.05)
+        calls = []
+        release = threading.Event()
+
+        def _request(value):
+            calls.append(threading.current_thread())
+            if len(calls) == 1:
+                on_cancel(release.set)
+                release.wait(5)
+                return "slow"
+            return "fast"
+
+        # Exercise
+        start = time.monotonic()
+        result = policy.call(_request, "key")
+        elapsed = time.monotonic() - start
+
+        # Asserts
+        self.assertEqual(result, "fast")
+        self.assertEqual(policy.hedges, 1)
+        self.assertIs(calls[0], threading.current_thread())
+        self.assertIsNot(calls[1], threading.current_thread())
+        self.assertLess(elapsed, 1)
+
+    def test_cancel_hedge(self) -> None:
+        """
+        Test case for a hedge that loses to the first attempt.
+        """
+        # Setup
+        policy = HedgePolicy(budget=1.0, initial_delay=0.05)
+        cancelled = threading.Event()
+        calls = []
+
+        def _request():
+            calls.append(threading.current_thread())
+            if len(calls) == 1:
+                time.sleep(0.2)
+                return "first"
+            on_cancel(cancelled.set)
+            cancelled.wait(5)
+            return "hedge"
+
+        # Exercise
+        result = policy.call(_request)
+
+        # Asserts
+        self.assertEqual(result, "first")
+        self.assertEqual(policy.hedges, 1)
+        self.assertTrue(cancelled.wait(1))
+
+    def test_budget(self) -> None:
+        """
+        Test case for the hedging budget.
+        """
+        # Setup
+        policy = HedgePolicy(budget=0.0, initial_delay=0.01)
+
+        # Exercise
+        result = policy.call(lambda: time.sleep(0.05) or "done")
+
+        # Asserts
+        self.assertEqual(result, "done")
+        self.assertEqual(policy.hedges, 0)
+
+    def test_failure(self) -> None:
+        """
+        Test case for a request whose attempts all fail.
+        """
+        # Setup
+        policy = HedgePolicy()
+
+        def _request():
+            raise ValueError("failed")
+
+        # Exercise & Asserts
+        with self.assertRaises(ValueError):
+            policy.call(_request)
@@ -0,0 +1,138 @@
+"""
+Test Module for Rate Limiting
+-------------------------------------------
+Test cases for the rate limiter and the rate limiting decorator.
+"""
+
+import time
+from unittest import TestCase, mock
+
+from requests import HTTPError, Response
+
+from src.ds_stoa.utils.decorators import rate_limited
+from src.ds_stoa.utils.decorators.rate_limit import retry_after
+from src.ds_stoa.utils.ratelimit import (
+    BANDWIDTH,
+    RATE_LIMITER,
+    RateLimiter,
+    TokenBucket,
+    read_content,
+)
+
+
+class TestRateLimit(TestCase):
+    def tearDown(self) -> None:
+        RATE_LIMITER.configure("sign", rate=None)
+
+    def test_token_bucket(self) -> None:
+        """
+        Test case for pacing acquisitions with a token bucket.
+        """
+        # Setup
+        bucket = TokenBucket(rate=100, capacity=1)
+
+        # Exercise
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # Asserts
+        self.assertGreaterEqual(elapsed, 0.04)
+
+    def test_pause(self) -> None:
+        """
+        Test case for pausing an unlimited bucket.
+        """
+        # Setup
+        limiter = RateLimiter()
+        limiter.pause("sign", 0.05)
+
+        # Exercise
+        start = time.monotonic()
+        limiter.acquire("sign")
+        limiter.acquire("order")
+
+        # Asserts
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        with self.assertRaises(ValueError):
+            limiter.acquire("unknown")
+
+    def test_retry_after(self) -> None:
+        """
+        Test case for reading the Retry-After header.
+        """
+        # Setup
+        response = Response()
+
+        # Exercise & Asserts
+        self.assertEqual(retry_after(response, default=2.0), 2.0)
+        response.headers["Retry-After"] = "0.5"
+        self.assertEqual(retry_after(response), 0.5)
+        response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+        self.assertEqual(retry_after(response), 0.0)
+
+    @mock.patch("src.ds_stoa.utils.decorators.rate_limit.RATE_LIMITER")
+    def test_rate_limited(self, _limiter) -> None:
+        """
+        Test case for retrying throttled requests.
+        """
+        # Setup
+        response = Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = "3"
+        calls = []
+
+        @rate_limited("sign", max_retries=1)
+        def _request():
+            calls.append(1)
+            if len(calls) == 1:
+                raise HTTPError(response=response)
+            return "ok"
+
+        # Exercise
+        result = _request()
+
+        # Asserts
+        self.assertEqual(result, "ok")
+        self.assertEqual(_limiter.acquire.call_count, 2)
+        _limiter.pause.assert_called_once_with("sign", 3.0)
+
+    @mock.patch("src.ds_stoa.utils.decorators.rate_limit.RATE_LIMITER")
+    def test_rate_limited_exhausted(self, _limiter) -> None:
+        """
+        Test case for throttled requests that exhaust their retries.
+        """
+        # Setup
+        response = Response()
+        response.status_code = 429
+
+        @rate_limited("sign", max_retries=2)
+        def _request():
+            raise HTTPError(response=response)
+
+        # Exercise & Asserts
+        with self.assertRaises(HTTPError):
+            _request()
+        self.assertEqual(_limiter.acquire.call_count, 3)
+
+    def test_bandwidth(self) -> None:
+        """
+        Test case for capping the bandwidth of streamed responses.
+        """
+        # Setup
+        response = mock.Mock()
+        response.iter_content.return_value = [b"x" * 100] * 6
+
+        # Exercise
+        BANDWIDTH.configure(rate=10_000, capacity=100)
+        try:
+            start = time.monotonic()
+            content = read_content(response)
+            elapsed = time.monotonic() - start
+        finally:
+            BANDWIDTH.configure(rate=None)
+
+        # Asserts
+        self.assertEqual(content, b"x" * 600)
+        self.assertGreaterEqual(elapsed, 0.04)